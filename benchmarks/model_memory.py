@@ -0,0 +1,104 @@
+"""
+Measures the memory held by the models built for a synthetic collection.
+
+    python model_memory.py --requests 5000 --examples 3 --headers 24 -o memory.json
+
+Reports the memory retained by DocumentGenerator.add_items (traced with tracemalloc) and the size of the model
+objects themselves (the instances and their attribute dictionaries, without the strings they refer to). Models
+shared by several requests (see ContentInterner, and --shared) are counted once.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'postman_doc_gen'))
+
+from content_interner import ContentInterner
+from document_generator import DocumentGenerator
+from models import APIModel, APIExampleModel, KeyValueModel, APIBodyModel, RunContext
+from synthetic_collection import SyntheticCollection, SyntheticConfig, add_config_arguments, build_config
+
+MODEL_CLASSES = [APIModel, APIExampleModel, KeyValueModel, APIBodyModel]
+
+
+def object_size(o) -> int:
+    """
+    :param o: a model instance
+    :return: the size of the instance and of its attribute dictionary, if it has one
+    """
+    size = sys.getsizeof(o)
+    if hasattr(o, '__dict__'):
+        size = size + sys.getsizeof(o.__dict__)
+    return size
+
+
+def model_objects(api_info: list):
+    seen = set()
+    for api in api_info:
+        objects = [api] + api.examples
+        if api.body is not None:
+            objects = objects + [api.body] + (api.body.key_values or [])
+        for key_values in [api.headers, api.params, api.path_variables]:
+            objects = objects + (key_values or [])
+        for o in objects:
+            if id(o) not in seen:
+                seen.add(id(o))
+                yield o
+
+
+def measure(config: SyntheticConfig) -> dict:
+    """
+    :param config: the shape of the synthetic collection
+    :return: the retained memory and the model sizes, in bytes
+    """
+    synthetic = SyntheticCollection(config)
+    collection = synthetic.collection()
+    env = synthetic.environment()
+
+    generator = DocumentGenerator()
+    generator.context = RunContext()
+    generator.env_file = env
+    generator.interner = ContentInterner(generator.options.intern_cache_size)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        generator.add_items(generator.side_tree, collection)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    counts = {model_class.__name__: 0 for model_class in MODEL_CLASSES}
+    sizes = {model_class.__name__: 0 for model_class in MODEL_CLASSES}
+    for o in model_objects(generator.api_info):
+        counts[type(o).__name__] = counts[type(o).__name__] + 1
+        sizes[type(o).__name__] = sizes[type(o).__name__] + object_size(o)
+
+    return {
+        'config': dict(vars(config)),
+        'retained_bytes': retained,
+        'model_bytes': sum(sizes.values()),
+        'models': {name: {'count': counts[name], 'bytes': sizes[name]} for name in counts}
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measures the memory held by the models of a synthetic collection')
+    parser.add_argument('-o', '--out', help='The json file the results are written to')
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    results = measure(build_config(args))
+    if args.out is not None:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+    print('retained by add_items: {:.1f} MB'.format(results['retained_bytes'] / (1024 * 1024)))
+    print('model objects:         {:.1f} MB'.format(results['model_bytes'] / (1024 * 1024)))
+    for name, model in results['models'].items():
+        print('  {:<18}{:>9} objects {:>9.1f} MB'.format(name, model['count'], model['bytes'] / (1024 * 1024)))
@@ -0,0 +1,220 @@
+"""
+Times every stage of the documentation pipeline on a synthetic collection and writes the results as json.
+
+    python run_benchmarks.py --requests 2000 --examples 3 -o results.json
+    python run_benchmarks.py --requests 2000 --examples 3 --compare results.json
+
+Each stage is run --repeat times on the same input, the json holds the min, median and mean wall time of every
+stage, together with the commit, the python version and the synthetic collection options, so the results of two
+commits can be compared with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'postman_doc_gen'))
+
+import bleach
+
+from constants import VERSION, TEMPLATES_DIR, RESPONSE, REQUEST, DESCRIPTION, BODY, RAW
+from document_generator import DocumentGenerator
+from models import GeneratorOptions, RunContext
+from sanitizer import escape_code
+from synthetic_collection import SyntheticCollection, SyntheticConfig, add_config_arguments, build_config
+
+STAGES = ['validate_collection', 'add_items', 'markdown_to_html', 'apply_env_values', 'bleach_clean', 'escape_code',
+          'render']
+
+
+def collection_requests(node) -> list:
+    """
+    :param node: a collection or a folder
+    :return: the request items of the node and its sub folders
+    """
+    requests = []
+    for item in node['item']:
+        if item.get('item') is not None:
+            requests.extend(collection_requests(item))
+        else:
+            requests.append(item)
+    return requests
+
+
+def commit_hash() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT, stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class PipelineBenchmark:
+    """
+    Runs the stages of the pipeline on their own. The stages mirror what DocumentGenerator does for every request,
+    the markdown cache is disabled so every run converts the descriptions again.
+    """
+
+    def __init__(self, config: SyntheticConfig, work_dir: str):
+        super().__init__()
+        synthetic = SyntheticCollection(config)
+        self.collection = synthetic.collection()
+        self.env = synthetic.environment()
+        self.requests = collection_requests(self.collection)
+        self.work_dir = work_dir
+        self.collection_file = os.path.join(work_dir, 'collection.json')
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            json.dump(self.collection, f)
+
+        self.descriptions = [item[REQUEST][DESCRIPTION] for item in self.requests
+                             if item[REQUEST].get(DESCRIPTION) is not None]
+        self.bodies = [item[REQUEST][BODY][RAW] for item in self.requests if item[REQUEST].get(BODY) is not None]
+        for item in self.requests:
+            for response in item.get(RESPONSE, []):
+                self.bodies.append(response[BODY])
+        self.generator = DocumentGenerator(GeneratorOptions(markdown_cache_size=0))
+        self.templates_dir = os.path.join(ROOT, 'postman_doc_gen', TEMPLATES_DIR)
+
+    def validate_collection(self):
+        DocumentGenerator.validate_collection(self.collection_file)
+
+    def add_items(self):
+        self.generator.context = RunContext()
+        self.generator.env_file = self.env
+        self.generator.add_items(self.generator.side_tree, self.collection)
+
+    def markdown_to_html(self):
+        converter = self.generator.markdown_converter
+        for description in self.descriptions:
+            converter.convert(description)
+
+    def apply_env_values(self):
+        for item in self.requests:
+            DocumentGenerator.apply_env_values(item.get(RESPONSE, []), self.env)
+
+    def bleach_clean(self):
+        for body in self.bodies:
+            bleach.clean(body)
+
+    def escape_code(self):
+        for body in self.bodies:
+            escape_code(body)
+
+    def render(self):
+        if len(self.generator.api_info) == 0:
+            self.add_items()
+        template = DocumentGenerator.get_template(self.templates_dir)
+        DocumentGenerator.write_template(template, os.path.join(self.work_dir, 'index.html'),
+                                         download_enabled=False, collection=self.collection['info'],
+                                         side_tree=self.generator.side_tree_json, api_info=self.generator.api_info,
+                                         shards=[])
+
+    def counts(self) -> dict:
+        return {
+            'requests': len(self.requests),
+            'descriptions': len(self.descriptions),
+            'bodies': len(self.bodies),
+            'collection_bytes': os.path.getsize(self.collection_file)
+        }
+
+
+def time_stage(function, repeat: int) -> dict:
+    """
+    :param function: the stage
+    :param repeat: the number of runs
+    :return: the wall times of the runs, in seconds
+    """
+    # the first run loads what the stage needs (e.g. compiles the validator), it is not part of the results
+    function()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'runs': times
+    }
+
+
+def run_benchmarks(config: SyntheticConfig, repeat: int = 3, stages: list = None) -> dict:
+    """
+    :param config: the shape of the synthetic collection
+    :param repeat: [Optional] the number of timed runs of every stage
+    :param stages: [Optional] the stages to run, defaults to all
+    :return: the results, see the module docstring
+    """
+    work_dir = tempfile.mkdtemp()
+    try:
+        benchmark = PipelineBenchmark(config, work_dir)
+        results = {
+            'version': VERSION,
+            'commit': commit_hash(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'config': dict(vars(config)),
+            'counts': benchmark.counts(),
+            'stages': {}
+        }
+        for stage in stages if stages is not None else STAGES:
+            results['stages'][stage] = time_stage(getattr(benchmark, stage), repeat)
+        return results
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> tuple:
+    """
+    :param baseline: the results of an earlier run
+    :param results: the current results
+    :param threshold: the ratio of the medians above which a stage is reported as a regression
+    :return: the lines of the comparison table and the stages that regressed
+    """
+    lines = ['{:<22}{:>12}{:>12}{:>9}'.format('stage', 'baseline', 'current', 'ratio')]
+    regressions = []
+    for stage, timing in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if previous is None:
+            lines.append('{:<22}{:>12}{:>11.4f}s{:>9}'.format(stage, '-', timing['median'], '-'))
+            continue
+        ratio = timing['median'] / previous['median'] if previous['median'] > 0 else float('inf')
+        if ratio > threshold:
+            regressions.append(stage)
+        lines.append('{:<22}{:>11.4f}s{:>11.4f}s{:>8.2f}x{}'.format(stage, previous['median'], timing['median'], ratio,
+                                                                    '  REGRESSION' if ratio > threshold else ''))
+    return lines, regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the stages of the documentation pipeline')
+    parser.add_argument('-o', '--out', help='The json file the results are written to')
+    parser.add_argument('-r', '--repeat', help='The number of timed runs of every stage', type=int, default=3)
+    parser.add_argument('-s', '--stage', help='The stages to run, defaults to all', choices=STAGES, action='append')
+    parser.add_argument('--compare', help='The results of an earlier run to compare with')
+    parser.add_argument('--threshold', help='The ratio of the medians reported as a regression by --compare',
+                        type=float, default=1.2)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    results = run_benchmarks(build_config(args), args.repeat, args.stage)
+    if args.out is not None:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+    if args.compare is not None:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            lines, regressions = compare(json.load(f), results, args.threshold)
+        print('\n'.join(lines))
+        sys.exit(1 if len(regressions) > 0 else 0)
+
+    for stage, timing in results['stages'].items():
+        print('{:<22}{:>11.4f}s'.format(stage, timing['median']))
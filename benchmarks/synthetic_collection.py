@@ -0,0 +1,218 @@
+"""
+Generates synthetic Postman 2.1 collections and environments of a given shape, for the benchmarks.
+
+    python synthetic_collection.py -o collection.json --env-out environment.json --requests 5000 --depth 3
+"""
+import argparse
+import json
+import random
+
+SCHEMA_URL = 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'
+METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+WORDS = ['account', 'order', 'item', 'customer', 'invoice', 'payment', 'shipment', 'product', 'review', 'search',
+         'status', 'token', 'session', 'report', 'export', 'import', 'batch', 'event', 'webhook', 'user']
+
+
+class SyntheticConfig:
+    requests: int = 100
+    depth: int = 2
+    fan_out: int = 4
+    examples: int = 2
+    body_size: int = 512
+    description_length: int = 256
+    env_size: int = 20
+    headers: int = 4
+    query_params: int = 3
+    shared: int = 0
+    seed: int = 0
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        for key, value in kwargs.items():
+            if not hasattr(self, key):
+                raise TypeError('Unknown synthetic collection option: ' + key)
+            setattr(self, key, value)
+
+    def toJSON(self):
+        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+
+
+class SyntheticCollection:
+    """
+    Builds a collection of config.requests requests, spread over a tree of folders config.depth levels deep with
+    config.fan_out sub folders per folder. The bodies and urls use the variables of the synthetic environment, the
+    bodies contain html to sanitize and the descriptions are markdown. With config.shared, the requests pick their
+    headers from config.shared header sets and get an error example picked from config.shared error responses, like
+    collections repeating the same 401/500 responses. The same config always gives the same collection.
+    """
+
+    def __init__(self, config: SyntheticConfig = None):
+        super().__init__()
+        self.config = config if config is not None else SyntheticConfig()
+        self.random = random.Random(self.config.seed)
+        self.request_count = 0
+        self.shared_headers = [self.key_values(self.config.headers) for _ in range(self.config.shared)]
+        self.shared_errors = [self.body() for _ in range(self.config.shared)]
+
+    def variable(self) -> str:
+        if self.config.env_size <= 0:
+            return 'value'
+        return '{{VAR_' + str(self.random.randrange(self.config.env_size)) + '}}'
+
+    def words(self, count: int) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(count))
+
+    def description(self) -> str:
+        length = self.config.description_length
+        if length <= 0:
+            return None
+        parts = ['## ' + self.words(3).title(), '',
+                 'Returns the **' + self.words(1) + '** of the `' + self.words(1) + '` with a [link](https://example.com).',
+                 '', '| name | type |', '| --- | --- |', '| id | int |', '',
+                 '- ' + self.words(4), '- ' + self.words(4), '', '```json', '{"id": 1}', '```', '']
+        text = '\n'.join(parts)
+        while len(text) < length:
+            text = text + self.words(12) + '.\n'
+        return text[:length]
+
+    def body(self) -> str:
+        size = self.config.body_size
+        fields = []
+        text = ''
+        while len(text) < size:
+            value = self.random.choice([
+                '"' + self.variable() + '"',
+                str(self.random.randrange(100000)),
+                '"<b>' + self.words(2) + '</b>"',
+                '"' + self.words(3) + '"'
+            ])
+            fields.append('\t"' + self.words(1) + '_' + str(len(fields)) + '": ' + value)
+            text = '{\n' + ',\n'.join(fields) + '\n}'
+        return text
+
+    def key_values(self, count: int) -> list:
+        return [{'key': self.words(1) + '_' + str(i), 'value': self.variable(), 'description': self.words(5)}
+                for i in range(count)]
+
+    def url(self) -> dict:
+        path = [self.words(1) for _ in range(3)]
+        query = self.key_values(self.config.query_params)
+        raw = '{{HOST}}/' + '/'.join(path)
+        if len(query) > 0:
+            raw = raw + '?' + '&'.join(param['key'] + '=' + param['value'] for param in query)
+        url = {'raw': raw, 'host': ['{{HOST}}'], 'path': path}
+        if len(query) > 0:
+            url['query'] = query
+        return url
+
+    def request(self) -> dict:
+        self.request_count = self.request_count + 1
+        method = self.random.choice(METHODS)
+        request = {
+            'method': method,
+            'header': self.random.choice(self.shared_headers) if self.config.shared > 0
+            else self.key_values(self.config.headers),
+            'url': self.url()
+        }
+        if method != 'GET':
+            request['body'] = {'mode': 'raw', 'raw': self.body(), 'options': {'raw': {'language': 'json'}}}
+        description = self.description()
+        if description is not None:
+            request['description'] = description
+
+        responses = []
+        for i in range(self.config.examples):
+            original_request = {'method': method, 'header': [], 'url': request['url']}
+            if 'body' in request:
+                original_request['body'] = {'mode': 'raw', 'raw': self.body()}
+            responses.append({
+                'name': 'Example ' + str(i + 1),
+                'originalRequest': original_request,
+                'status': 'OK',
+                'code': 200,
+                '_postman_previewlanguage': 'json',
+                'header': None,
+                'cookie': [],
+                'body': self.body()
+            })
+
+        if self.config.shared > 0:
+            responses.append({
+                'name': 'Error',
+                'originalRequest': {'method': method, 'header': [], 'url': request['url']},
+                'status': 'Internal Server Error',
+                'code': 500,
+                '_postman_previewlanguage': 'json',
+                'header': None,
+                'cookie': [],
+                'body': self.random.choice(self.shared_errors)
+            })
+
+        return {'name': self.words(2).title() + ' ' + str(self.request_count), 'request': request,
+                'response': responses}
+
+    def folders(self, depth: int, requests: int) -> list:
+        """
+        :param depth: the number of folder levels left
+        :param requests: the number of requests in the folder
+        :return: the items of the folder
+        """
+        if depth <= 0 or requests <= 1:
+            return [self.request() for _ in range(requests)]
+
+        items = []
+        fan_out = min(self.config.fan_out, requests)
+        for i in range(fan_out):
+            # the first folders get the remainder
+            count = requests // fan_out + (1 if i < requests % fan_out else 0)
+            items.append({'name': self.words(1).title() + ' folder ' + str(i + 1),
+                          'item': self.folders(depth - 1, count)})
+        return items
+
+    def collection(self) -> dict:
+        return {
+            'info': {
+                '_postman_id': '00000000-0000-4000-8000-' + str(self.config.seed).zfill(12),
+                'name': 'Synthetic Collection',
+                'description': self.description() or '',
+                'schema': SCHEMA_URL
+            },
+            'item': self.folders(self.config.depth, self.config.requests)
+        }
+
+    def environment(self) -> dict:
+        values = [{'key': 'HOST', 'value': 'https://synthetic.example.com', 'enabled': True}]
+        values.extend({'key': 'VAR_' + str(i), 'value': self.words(2) + ' "' + str(i) + '"', 'enabled': True}
+                      for i in range(self.config.env_size))
+        return {'id': '00000000-0000-4000-8000-000000000000', 'name': 'Synthetic-Env', 'values': values}
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """
+    Adds an argument for every option of SyntheticConfig
+    :param parser: the parser of the command
+    """
+    for key, value in vars(SyntheticConfig).items():
+        if not key.startswith('_') and isinstance(value, int):
+            parser.add_argument('--' + key.replace('_', '-'), type=int, default=value,
+                                help='Synthetic collection ' + key.replace('_', ' ') + ' (default: %(default)s)')
+
+
+def build_config(args) -> SyntheticConfig:
+    return SyntheticConfig(**{key: getattr(args, key) for key, value in vars(SyntheticConfig).items()
+                              if not key.startswith('_') and isinstance(value, int)})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates a synthetic Postman 2.1 collection')
+    parser.add_argument('-o', '--out', help='The collection json to write', required=True)
+    parser.add_argument('--env-out', help='The environment json to write')
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    synthetic = SyntheticCollection(build_config(args))
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(synthetic.collection(), f)
+    if args.env_out is not None:
+        with open(args.env_out, 'w', encoding='utf-8') as f:
+            json.dump(synthetic.environment(), f)
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import shutil
+import threading
+
+from constants import *
+from profiler import NullProfiler
+
+
+class AssetPipeline:
+    """
+    Publishes the static files of the templates. Only the files the page asks for through asset_url are copied,
+    a file already published with the same content is left untouched, and the names can carry a hash of the
+    content (e.g. css/main.3f9a1c2b.min.css) so they can be cached forever. Several documents can share one
+    assets directory.
+    """
+    # source path -> (mtime, size, hash), shared by the runs of the process
+    _source_hashes = {}
+    _lock = threading.Lock()
+
+    def __init__(self, templates_dir: str, output_dir: str, hashed: bool = False, assets_dir: str = None,
+                 assets_url: str = None, profiler=None):
+        """
+        :param templates_dir: the directory containing the templates and their static files
+        :param output_dir: the output directory of the page
+        :param hashed: [Optional] add a hash of the content to the file names
+        :param assets_dir: [Optional] the directory the files are published to, defaults to the output directory
+        :param assets_url: [Optional] the url of the assets directory used in the page, defaults to its path
+        relative to the output directory
+        :param profiler: [Optional] a Profiler recording the time spent publishing the files
+        """
+        super().__init__()
+        self.templates_dir = templates_dir
+        self.assets_dir = assets_dir if assets_dir is not None else output_dir
+        self.hashed = hashed
+        self.profiler = profiler if profiler is not None else NullProfiler()
+        if assets_url is None:
+            assets_url = os.path.relpath(os.path.abspath(self.assets_dir), os.path.abspath(output_dir))
+            assets_url = '' if assets_url == '.' else assets_url.replace(os.sep, '/')
+        self.assets_url = assets_url.rstrip('/')
+        self.urls = {}
+        self.published = []
+        self.copied = []
+        self.skipped = []
+
+    @staticmethod
+    def source_hash(file_name: str) -> str:
+        stat = os.stat(file_name)
+        with AssetPipeline._lock:
+            cached = AssetPipeline._source_hashes.get(file_name)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = AssetPipeline.file_hash(file_name)
+        with AssetPipeline._lock:
+            AssetPipeline._source_hashes[file_name] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    @staticmethod
+    def file_hash(file_name: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_name, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hashed_name(path: str, digest: str) -> str:
+        """
+        :param path: the path of the file, relative to the templates directory
+        :param digest: the hash of the file
+        :return: the path with the hash inserted after the base name, e.g. css/main.3f9a1c2b.min.css
+        """
+        directory, name = os.path.split(path)
+        base, dot, extensions = name.partition('.')
+        return os.path.join(directory, base + '.' + digest[:ASSET_HASH_LENGTH] + dot + extensions)
+
+    def asset_url(self, path: str) -> str:
+        """
+        Publishes a static file, used by the templates as asset_url('css/main.min.css')
+        :param path: the path of the file, relative to the templates directory
+        :return: the url of the published file
+        """
+        url = self.urls.get(path)
+        if url is None:
+            with self.profiler.stage(STAGE_ASSETS):
+                published = self.publish(path)
+            url = published.replace(os.sep, '/')
+            if self.assets_url != '':
+                url = self.assets_url + '/' + url
+            self.urls[path] = url
+        return url
+
+    def publish(self, path: str) -> str:
+        """
+        Copies the file to the assets directory, unless it is already there with the same content
+        :param path: the path of the file, relative to the templates directory
+        :return: the path of the published file, relative to the assets directory
+        """
+        source = os.path.join(self.templates_dir, path)
+        digest = AssetPipeline.source_hash(source)
+        published = AssetPipeline.hashed_name(path, digest) if self.hashed else os.path.normpath(path)
+        destination = os.path.join(self.assets_dir, published)
+        self.published.append(destination)
+
+        # a hashed name already tells the content of the file
+        if os.path.exists(destination) and (self.hashed or AssetPipeline.file_hash(destination) == digest):
+            self.skipped.append(destination)
+            return published
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        tmp_file = destination + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        shutil.copyfile(source, tmp_file)
+        os.replace(tmp_file, destination)
+        self.copied.append(destination)
+        return published
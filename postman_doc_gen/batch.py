@@ -0,0 +1,153 @@
+import glob
+import json
+import os
+import time
+
+from constants import *
+from document_generator import DocumentGenerator
+from models import BatchJobModel, GeneratorOptions
+
+
+def collection_name(file_name: str) -> str:
+    """
+    :param file_name: the postman collection file path
+    :return: the file name without its collection suffix, used as the name of the output directory
+    """
+    name = os.path.basename(file_name)
+    for suffix in COLLECTION_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def read_batch_manifest(manifest_file: str, out_dir: str) -> list:
+    """
+    Reads a batch manifest, a json list of objects with the collection and optionally the env and out paths.
+    Relative paths are resolved against the directory of the manifest.
+    :param manifest_file: the manifest json
+    :param out_dir: the directory containing the output directories of the entries without out
+    :return: list of BatchJobModel
+    """
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_file))
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError('The batch manifest should be a list of collections: ' + manifest_file)
+
+    jobs = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {BATCH_COLLECTION: entry}
+        if entry.get(BATCH_COLLECTION) is None:
+            raise ValueError('A batch manifest entry has no collection: ' + json.dumps(entry))
+
+        collection = os.path.join(manifest_dir, entry[BATCH_COLLECTION])
+        env = os.path.join(manifest_dir, entry[BATCH_ENV]) if entry.get(BATCH_ENV) is not None else None
+        out = os.path.join(manifest_dir, entry[BATCH_OUT]) if entry.get(BATCH_OUT) is not None \
+            else os.path.join(out_dir, collection_name(collection))
+        jobs.append(BatchJobModel(collection, env, out))
+    return jobs
+
+
+def read_batch_jobs(patterns: list = None, manifest_file: str = None, out_dir: str = None,
+                    env_file: str = None) -> list:
+    """
+    Collects the collections of a batch
+    :param patterns: [Optional] glob patterns matching collection files
+    :param manifest_file: [Optional] a batch manifest, see read_batch_manifest
+    :param out_dir: [Optional] defaults to the current directory, every collection is written to a sub directory
+    named after it
+    :param env_file: [Optional] postman environment json applied to the collections matched by the patterns
+    :return: list of BatchJobModel
+    """
+    out_dir = out_dir if out_dir is not None else os.getcwd()
+    jobs = []
+    if manifest_file is not None:
+        jobs.extend(read_batch_manifest(manifest_file, out_dir))
+    for pattern in patterns if patterns is not None else []:
+        file_names = sorted(glob.glob(pattern, recursive=True))
+        if len(file_names) == 0:
+            raise ValueError('No collection matches ' + pattern)
+        for file_name in file_names:
+            jobs.append(BatchJobModel(file_name, env_file, os.path.join(out_dir, collection_name(file_name))))
+
+    out_dirs = set()
+    for job in jobs:
+        out = os.path.abspath(job.out)
+        if out in out_dirs:
+            raise ValueError('Two collections of the batch are written to ' + out)
+        out_dirs.add(out)
+    return jobs
+
+
+def run_batch_job(generator: DocumentGenerator, job: BatchJobModel, download_enabled: bool = False) -> BatchJobModel:
+    """
+    Generates the documentation of a collection, recording the time taken or the error raised
+    :param generator: the DocumentGenerator shared by the jobs
+    :param job: the collection to generate
+    :param download_enabled: [Optional] enable the download links
+    :return: the job
+    """
+    start = time.perf_counter()
+    try:
+        generator.generate_doc(job.collection, job.env, job.out, download_enabled)
+        job.api_count = generator.api_id_counter
+    except Exception as e:
+        job.error = type(e).__name__ + ': ' + str(e)
+    job.seconds = time.perf_counter() - start
+    return job
+
+
+def run_batch(jobs: list, options: GeneratorOptions = None, download_enabled: bool = False,
+              workers: int = 1, profiler=None) -> list:
+    """
+    Generates the documentation of every collection of the batch. The generator, and with it the templates, the
+    schema validator and the markdown converter, is created once per process and reused for all the collections.
+    A failing collection does not stop the batch, its error is recorded on the job.
+    :param jobs: list of BatchJobModel
+    :param options: [Optional] the options used for every collection
+    :param download_enabled: [Optional] enable the download links
+    :param workers: [Optional] the number of processes the collections are spread across, 0 uses all cpus
+    :param profiler: [Optional] a Profiler recording the stages of all the collections, used with one process
+    :return: the jobs, in the same order
+    """
+    workers = workers if workers > 0 else os.cpu_count()
+    if workers == 1 or len(jobs) <= 1:
+        generator = DocumentGenerator(options, profiler)
+        return [run_batch_job(generator, job, download_enabled) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=init_batch_worker,
+                             initargs=(options, download_enabled)) as executor:
+        return list(executor.map(run_worker_job, jobs))
+
+
+def format_batch_summary(jobs: list) -> str:
+    """
+    :param jobs: list of BatchJobModel that were run
+    :return: a table with the time taken by every collection
+    """
+    lines = []
+    for job in jobs:
+        if job.error is not None:
+            lines.append('{:>9.2f}s  {:>8}  {}  {}'.format(job.seconds, 'FAILED', job.collection, job.error))
+        else:
+            lines.append('{:>9.2f}s  {:>8}  {}'.format(job.seconds, job.api_count, job.collection))
+    failed = len([job for job in jobs if job.error is not None])
+    lines.append('{:>9.2f}s  {} collections, {} failed'.format(sum(job.seconds for job in jobs), len(jobs), failed))
+    return '\n'.join(lines)
+
+
+# the generator and download flag of a worker process, see run_batch
+_worker_generator: DocumentGenerator = None
+_worker_download_enabled = False
+
+
+def init_batch_worker(options: GeneratorOptions, download_enabled: bool):
+    global _worker_generator, _worker_download_enabled
+    _worker_generator = DocumentGenerator(options)
+    _worker_download_enabled = download_enabled
+
+
+def run_worker_job(job: BatchJobModel) -> BatchJobModel:
+    return run_batch_job(_worker_generator, job, _worker_download_enabled)
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import re
+import threading
+
+from constants import *
+
+BODY_FILE_PATTERN = re.compile(r'data-body-file="' + BODIES_DIR + r'/([0-9a-f]+\.txt)"')
+
+
+class BodyStore:
+    """
+    Writes the example bodies above a size threshold to their own files under the bodies folder, the page only keeps
+    a preview and loads the whole body when it is expanded. The files are named after the hash of the body, so a
+    body shared by several examples is written once, and the files of unchanged bodies are kept across runs.
+    """
+
+    def __init__(self, output_dir: str, threshold: int, preview_length: int = BODY_PREVIEW_LENGTH):
+        """
+        :param output_dir: the output directory, the bodies are written to its bodies folder
+        :param threshold: the size in KB of the utf-8 encoded body above which it is written to a file
+        :param preview_length: [Optional] the number of characters of the body kept in the page
+        """
+        super().__init__()
+        if threshold is None or threshold < 0:
+            raise ValueError('Invalid body threshold: ' + str(threshold))
+        self.bodies_dir = os.path.join(output_dir, BODIES_DIR)
+        self.threshold = threshold * 1024
+        self.preview_length = preview_length
+        self.referenced = set()
+
+    @staticmethod
+    def fingerprint(threshold: int, preview_length: int) -> str:
+        """
+        :param threshold: the size in KB above which a body is written to a file, or None if the bodies stay in the
+        page
+        :param preview_length: the number of characters of the body kept in the page
+        :return: identifies the settings changing the rendered examples, see DocumentGenerator.build_fingerprint
+        """
+        if threshold is None:
+            return 'bodies:page'
+        return 'bodies:' + str(threshold) + ':' + str(preview_length)
+
+    def store(self, body: str) -> str:
+        """
+        Writes the body to its file if it is above the threshold
+        :param body: the request or response body, as it is shown
+        :return: the path of the file relative to the output directory, or None if the body stays in the page
+        """
+        # a character is at most 4 bytes in utf-8, most bodies are below the threshold without being encoded
+        if body is None or len(body) * 4 <= self.threshold:
+            return None
+        data = body.encode('utf-8')
+        if len(data) <= self.threshold:
+            return None
+        file_name = BODY_FILE_NAME.format(hashlib.sha1(data).hexdigest()[:BODY_HASH_LENGTH])
+        path = os.path.join(self.bodies_dir, file_name)
+        if not os.path.exists(path):
+            os.makedirs(self.bodies_dir, exist_ok=True)
+            tmp_path = path + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return BODIES_DIR + '/' + file_name
+
+    def preview(self, body: str) -> str:
+        """
+        :param body: a body written to a file
+        :return: the beginning of the body shown in the page
+        """
+        return body[:self.preview_length] + BODY_PREVIEW_SUFFIX
+
+    def shared_bodies(self, sanitize):
+        """
+        Reads the body files used by the run, so the page can hold every body once (see --body-mode page)
+        :param sanitize: function sanitizing a body
+        :return: generator of (path of the file relative to the output directory, sanitized body)
+        """
+        for file_name in sorted(self.referenced):
+            with open(os.path.join(self.bodies_dir, file_name), 'r', encoding='utf-8') as f:
+                yield BODIES_DIR + '/' + file_name, sanitize(f.read())
+
+    def reference(self, api):
+        """
+        Records the body files used by the api, read from its examples or from the fragment reused for it
+        :param api: the APIModel
+        """
+        if api.fragment is not None:
+            self.referenced.update(BODY_FILE_PATTERN.findall(api.fragment))
+            return
+        for example in api.examples:
+            for file_name in [example.request_body_file, example.response_body_file]:
+                if file_name is not None:
+                    self.referenced.add(os.path.basename(file_name))
+
+    def files(self) -> list:
+        """
+        :return: the paths of the body files used by the run
+        """
+        return [os.path.join(self.bodies_dir, file_name) for file_name in sorted(self.referenced)]
+
+    def remove_stale(self):
+        """
+        Removes the body files of previous runs that are not used anymore
+        """
+        if not os.path.isdir(self.bodies_dir):
+            return
+        for file_name in os.listdir(self.bodies_dir):
+            # the compressed copies of a body are kept with it
+            body_name = file_name
+            for extension in COMPRESSION_EXTENSIONS.values():
+                if body_name.endswith(extension):
+                    body_name = body_name[:-len(extension)]
+            if body_name not in self.referenced:
+                os.remove(os.path.join(self.bodies_dir, file_name))
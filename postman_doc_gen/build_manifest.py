@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import threading
+
+from constants import *
+
+
+class BuildManifest:
+    """
+    Records a content hash for every collection item together with the html fragment rendered for it, so the next
+    run in the same output directory can reuse the fragments of unchanged items.
+    """
+
+    def __init__(self, output_dir: str, fingerprint: str):
+        """
+        :param output_dir: the output directory the manifest is stored in
+        :param fingerprint: identifies the tool version, templates and options used to render the fragments
+        """
+        super().__init__()
+        self.file_name = os.path.join(output_dir, BUILD_MANIFEST_FILE_NAME)
+        self.fingerprint = fingerprint
+        self.previous_items = {}
+        self.previous_validated_hash = None
+        self.items = {}
+        self.validated_hash = None
+        self.env_hash = None
+        self.reused = 0
+        self.rebuilt = 0
+
+    @staticmethod
+    def load(output_dir: str, fingerprint: str) -> 'BuildManifest':
+        """
+        Loads the manifest of the previous run. A missing, unreadable or outdated manifest results in a full build.
+        :param output_dir: the output directory
+        :param fingerprint: the fingerprint of the current run
+        :return: instance of BuildManifest
+        """
+        manifest = BuildManifest(output_dir, fingerprint)
+        try:
+            with open(manifest.file_name, 'r', encoding='utf-8') as f:
+                manifest_json = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+
+        if manifest_json.get(MANIFEST_FINGERPRINT) == fingerprint:
+            manifest.previous_items = manifest_json.get(MANIFEST_ITEMS, {})
+            manifest.previous_validated_hash = manifest_json.get(MANIFEST_VALIDATED_HASH)
+        return manifest
+
+    @staticmethod
+    def content_hash(*parts) -> str:
+        """
+        Hashes json serializable values
+        :param parts: the values to hash
+        :return: hex digest
+        """
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(json.dumps(part, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def file_hash(file_name: str) -> str:
+        digest = hashlib.sha1()
+        with open(file_name, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def item_hash(self, item: json, api_id: int, response_id: int) -> str:
+        """
+        Hashes a collection item. The ids are part of the hash since they are rendered into the fragment.
+        :param item: json node representing an api
+        :param api_id: the id assigned to the api
+        :param response_id: the last response id assigned before the api
+        :return: hex digest
+        """
+        return BuildManifest.content_hash(item, api_id, response_id, self.env_hash)
+
+    def reuse(self, item_hash: str) -> str:
+        """
+        :param item_hash: the hash of the collection item
+        :return: the fragment rendered for the item by the previous run, or None
+        """
+        fragment = self.previous_items.get(item_hash)
+        if fragment is not None:
+            self.items[item_hash] = fragment
+            self.reused = self.reused + 1
+        return fragment
+
+    def record(self, item_hash: str, fragment: str):
+        self.items[item_hash] = fragment
+        self.rebuilt = self.rebuilt + 1
+
+    def save(self):
+        """
+        Writes the manifest, keeping only the items of the current run
+        """
+        tmp_file = self.file_name + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                MANIFEST_FINGERPRINT: self.fingerprint,
+                MANIFEST_VALIDATED_HASH: self.validated_hash,
+                MANIFEST_ITEMS: self.items
+            }, f)
+        os.replace(tmp_file, self.file_name)
@@ -1,12 +1,130 @@
+VERSION = '1.2.0'
+
 TEMPLATES_DIR = 'templates'
 TEMPLATE_FILE_NAME = 'index.html'
+API_TEMPLATE_FILE_NAME = 'api.html'
 POSTMAN_JSON_SCHEMA = 'schema_2_1_0.json'
 POSTMAN_SCHEMA_DIR = 'schemas'
+VALIDATOR_MODULE_SUFFIX = '.validator_{}.py'
 OUTPUT_DIR = 'output'
 OUTPUT_FILE_NAME = 'index.html'
+BUILD_MANIFEST_FILE_NAME = '.postman_doc_gen_manifest.json'
+MODEL_CACHE_FILE_NAME = '.postman_doc_gen_model.pickle'
 
 CSS_DIR = 'css'
 JS_DIR = 'js'
+SHARDS_DIR = 'shards'
+SHARD_FILE_NAME = 'shard_{}.html'
+
+VALIDATE_FULL = 'full'
+VALIDATE_SKIP = 'skip'
+VALIDATION_MODES = [VALIDATE_FULL, VALIDATE_SKIP]
+
+SANITIZE_ESCAPE = 'escape'
+SANITIZE_BLEACH = 'bleach'
+SANITIZER_MODES = [SANITIZE_ESCAPE, SANITIZE_BLEACH]
+
+MARKDOWN_CACHE_SIZE = 1024
+MARKDOWN_CACHE_FINGERPRINT = 'fingerprint'
+MARKDOWN_CACHE_ENTRIES = 'entries'
+
+MODEL_SIDE_TREE = 'side_tree'
+MODEL_SEARCH_INDEX = 'search_index'
+MODEL_BODY_FILES = 'body_files'
+MODEL_API_COUNT = 'api_count'
+
+MANIFEST_FINGERPRINT = 'fingerprint'
+MANIFEST_VALIDATED_HASH = 'validated_hash'
+MANIFEST_ITEMS = 'items'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+STREAM_CHUNK_SIZE = 64 * 1024
+OUTPUT_BUFFER_SIZE = 64 * 1024
+TEMPLATE_BUFFER_CHUNKS = 64
+STREAM_GC_INTERVAL = 10
+ITEM_DEFINITION = 'item'
+FOLDER_DEFINITION = 'item-group'
+
+SHARD_NONE = 'none'
+SHARD_ENDPOINT = 'endpoint'
+SHARD_FOLDER = 'folder'
+SHARD_SIZE = 'size'
+SHARD_MODES = [SHARD_NONE, SHARD_ENDPOINT, SHARD_FOLDER, SHARD_SIZE]
+SHARD_SIZE_KB = 512
+
+PARALLEL_CHUNK_SIZE = 16
+
+BODIES_DIR = 'bodies'
+BODY_FILE_NAME = '{}.txt'
+BODY_HASH_LENGTH = 16
+BODY_PREVIEW_LENGTH = 1000
+BODY_PREVIEW_SUFFIX = '\n...'
+BODY_FILE = 'file'
+BODY_PAGE = 'page'
+BODY_MODES = [BODY_FILE, BODY_PAGE]
+
+INTERN_CACHE_SIZE = 16 * 1024 * 1024
+INTERN_BODY = 'body'
+INTERN_KEY_VALUES = 'key_values'
+
+ASSET_HASH_LENGTH = 8
+
+COMPRESSION_GZIP = 'gzip'
+COMPRESSION_BROTLI = 'br'
+COMPRESSION_FORMATS = [COMPRESSION_GZIP, COMPRESSION_BROTLI]
+COMPRESSION_EXTENSIONS = {COMPRESSION_GZIP: '.gz', COMPRESSION_BROTLI: '.br'}
+COMPRESSION_MAX_LEVELS = {COMPRESSION_GZIP: 9, COMPRESSION_BROTLI: 11}
+COMPRESSION_RECORD_FILE_NAME = '.postman_doc_gen_compressed.json'
+
+SEARCH_INDEX_FILE_NAME = 'search_index.js'
+SEARCH_INDEX_CALLBACK = 'loadSearchIndex'
+SEARCH_DOCS = 'docs'
+SEARCH_TERMS = 'terms'
+SEARCH_TOKEN_MIN_LENGTH = 2
+SEARCH_TOKEN_MAX_LENGTH = 40
+
+SIDE_TREE_FILE_NAME = 'side_tree.js'
+SIDE_TREE_CALLBACK = 'loadSideTree'
+
+PUBLISH_BUILDS_SUFFIX = '.builds'
+PUBLISH_BUILD_PREFIX = 'build_'
+PUBLISH_BUILD_FORMAT = '{:06d}'
+PUBLISH_KEEP_BUILDS = 2
+
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8000
+SERVE_ENCODINGS = [COMPRESSION_BROTLI, COMPRESSION_GZIP]
+WATCH_INTERVAL = 1.0
+ETAG_LENGTH = 32
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+PROFILE_REPORT_FILE_NAME = '.postman_doc_gen_profile.json'
+PROFILE_STAGES = 'stages'
+STAGE_GENERATE = 'generate_doc'
+STAGE_VALIDATE = 'validate'
+STAGE_LOAD_ENV = 'load_env'
+STAGE_BUILD_APIS = 'build_apis'
+STAGE_MARKDOWN = 'markdown'
+STAGE_SANITIZE = 'sanitize'
+STAGE_ENV_VALUES = 'env_values'
+STAGE_SHARDS = 'shards'
+STAGE_RENDER = 'render'
+STAGE_SEARCH_INDEX = 'search_index'
+STAGE_MODEL_CACHE = 'model_cache'
+STAGE_ASSETS = 'assets'
+STAGE_COMPRESS = 'precompress'
+STAGE_SAVE = 'save_caches'
+STAGE_PUBLISH = 'publish'
+
+BATCH_COMMAND = 'batch'
+ROLLBACK_COMMAND = 'rollback'
+SERVE_COMMAND = 'serve'
+BATCH_COLLECTION = 'collection'
+BATCH_ENV = 'env'
+BATCH_OUT = 'out'
+COLLECTION_SUFFIXES = ['.postman_collection.json', '.json']
+ENVIRONMENT_SUFFIXES = ['.postman_environment.json', '.json']
 
 FOLDER_ICON = 'fas fa-folder'
 
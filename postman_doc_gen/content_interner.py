@@ -0,0 +1,62 @@
+import hashlib
+from collections import OrderedDict
+
+from constants import *
+
+
+class ContentInterner:
+    """
+    Keeps the values built from repeated content (e.g. the same error response or header set on hundreds of
+    requests) so they are built once and shared by every model using them. Values are looked up by a hash of their
+    content and evicted least recently used first once their total size is above the limit, which bounds the memory
+    held in streaming mode.
+    """
+
+    def __init__(self, max_size: int = INTERN_CACHE_SIZE):
+        """
+        :param max_size: [Optional] the total size of the kept values, in characters, 0 disables the interning
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.values = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_key(kind: str, content: str) -> bytes:
+        digest = hashlib.sha1(kind.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+
+    def intern(self, kind: str, content: str, build, size: int = None):
+        """
+        Returns the value built from the content, building it only the first time the content is seen
+        :param kind: what the value is, values of different kinds built from the same content are kept apart
+        :param content: the content the value is built from
+        :param build: function building the value
+        :param size: [Optional] the size of the value, defaults to the length of the content
+        :return: the value
+        """
+        if self.max_size <= 0:
+            return build()
+
+        key = ContentInterner.content_key(kind, content)
+        entry = self.values.get(key)
+        if entry is not None:
+            self.values.move_to_end(key)
+            self.hits = self.hits + 1
+            return entry[0]
+
+        self.misses = self.misses + 1
+        value = build()
+        size = size if size is not None else len(content)
+        if size > self.max_size:
+            return value
+        self.values[key] = (value, size)
+        self.size = self.size + size
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self.values.popitem(last=False)
+            self.size = self.size - evicted_size
+        return value
@@ -1,66 +1,270 @@
+import copy
+import functools
+import gc
 import json
 import os
 import shutil
-from collections import OrderedDict
-from distutils.dir_util import copy_tree
-
-import markdown
-
-import bleach
-from fastjsonschema import validate
-from jinja2 import Environment, FileSystemLoader
+import threading
 
 from constants import *
-from models import APIExampleModel, APIModel, APICollectionModel, APIBodyModel, KeyValueModel
+from asset_pipeline import AssetPipeline
+from body_store import BodyStore
+from build_manifest import BuildManifest
+from content_interner import ContentInterner
+from env_substitution import EnvSubstitution
+from json_stream import JsonStreamReader
+from markdown_converter import MarkdownConverter
+from model_cache import ModelCache
+from precompressor import Precompressor
+from publisher import Publisher
+from sanitizer import get_sanitizer, sanitizer_fingerprint
+from profiler import NullProfiler
+from models import APIExampleModel, APIModel, APICollectionModel, APIBodyModel, KeyValueModel, GeneratorOptions, \
+    RunContext, SharedModel
+from schema_validator import get_validator
+from search_index import SearchIndex
+from shard_writer import ShardWriter
+from side_tree import tree_json, write_tree
+
+
+def context_attribute(name: str) -> property:
+    """
+    :param name: the name of the RunContext attribute
+    :return: a property reading and writing the attribute of the current run context
+    """
+    return property(lambda self: getattr(self.context, name),
+                    lambda self, value: setattr(self.context, name, value))
 
 
 class DocumentGenerator:
-    side_tree = OrderedDict()
-    api_info = []
-    api_collection: APICollectionModel
-    api_id_counter: int
-    response_id: int
-    env_file = None
-
-    def __init__(self):
+    side_tree: list = context_attribute('side_tree')
+    api_info: list = context_attribute('api_info')
+    api_collection: APICollectionModel = context_attribute('api_collection')
+    api_id_counter: int = context_attribute('api_id_counter')
+    response_id: int = context_attribute('response_id')
+    env_file = context_attribute('env_file')
+    manifest: BuildManifest = context_attribute('manifest')
+    item_validator = context_attribute('item_validator')
+    folder_validator = context_attribute('folder_validator')
+    api_template = context_attribute('api_template')
+    top_level_folder: int = context_attribute('top_level_folder')
+    pending_apis: list = context_attribute('pending_apis')
+    assets: AssetPipeline = context_attribute('assets')
+    shards: list = context_attribute('shards')
+    precompressor: Precompressor = context_attribute('precompressor')
+    search_index: SearchIndex = context_attribute('search_index')
+    body_store: BodyStore = context_attribute('body_store')
+    interner: ContentInterner = context_attribute('interner')
+    model_cache: ModelCache = context_attribute('model_cache')
+    publisher: Publisher = context_attribute('publisher')
+
+    def __init__(self, options: GeneratorOptions = None, profiler=None):
+        """
+        :param options: [Optional] the generator options
+        :param profiler: [Optional] a Profiler recording the stages of the runs
+        """
         super().__init__()
+        self.options = options if options is not None else GeneratorOptions()
+        self.profiler = profiler if profiler is not None else NullProfiler()
+        self.code_sanitizer = get_sanitizer(self.options.sanitizer)
+        self.markdown_converter = MarkdownConverter(self.options.markdown_cache_size,
+                                                    self.options.markdown_cache_file)
+        self.context = RunContext()
 
     def generate_doc(self, collection_file_name: str, environment_file_name: str = None, output_dir: object = None,
-                     download_enabled: bool = False) -> object:
+                     download_enabled: bool = False, shared_model: SharedModel = None) -> object:
         """
+        Generates the documentation. The run works on a copy of the generator with a new RunContext, sharing only
+        the options and the markdown converter, so several threads can generate documents with the same generator.
+        Once the run is over, its context (e.g. the manifest and the api count) is available on the generator.
         :param collection_file_name: [Required] postman collection json
         :param environment_file_name: [Optional] postman environment json
         :param output_dir: [Optional] defaults to current directory
+        :param shared_model: [Optional] the models of the collection built by build_shared_model, only the examples
+        are built by the run
         :return: the output directory used
         """
+        run = copy.copy(self)
+        run.context = RunContext()
+        try:
+            with self.profiler.stage(STAGE_GENERATE):
+                return run.run_generation(collection_file_name, environment_file_name, output_dir, download_enabled,
+                                          shared_model)
+        finally:
+            self.context = run.context
+
+    def generate_env_docs(self, collection_file_name: str, environment_file_names: list, output_dir: object = None,
+                          download_enabled: bool = False, workers: int = 0) -> list:
+        """
+        Generates the documentation of a collection for several environments, each in a sub directory of the output
+        directory named after its environment file. The collection is validated and its models are built once,
+        only the examples, which the environment values apply to, are built for every environment before the
+        documents are rendered in parallel.
+        :param collection_file_name: [Required] postman collection json
+        :param environment_file_names: [Required] list of postman environment json
+        :param output_dir: [Optional] defaults to current directory
+        :param download_enabled: [Optional] enable the download links
+        :param workers: [Optional] the number of processes the environments are spread across, 0 uses all cpus
+        :return: the output directories, in the order of the environments
+        """
+        if self.options.streaming or self.options.incremental or self.options.model_cache or \
+                self.options.render_only:
+            raise ValueError('--stream, --incremental, --model-cache and --render-only can not be used with several '
+                             'environments')
+        if output_dir is None:
+            output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), OUTPUT_DIR)
+        out_dirs = [os.path.join(output_dir, DocumentGenerator.environment_name(file_name))
+                    for file_name in environment_file_names]
+        if len(set(out_dirs)) != len(out_dirs):
+            raise ValueError('Two environments are written to the same directory, rename their files')
+
+        shared_model = self.build_shared_model(collection_file_name)
+        tasks = [(collection_file_name, env_file, out, download_enabled)
+                 for env_file, out in zip(environment_file_names, out_dirs)]
+        workers = workers if workers > 0 else os.cpu_count()
+        if workers == 1 or len(tasks) == 1:
+            return [self.generate_doc(*task, shared_model=shared_model) for task in tasks]
+
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=init_env_worker,
+                                 initargs=(self.options, shared_model)) as executor:
+            return list(executor.map(generate_env_doc, tasks))
 
-        root = os.path.dirname(os.path.abspath(__file__))
-        templates_dir = os.path.join(root, TEMPLATES_DIR)
-        template = self.get_template(templates_dir)
+    @staticmethod
+    def environment_name(file_name: str) -> str:
+        """
+        :param file_name: the postman environment file path
+        :return: the file name without its environment suffix, used as the name of the output directory
+        """
+        name = os.path.basename(file_name)
+        for suffix in ENVIRONMENT_SUFFIXES:
+            if name.endswith(suffix):
+                return name[:-len(suffix)]
+        return name
 
-        json_collection = self.validate_collection(collection_file_name)
+    def build_shared_model(self, collection_file_name: str) -> SharedModel:
+        """
+        Validates the collection and builds the models of its apis without their examples
+        :param collection_file_name: postman collection json
+        :return: instance of SharedModel
+        """
+        run = copy.copy(self)
+        run.context = RunContext()
+        with self.profiler.stage(STAGE_VALIDATE):
+            json_collection = run.validate_collection(collection_file_name, self.options.validation_mode,
+                                                      self.options.cache_validator)
+        shared_model = SharedModel()
+        shared_model.api_collection = APICollectionModel()
+        shared_model.api_collection.name = json_collection[INFO][NAME]
+        shared_model.api_collection.description = json_collection[INFO].get(DESCRIPTION, '')
+        shared_model.api_collection.schema = json_collection[INFO][SCHEMA]
+
+        run.search_index = SearchIndex() if self.options.search_index else None
+        run.interner = ContentInterner(self.options.intern_cache_size)
+        with self.profiler.stage(STAGE_BUILD_APIS):
+            # the ids are assigned by a sequential pass, see build_apis_parallel
+            run.pending_apis = []
+            run.add_items(run.side_tree, json_collection)
+            for item, api_id, response_id, group in run.pending_apis:
+                run.api_id_counter = api_id
+                run.response_id = response_id
+                run.top_level_folder = group
+                shared_model.apis.append(run.get_api(item, with_examples=False))
+        shared_model.items = run.pending_apis
+        shared_model.side_tree = run.side_tree
+        shared_model.search_index = run.search_index
+        shared_model.api_count = len(run.pending_apis)
+        return shared_model
+
+    def apply_shared_model(self, shared_model: SharedModel, collection_file_name: str,
+                           environment_file_name: str) -> list:
+        """
+        Builds the examples of the shared apis with the environment of the run
+        :param shared_model: see build_shared_model
+        :param collection_file_name: postman collection json
+        :param environment_file_name: postman environment json, or None
+        :return: list of APIModel
+        """
         if environment_file_name is not None:
-            self.env_file = self.get_json_file(environment_file_name)
-
+            with self.profiler.stage(STAGE_LOAD_ENV):
+                self.env_file = self.get_json_file(environment_file_name)
+        self.api_collection = copy.copy(shared_model.api_collection)
+        self.api_collection.file_name = os.path.basename(collection_file_name)
+        self.side_tree = shared_model.side_tree
+        self.search_index = shared_model.search_index
+        with self.profiler.stage(STAGE_BUILD_APIS):
+            for shared_api, (item, api_id, response_id, group) in zip(shared_model.apis, shared_model.items):
+                self.api_id_counter = api_id
+                self.response_id = response_id
+                api = copy.copy(shared_api)
+                api.examples = self.get_examples(api, item.get(RESPONSE, []))
+                self.reference_bodies([api])
+                self.api_info.append(api)
+        self.api_id_counter = shared_model.api_count
+        return self.api_info
+
+    def run_generation(self, collection_file_name: str, environment_file_name: str = None, output_dir: object = None,
+                       download_enabled: bool = False, shared_model: SharedModel = None) -> object:
+        """
+        Generates the documentation with the current run context, see generate_doc
+        """
         if output_dir is None:
-            output_dir = os.path.join(root, OUTPUT_DIR)
+            output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), OUTPUT_DIR)
+        if not self.options.publish:
+            return self.build_output(collection_file_name, environment_file_name, output_dir, download_enabled,
+                                     shared_model)
+
+        # the run writes to a new build, published once it is complete
+        self.publisher = Publisher(output_dir, self.options.keep_builds, self.options.precompress is not None)
+        build_dir = self.publisher.prepare()
+        try:
+            self.build_output(collection_file_name, environment_file_name, build_dir, download_enabled, shared_model)
+        except BaseException:
+            self.publisher.discard()
+            raise
+        with self.profiler.stage(STAGE_PUBLISH):
+            self.publisher.publish()
+        return output_dir
+
+    def build_output(self, collection_file_name: str, environment_file_name: str, output_dir: str,
+                     download_enabled: bool, shared_model: SharedModel) -> str:
+        """
+        Writes the documentation to the output directory, see generate_doc
+        """
+        root = os.path.dirname(os.path.abspath(__file__))
+        templates_dir = os.path.join(root, TEMPLATES_DIR)
+        template = self.get_template(templates_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
         filename = os.path.join(output_dir, OUTPUT_FILE_NAME)
-        css_dir = os.path.join(root, TEMPLATES_DIR, CSS_DIR)
-        js_dir = os.path.join(root, TEMPLATES_DIR, JS_DIR)
         collection_destination = os.path.join(output_dir, os.path.basename(collection_file_name))
-
-        self.api_collection = APICollectionModel()
-
-        self.api_collection.name = json_collection[INFO][NAME]
-        self.api_collection.description = json_collection[INFO].get(DESCRIPTION, '')
-        self.api_collection.schema = json_collection[INFO][SCHEMA]
-        self.api_collection.file_name = os.path.basename(collection_file_name)
-
-        self.side_tree = []
-        self.api_id_counter = 0
-        self.response_id = 0
-        self.add_items(self.side_tree, json_collection)
+        # the apis are indexed as they are created, whichever way they are built
+        self.search_index = SearchIndex() if self.options.search_index else None
+        self.body_store = BodyStore(output_dir, self.options.body_threshold, self.options.body_preview) \
+            if self.options.body_threshold is not None else None
+        self.interner = ContentInterner(self.options.intern_cache_size)
+
+        api_info = None
+        if shared_model is not None:
+            api_info = self.apply_shared_model(shared_model, collection_file_name, environment_file_name)
+        elif self.options.model_cache or self.options.render_only:
+            self.model_cache = ModelCache(output_dir, self.model_key(collection_file_name, environment_file_name,
+                                                                     templates_dir), self.options.streaming)
+            with self.profiler.stage(STAGE_MODEL_CACHE):
+                self.api_collection = self.model_cache.load()
+            if self.api_collection is not None:
+                api_info = self.load_model(collection_file_name)
+            elif self.options.render_only:
+                raise ValueError('No model of this collection, environment and options is cached in ' + output_dir +
+                                 ', run with --model-cache first')
+
+        if api_info is None:
+            api_info = self.process_collection(collection_file_name, environment_file_name, output_dir, templates_dir)
+            if self.model_cache is not None:
+                api_info = self.model_cache.save(self.api_collection, api_info, self.cached_model)
+                if not self.options.streaming:
+                    with self.profiler.stage(STAGE_MODEL_CACHE):
+                        self.api_info = api_info = list(api_info)
 
         if environment_file_name is not None and download_enabled:
             self.api_collection.env_file_name = os.path.basename(environment_file_name)
@@ -69,35 +273,246 @@ class DocumentGenerator:
 
         if download_enabled:
             DocumentGenerator.copy_file(collection_file_name, collection_destination)
-        copy_tree(css_dir, os.path.join(output_dir, CSS_DIR))
-        copy_tree(js_dir, os.path.join(output_dir, JS_DIR))
+        # the static files are published while the page is rendered, when it asks for them
+        assets_url = self.options.assets_url
+        if assets_url is None and self.options.assets_dir is not None and self.publisher is not None:
+            # the page is served from the published directory, not from its build
+            assets_url = os.path.relpath(os.path.abspath(self.options.assets_dir),
+                                         self.publisher.output_dir).replace(os.sep, '/')
+        self.assets = AssetPipeline(templates_dir, output_dir, self.options.hashed_assets, self.options.assets_dir,
+                                    assets_url, self.profiler)
+
+        self.shards = []
+        if self.options.shard_mode != SHARD_NONE:
+            # the page only keeps the sidebar, the api sections are written to shard files loaded on demand
+            shard_writer = ShardWriter(output_dir, self.get_template(templates_dir, API_TEMPLATE_FILE_NAME),
+                                       self.options.shard_mode, self.options.shard_size)
+            with self.profiler.stage(STAGE_SHARDS):
+                shard_writer.write(api_info)
+            self.shards = shard_writer.shards
+            api_info = []
+
+        with self.profiler.stage(STAGE_RENDER):
+            self.write_template(template, filename,
+                                download_enabled=download_enabled,
+                                collection=self.api_collection,
+                                side_tree=self.side_tree_json if not self.options.tree_file else None,
+                                side_tree_file=SIDE_TREE_FILE_NAME if self.options.tree_file else None,
+                                api_info=api_info,
+                                shards=self.shards,
+                                search_index=SEARCH_INDEX_FILE_NAME if self.search_index is not None else None,
+                                shared_bodies=self.page_bodies if self.body_store is not None and
+                                self.options.body_mode == BODY_PAGE else None,
+                                asset_url=self.assets.asset_url)
+
+        output_files = [filename] + self.assets.published + \
+            [os.path.join(output_dir, shard.file_name) for shard in self.shards]
+        if self.options.tree_file:
+            output_files.append(write_tree(output_dir, self.side_tree))
+        if self.search_index is not None:
+            with self.profiler.stage(STAGE_SEARCH_INDEX):
+                output_files.append(self.search_index.write(output_dir))
+        if self.body_store is not None:
+            self.body_store.remove_stale()
+            output_files.extend(self.body_store.files())
+
+        if self.options.precompress is not None:
+            self.precompressor = Precompressor(output_dir, self.options.precompress or None,
+                                               self.options.compress_level, self.options.compress_workers)
+            with self.profiler.stage(STAGE_COMPRESS):
+                self.precompressor.compress(output_files)
+        elif os.path.exists(os.path.join(output_dir, COMPRESSION_RECORD_FILE_NAME)):
+            with self.profiler.stage(STAGE_COMPRESS):
+                Precompressor(output_dir).clear()
+
+        with self.profiler.stage(STAGE_SAVE):
+            self.markdown_converter.save()
+            if self.manifest is not None:
+                self.manifest.save()
+        return output_dir
 
-        with open(filename, 'w' , encoding='utf-8')  as fh:
-            fh.write(template.render(
-                download_enabled=download_enabled,
-                collection=self.api_collection,
-                side_tree=self.side_tree,
-                api_info=self.api_info
-            ))
+    def process_collection(self, collection_file_name: str, environment_file_name: str, output_dir: str,
+                           templates_dir: str):
+        """
+        Validates the collection and builds the collection model, the sidebar tree and the apis
+        :param collection_file_name: the postman collection json
+        :param environment_file_name: the postman environment json, or None
+        :param output_dir: the output directory
+        :param templates_dir: the directory containing the templates
+        :return: the list of APIModel, or a generator of APIModel in streaming mode
+        """
+        validation_mode = self.options.validation_mode
+        self.manifest = None
+        if self.options.incremental:
+            self.manifest = BuildManifest.load(output_dir, self.build_fingerprint(templates_dir))
+            collection_hash = BuildManifest.file_hash(collection_file_name)
+            if validation_mode == VALIDATE_FULL:
+                self.manifest.validated_hash = collection_hash
+            if collection_hash == self.manifest.previous_validated_hash:
+                # the same collection file was validated by the previous run
+                validation_mode = VALIDATE_SKIP
+                self.manifest.validated_hash = collection_hash
+
+        if self.options.streaming:
+            info = self.read_collection_info(collection_file_name)
+        else:
+            with self.profiler.stage(STAGE_VALIDATE):
+                json_collection = self.validate_collection(collection_file_name, validation_mode,
+                                                           self.options.cache_validator)
+            info = json_collection[INFO]
+        if environment_file_name is not None:
+            with self.profiler.stage(STAGE_LOAD_ENV):
+                self.env_file = self.get_json_file(environment_file_name)
+        if self.manifest is not None:
+            self.manifest.env_hash = BuildManifest.content_hash(self.env_file)
+            self.api_template = self.get_template(templates_dir, API_TEMPLATE_FILE_NAME)
 
-        return output_dir
+        self.api_collection = APICollectionModel()
+
+        self.api_collection.name = info[NAME]
+        self.api_collection.description = info.get(DESCRIPTION, '')
+        self.api_collection.schema = info[SCHEMA]
+        self.api_collection.file_name = os.path.basename(collection_file_name)
+
+        if self.options.streaming:
+            # apis are built one at a time while the template is rendered, and are part of its stage
+            return self.stream_apis(collection_file_name, validation_mode)
+        elif self.options.jobs != 1:
+            # a sequential pass assigns the ids, the apis are then built in worker processes
+            with self.profiler.stage(STAGE_BUILD_APIS):
+                self.pending_apis = []
+                self.add_items(self.side_tree, json_collection)
+                self.api_info = self.build_apis_parallel(self.pending_apis, templates_dir)
+                self.pending_apis = None
+            return self.api_info
+        else:
+            with self.profiler.stage(STAGE_BUILD_APIS):
+                self.add_items(self.side_tree, json_collection)
+            return self.api_info
+
+    def model_key(self, collection_file_name: str, environment_file_name: str, templates_dir: str) -> str:
+        """
+        Identifies everything the processed model depends on, see ModelCache
+        :param collection_file_name: the postman collection json
+        :param environment_file_name: the postman environment json, or None
+        :param templates_dir: the directory containing the templates
+        :return: the key of the model in the cache
+        """
+        env_hash = BuildManifest.file_hash(environment_file_name) if environment_file_name is not None else None
+        # the fragments reused by an incremental run are rendered with the api template
+        fingerprint = self.build_fingerprint(templates_dir) if self.options.incremental else None
+        return ModelCache.cache_key(VERSION, BuildManifest.file_hash(collection_file_name), env_hash,
+                                    MarkdownConverter.fingerprint(), self.options.validation_mode,
+                                    sanitizer_fingerprint(self.options.sanitizer),
+                                    BodyStore.fingerprint(self.options.body_threshold, self.options.body_preview),
+                                    self.options.search_index, fingerprint)
+
+    def load_model(self, collection_file_name: str):
+        """
+        Reads the apis of the cached model, the sidebar tree, search index and body files follow them
+        :param collection_file_name: the postman collection json
+        :return: the list of APIModel, or a generator of APIModel in streaming mode
+        """
+        self.api_collection.file_name = os.path.basename(collection_file_name)
+        self.api_collection.env_file_name = None
+        api_info = self.model_cache.apis(self.restore_model)
+        if self.options.streaming:
+            return api_info
+        with self.profiler.stage(STAGE_MODEL_CACHE):
+            self.api_info = list(api_info)
+        return self.api_info
+
+    def cached_model(self) -> dict:
+        """
+        :return: the parts of the processed model complete once all the apis are built, see ModelCache.save
+        """
+        return {
+            MODEL_SIDE_TREE: self.side_tree,
+            MODEL_SEARCH_INDEX: self.search_index,
+            MODEL_BODY_FILES: self.body_store.referenced if self.body_store is not None else set(),
+            MODEL_API_COUNT: self.api_id_counter
+        }
+
+    def restore_model(self, model: dict):
+        """
+        Restores the parts of the cached model following the apis
+        :param model: see cached_model
+        """
+        self.side_tree.extend(model[MODEL_SIDE_TREE])
+        self.search_index = model[MODEL_SEARCH_INDEX]
+        if self.body_store is not None:
+            self.body_store.referenced.update(model[MODEL_BODY_FILES])
+        self.api_id_counter = model[MODEL_API_COUNT]
+
+    def build_fingerprint(self, templates_dir) -> str:
+        """
+        Identifies everything besides the collection item that goes into a rendered api fragment
+        :param templates_dir: the directory containing the templates
+        :return: fingerprint string
+        """
+        template_hash = BuildManifest.file_hash(os.path.join(templates_dir, API_TEMPLATE_FILE_NAME))
+        return ':'.join([VERSION, template_hash, MarkdownConverter.fingerprint(),
+                         sanitizer_fingerprint(self.options.sanitizer),
+                         BodyStore.fingerprint(self.options.body_threshold, self.options.body_preview)])
 
     @staticmethod
     def copy_file(src, dest):
+        if os.path.exists(dest) and os.path.samefile(src, dest):
+            return
+        # the file is replaced rather than written in place, it may be linked to a published build
+        tmp_file = dest + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
         try:
-            shutil.copyfile(src, dest)
-        except shutil.SameFileError:
-            pass
+            shutil.copyfile(src, tmp_file)
+            os.replace(tmp_file, dest)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     @staticmethod
-    def get_template(templates_dir):
+    def get_template(templates_dir, template_file_name=TEMPLATE_FILE_NAME):
         """
         Loads the JINJA 2 template file and returns it
         :param templates_dir: the directory containing the template
+        :param template_file_name: [Optional] defaults to the index template
         :return: the JINJA 2 template
         """
+        return DocumentGenerator.get_environment(templates_dir).get_template(template_file_name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_environment(templates_dir):
+        """
+        Returns the JINJA 2 environment of the templates directory. The environment is kept for the life of the
+        process, so its compiled templates are shared by all the runs (a template is reloaded when its file changes).
+        :param templates_dir: the directory containing the templates
+        :return: the JINJA 2 environment
+        """
+        from jinja2 import Environment, FileSystemLoader
         env = Environment(loader=FileSystemLoader(templates_dir))
-        return env.get_template(TEMPLATE_FILE_NAME)
+        # the static files are linked as they are, unless a run passes the asset_url of its AssetPipeline
+        env.globals['asset_url'] = lambda path: path
+        return env
+
+    @staticmethod
+    def write_template(template, file_name, **context):
+        """
+        Renders the template straight to disk, chunk by chunk, instead of building the whole page in memory.
+        The page is written to a temporary file and moved in place once it is complete.
+        :param template: the JINJA 2 template
+        :param file_name: the output file path
+        :param context: the template variables
+        """
+        tmp_file_name = file_name + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        try:
+            with open(tmp_file_name, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as fh:
+                stream = template.stream(**context)
+                stream.enable_buffering(TEMPLATE_BUFFER_CHUNKS)
+                stream.dump(fh)
+        except BaseException:
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+            raise
+        os.replace(tmp_file_name, file_name)
 
     @staticmethod
     def get_json_file(file_name):
@@ -111,20 +526,23 @@ class DocumentGenerator:
         return json_file
 
     @staticmethod
-    def validate_collection(file_name) -> json:
+    def validate_collection(file_name, validation_mode: str = VALIDATE_FULL, cache_validator: bool = False) -> json:
         """
         Validates the postman collection against the postman schema (2.1.0)
         :param file_name: the postman collection file path
+        :param validation_mode: [Optional] 'full' validates against the schema, 'skip' trusts the input
+        :param cache_validator: [Optional] save the compiled schema validator next to the schema for later runs
         :return: validated collection json
         """
-        root = os.path.dirname(os.path.abspath(__file__))
-        schema_filename = os.path.join(root, POSTMAN_SCHEMA_DIR, POSTMAN_JSON_SCHEMA)
-
         json_collection = DocumentGenerator.get_json_file(file_name)
 
-        json_schema = DocumentGenerator.get_json_file(schema_filename)
+        if validation_mode == VALIDATE_SKIP:
+            return json_collection
+        if validation_mode != VALIDATE_FULL:
+            raise ValueError('Unknown validation mode: ' + str(validation_mode))
 
-        validate(json_schema, json_collection)
+        validate = get_validator(persist=cache_validator)
+        validate(json_collection)
         return json_collection
 
     @staticmethod
@@ -136,27 +554,21 @@ class DocumentGenerator:
         """
         if value is None:
             return None
-        return value.replace('\"', '\\"').replace('<', '&lt;').replace('>', '&gt;')
+        return EnvSubstitution.escape_value(value)
 
     @staticmethod
-    def apply_env_values(json_collection, json_env):
+    def apply_env_values(json_collection, json_env, escaped: bool = True):
         """
         Applies the environment values to the postman collection examples
         :param json_collection: postman collection example json
         :param json_env: postman environment json
+        :param escaped: [Optional] escape the < and > of the values, False when the text is escaped afterwards
         :return: json with replaced values
         """
         if json_env is None:
             return json_collection
-        collection_string = json.dumps(json_collection)
-
-        for item in json_env['values']:
-            key = '{{' + str(item['key']) + '}}'
-            value = DocumentGenerator.escape_string(str(item['value']))
 
-            collection_string = collection_string.replace(key, value)
-
-        return json.loads(collection_string)
+        return EnvSubstitution.for_env(json_env).substitute_tree(json_collection, escaped)
 
     @staticmethod
     def apply_env_values_string(string_value, json_env):
@@ -169,13 +581,7 @@ class DocumentGenerator:
         if json_env is None:
             return string_value
 
-        for item in json_env['values']:
-            key = '{{' + str(item['key']) + '}}'
-            value = DocumentGenerator.escape_string(str(item['value']))
-
-            string_value = string_value.replace(key, value)
-
-        return string_value
+        return EnvSubstitution.for_env(json_env).substitute_string(string_value)
 
     def add_items(self, tree, json_node):
         """
@@ -185,32 +591,194 @@ class DocumentGenerator:
         """
         for item in json_node['item']:
             if item.get('item', None) is not None:
+                if tree is self.side_tree:
+                    self.top_level_folder = len(tree)
                 node = dict()
                 node['text'] = item.get(NAME, NOT_FOUND)
                 sub_nodes = []
                 self.add_items(sub_nodes, item)
                 node['nodes'] = sub_nodes
                 node['icon'] = FOLDER_ICON
-                node['selectable'] = 'false'
+                node['selectable'] = False
                 tree.append(node)
 
             else:
-                self.api_id_counter = self.api_id_counter + 1
-                node = dict()
-                node['text'] = item.get(NAME, NOT_FOUND)
-                node['href'] = '#' + str(self.api_id_counter)
-                node[METHOD] = item.get(REQUEST, {}).get(METHOD, 'None')
-                tree.append(node)
+                self.add_request_node(tree, item)
                 self.add_apis(item)
 
+    def add_request_node(self, tree, item: json):
+        """
+        Assigns the next api id to the request and adds it to the tree
+        :param tree: the list of nodes of the current folder
+        :param item: json node representing an api
+        """
+        if tree is self.side_tree:
+            self.top_level_folder = None
+        self.api_id_counter = self.api_id_counter + 1
+        node = dict()
+        node['text'] = item.get(NAME, NOT_FOUND)
+        node['href'] = '#' + str(self.api_id_counter)
+        node[METHOD] = item.get(REQUEST, {}).get(METHOD, 'None')
+        tree.append(node)
+
+    @staticmethod
+    def read_collection_info(file_name) -> json:
+        """
+        Reads the info of the collection without loading its items
+        :param file_name: the postman collection file path
+        :return: the info json
+        """
+        with open(file_name, 'r', encoding='utf-8') as f:
+            reader = JsonStreamReader(f)
+            for key in reader.iter_object():
+                if key == INFO:
+                    return reader.read_value()
+                reader.skip_value()
+        raise ValueError('The collection has no info: ' + str(file_name))
+
+    def stream_apis(self, file_name, validation_mode: str = VALIDATE_FULL):
+        """
+        Reads the collection incrementally and yields one APIModel at a time, so only the item being processed is
+        kept in memory. With full validation, every item is validated on its own, followed by the collection
+        without its items.
+        :param file_name: the postman collection file path
+        :param validation_mode: [Optional] 'full' validates against the schema, 'skip' trusts the input
+        :return: generator of APIModel
+        """
+        self.item_validator = None
+        self.folder_validator = None
+        collection_validator = None
+        if validation_mode == VALIDATE_FULL:
+            collection_validator = get_validator(persist=self.options.cache_validator)
+            self.item_validator = get_validator(persist=self.options.cache_validator, definition=ITEM_DEFINITION)
+            self.folder_validator = get_validator(persist=self.options.cache_validator,
+                                                  definition=FOLDER_DEFINITION)
+        elif validation_mode != VALIDATE_SKIP:
+            raise ValueError('Unknown validation mode: ' + str(validation_mode))
+
+        with open(file_name, 'r', encoding='utf-8') as f:
+            reader = JsonStreamReader(f)
+            json_collection = dict()
+            for key in reader.iter_object():
+                if key == 'item' and reader.peek() == '[':
+                    yield from self.stream_items(reader, self.side_tree)
+                    json_collection[key] = []
+                else:
+                    json_collection[key] = reader.read_value()
+
+        if collection_validator is not None:
+            with self.profiler.stage(STAGE_VALIDATE):
+                collection_validator(json_collection)
+
+    def stream_items(self, reader: JsonStreamReader, tree):
+        """
+        Streaming counterpart of add_items. The members of every item are read one by one, so a folder's requests
+        are processed before the folder itself has been read completely.
+        :param reader: the reader positioned at an item array
+        :param tree: the list of nodes of the current folder
+        :return: generator of APIModel
+        """
+        for _ in reader.iter_array():
+            item = dict()
+            node = None
+            for key in reader.iter_object():
+                if key == 'item' and reader.peek() == '[':
+                    if tree is self.side_tree:
+                        self.top_level_folder = len(tree)
+                    node = dict()
+                    node['text'] = NOT_FOUND
+                    sub_nodes = []
+                    node['nodes'] = sub_nodes
+                    node['icon'] = FOLDER_ICON
+                    node['selectable'] = False
+                    tree.append(node)
+                    yield from self.stream_items(reader, sub_nodes)
+                    item[key] = []
+                else:
+                    item[key] = reader.read_value()
+
+            if node is not None:
+                # the name of a folder can follow its items
+                node['text'] = item.get(NAME, NOT_FOUND)
+                if self.folder_validator is not None:
+                    with self.profiler.stage(STAGE_VALIDATE):
+                        self.folder_validator(item)
+            else:
+                if self.item_validator is not None:
+                    with self.profiler.stage(STAGE_VALIDATE):
+                        self.item_validator(item)
+                self.add_request_node(tree, item)
+                yield self.get_api(item)
+                if self.api_id_counter % STREAM_GC_INTERVAL == 0:
+                    # the html sanitizer leaves reference cycles holding the bodies it parsed, collect them
+                    # before they are promoted to the oldest generation and pile up with the collection size
+                    gc.collect(1)
+
     def add_apis(self, item: json):
         """
-        Creates an APIModel and adds it to api_info
+        Creates an APIModel and adds it to api_info. During the sequential pass of a parallel run, only the ids of
+        the api are assigned and it is added to pending_apis instead.
         :param item: json node representing an api
         """
-        api = APIModel()
-        api.id = self.api_id_counter
-        api.name = item.get(NAME, NOT_FOUND)
+        if self.pending_apis is not None:
+            self.pending_apis.append((item, self.api_id_counter, self.response_id, self.top_level_folder))
+            # every response is an example, a request without responses gets a default example
+            self.response_id = self.response_id + max(len(item.get(RESPONSE, [])), 1)
+            return
+        self.api_info.append(self.get_api(item))
+
+    def build_apis_parallel(self, pending_apis: list, templates_dir) -> list:
+        """
+        Builds the apis collected by the sequential pass in a pool of worker processes. Since the ids are already
+        assigned, the chunks are independent of each other, and they are merged in their original order so the
+        output is the same as the one of the serial path.
+        :param pending_apis: list of (item, api id, response id, group) tuples
+        :param templates_dir: the directory containing the templates
+        :return: list of APIModel
+        """
+        api_info = []
+        tasks = []
+        for item, api_id, response_id, group in pending_apis:
+            self.api_id_counter = api_id
+            self.response_id = response_id
+            self.top_level_folder = group
+            api = self.new_api(item)
+            if self.manifest is None or not self.reuse_api(api, item):
+                tasks.append((len(api_info), item, api_id, response_id, group))
+            api_info.append(api)
+
+        if len(tasks) == 0:
+            self.reference_bodies(api_info)
+            return api_info
+
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = [tasks[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(tasks), PARALLEL_CHUNK_SIZE)]
+        jobs = self.options.jobs if self.options.jobs > 0 else os.cpu_count()
+        render_dir = templates_dir if self.manifest is not None else None
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks)), initializer=init_worker,
+                                 initargs=(self.options, self.env_file, render_dir, self.body_store)) as executor:
+            for chunk, (apis, converted) in zip(chunks, executor.map(build_api_chunk, chunks)):
+                self.markdown_converter.update(converted)
+                for task, api in zip(chunk, apis):
+                    api.content_hash = api_info[task[0]].content_hash
+                    api_info[task[0]] = api
+                    if self.manifest is not None:
+                        self.manifest.record(api.content_hash, api.fragment)
+        self.reference_bodies(api_info)
+        return api_info
+
+    def get_api(self, item: json, with_examples: bool = True) -> APIModel:
+        """
+        Creates an APIModel for the item, reusing the fragment rendered by the previous run if it is unchanged
+        :param item: json node representing an api
+        :param with_examples: [Optional] False leaves out the examples, the only part using the environment
+        :return: instance of APIModel
+        """
+        api = self.new_api(item)
+        if self.manifest is not None and self.reuse_api(api, item):
+            self.reference_bodies([api])
+            return api
+
         api.body = None
         if item.get(REQUEST, {}).get(DESCRIPTION, None) is not None:
             api.description = item.get(REQUEST, {}).get(DESCRIPTION, None)
@@ -221,27 +789,67 @@ class DocumentGenerator:
 
         if api.body is not None and api.body.raw is not None:
             api.body.raw = '\n' + api.body.raw.strip()  # append a line break for better formatting of jsons
-            api.body.raw = bleach.clean(api.body.raw)
+            api.body.raw = self.sanitize(api.body.raw)
 
         api.method = item.get(REQUEST, {}).get(METHOD, None)
 
         headers = item.get(REQUEST, {}).get(HEADER, None)
         if headers is not None:
-            api.headers = DocumentGenerator.get_key_values(headers)
+            api.headers = self.key_values(headers)
 
         if item.get(REQUEST, {}).get(URL, None) is not None:
             api.url = item.get(REQUEST, {}).get(URL, {}).get(RAW, None)
 
             query_params = item.get(REQUEST, {}).get(URL, {}).get(QUERY, None)
             if query_params is not None:
-                api.params = DocumentGenerator.get_key_values(query_params)
+                api.params = self.key_values(query_params)
 
             path_variables = item.get(REQUEST, {}).get(URL, {}).get(PATH_VARIABLE, None)
             if path_variables is not None:
-                api.path_variables = DocumentGenerator.get_key_values(path_variables)
+                api.path_variables = self.key_values(path_variables)
 
+        if not with_examples:
+            return api
         api.examples = self.get_examples(api, item.get(RESPONSE, []))
-        self.api_info.append(api)
+
+        if self.manifest is not None:
+            api.fragment = self.api_template.render(api=api)
+            self.manifest.record(api.content_hash, api.fragment)
+        self.reference_bodies([api])
+        return api
+
+    def reference_bodies(self, api_info: list):
+        """
+        Records the body files used by the apis, so the ones of previous runs can be removed
+        :param api_info: list of APIModel
+        """
+        if self.body_store is not None:
+            for api in api_info:
+                self.body_store.reference(api)
+
+    def new_api(self, item: json) -> APIModel:
+        api = APIModel()
+        api.id = self.api_id_counter
+        api.name = item.get(NAME, NOT_FOUND)
+        api.group = self.top_level_folder
+        if self.search_index is not None:
+            self.search_index.add(api, item)
+        return api
+
+    def reuse_api(self, api: APIModel, item: json) -> bool:
+        """
+        Hashes the item and looks up the fragment rendered for it by the previous run
+        :param api: the APIModel of the item
+        :param item: json node representing an api
+        :return: True if the fragment is reused
+        """
+        api.content_hash = self.manifest.item_hash(item, self.api_id_counter, self.response_id)
+        api.fragment = self.manifest.reuse(api.content_hash)
+        if api.fragment is None:
+            return False
+        # the examples of an unchanged item still take up their response ids
+        self.response_id = self.response_id + max(len(item.get(RESPONSE, [])), 1)
+        return True
 
     def get_examples(self, api: APIModel, json_responses: list) -> list:
         """
@@ -251,16 +859,26 @@ class DocumentGenerator:
         :return: list of APIExampleModel
         """
         examples = []
+        # the escape sanitizer escapes the bodies, the values substituted into them are only escaped by it
+        escape_once = self.env_file is not None and self.options.sanitizer == SANITIZE_ESCAPE
+        original_responses = json_responses
 
         if self.env_file is not None:
-            json_responses = self.apply_env_values(json_responses, self.env_file)
+            with self.profiler.stage(STAGE_ENV_VALUES):
+                json_responses = self.apply_env_values(json_responses, self.env_file, not escape_once)
 
-        for res in json_responses:
+        for original, res in zip(original_responses, json_responses):
             self.response_id = self.response_id + 1
             api_example = APIExampleModel()
             api_example.request_id = str(self.api_id_counter)
             api_example.id = 'response_' + str(self.response_id)
             api_example.name = res.get(NAME, NOT_FOUND)
+            if escape_once:
+                # the name and status are not sanitized
+                with self.profiler.stage(STAGE_ENV_VALUES):
+                    original = self.apply_env_values({NAME: original.get(NAME, NOT_FOUND),
+                                                      STATUS: original.get(STATUS, None)}, self.env_file)
+                api_example.name = original[NAME]
             api_example.method = res.get(ORIGINAL_REQUEST, {}).get(METHOD, None)
             api_example.url = res.get(ORIGINAL_REQUEST, {}).get(URL, {}).get(RAW, None)
             api_example.request_body = None
@@ -275,15 +893,20 @@ class DocumentGenerator:
                 api_example.request_body = (api_example.request_body if api_example.request_body is not None else '') \
                     + '\n' + res.get(ORIGINAL_REQUEST).get(BODY).get(RAW, '')
 
-                api_example.request_body = bleach.clean(api_example.request_body)
+                api_example.request_body, api_example.request_body_file = self.store_body(api_example.request_body)
+                api_example.request_body = self.sanitize(api_example.request_body)
+            elif escape_once and api_example.request_body is not None:
+                # the method and url hold the env values as they are, they are only escaped by the sanitizer
+                api_example.request_body = self.sanitize(api_example.request_body)
 
-            api_example.status = res.get(STATUS, None)
+            api_example.status = res.get(STATUS, None) if not escape_once else original[STATUS]
             api_example.code = res.get(CODE, None)
 
             api_example.response_body = res.get(BODY, None)
             if api_example.response_body is not None:
                 api_example.response_body = '\n' + api_example.response_body
-                api_example.response_body = bleach.clean(api_example.response_body)
+                api_example.response_body, api_example.response_body_file = self.store_body(api_example.response_body)
+                api_example.response_body = self.sanitize(api_example.response_body)
             examples.append(api_example)
 
         if len(examples) == 0:
@@ -311,26 +934,51 @@ class DocumentGenerator:
 
         return examples
 
-    @staticmethod
-    def markdown_to_html(md_text):
+    def markdown_to_html(self, md_text):
         """
         Converts the markdown text to html
         :param md_text: the text with markdown
         :return: the converted html code
         """
-        return markdown.markdown(md_text, extensions=['markdown.extensions.abbr',
-                                                      'markdown.extensions.attr_list', 'markdown.extensions.def_list',
-                                                      'markdown.extensions.fenced_code',
-                                                      'markdown.extensions.footnotes',
-                                                      'markdown.extensions.md_in_html', 'markdown.extensions.tables',
-                                                      'markdown.extensions.admonition',
-                                                      'markdown.extensions.codehilite',
-                                                      'markdown.extensions.legacy_attrs',
-                                                      'markdown.extensions.legacy_em',
-                                                      'markdown.extensions.meta', 'markdown.extensions.nl2br',
-                                                      'markdown.extensions.sane_lists', 'markdown.extensions.smarty',
-                                                      'markdown.extensions.toc', 'markdown.extensions.wikilinks'],
-                                 output_format='html5')
+        with self.profiler.stage(STAGE_MARKDOWN):
+            return self.markdown_converter.convert(md_text)
+
+    def store_body(self, body: str) -> tuple:
+        """
+        Writes an example body above the threshold of the body store to its own file
+        :param body: the request or response body
+        :return: the body, or its preview if it was written, and the path of its file or None
+        """
+        if self.body_store is None:
+            return body, None
+        file_name = self.body_store.store(body.strip())
+        if file_name is None:
+            return body, None
+        return self.body_store.preview(body), file_name
+
+    def sanitize(self, text):
+        """
+        Sanitizes a request or response body with the sanitizer of the options, see sanitizer.get_sanitizer
+        :param text: the body
+        :return: the sanitized body
+        """
+        with self.profiler.stage(STAGE_SANITIZE):
+            if self.interner is None:
+                return self.code_sanitizer(text)
+            # a body repeated across requests is sanitized once and shared
+            return self.interner.intern(INTERN_BODY, text, lambda: self.code_sanitizer(text))
+
+    def side_tree_json(self) -> str:
+        """
+        :return: the json of the sidebar tree, complete once the apis are built (see stream_apis)
+        """
+        return tree_json(self.side_tree)
+
+    def page_bodies(self):
+        """
+        :return: generator of the body files used by the run and their sanitized content, see BodyStore.shared_bodies
+        """
+        return self.body_store.shared_bodies(self.sanitize)
 
     @staticmethod
     def get_body(body: json) -> APIBodyModel:
@@ -348,6 +996,17 @@ class DocumentGenerator:
 
         return api_body
 
+    def key_values(self, item_list: json) -> list:
+        """
+        Interned get_key_values, the requests sharing the same headers (or params...) share their list of KeyValueModel
+        :param item_list: the key value items
+        :return: list of KeyValueModel
+        """
+        if self.interner is None or not isinstance(item_list, list) or len(item_list) == 0:
+            return DocumentGenerator.get_key_values(item_list)
+        content = json.dumps(item_list, sort_keys=True, separators=(',', ':'))
+        return self.interner.intern(INTERN_KEY_VALUES, content, lambda: DocumentGenerator.get_key_values(item_list))
+
     @staticmethod
     def get_key_values(item_list: json) -> list:
         if item_list is None or len(item_list) == 0:
@@ -367,3 +1026,69 @@ class DocumentGenerator:
                 KeyValueModel(item.get(KEY), value_string, desc_string)
             )
         return key_value_list
+
+
+# the generator and shared model of a worker process, see DocumentGenerator.generate_env_docs
+_env_generator: DocumentGenerator = None
+_shared_model: SharedModel = None
+
+
+def init_env_worker(options: GeneratorOptions, shared_model: SharedModel):
+    """
+    Creates the generator used by the worker process for all its environments
+    :param options: the options of the run
+    :param shared_model: the models of the collection, see DocumentGenerator.build_shared_model
+    """
+    global _env_generator, _shared_model
+    _env_generator = DocumentGenerator(options)
+    _shared_model = shared_model
+
+
+def generate_env_doc(task: tuple) -> str:
+    """
+    Generates the documentation of an environment from the shared model
+    :param task: the (collection, environment, output directory, download enabled) of the document
+    :return: the output directory used
+    """
+    return _env_generator.generate_doc(*task, shared_model=_shared_model)
+
+
+# the generator of a worker process, see DocumentGenerator.build_apis_parallel
+_worker_generator: DocumentGenerator = None
+
+
+def init_worker(options: GeneratorOptions, env_file, templates_dir, body_store: BodyStore = None):
+    """
+    Creates the generator used by the worker process for all its chunks
+    :param options: the options of the run
+    :param env_file: postman environment json
+    :param templates_dir: the directory containing the templates, when the fragments have to be rendered
+    :param body_store: [Optional] the body store of the run, writing the large bodies to their files
+    """
+    global _worker_generator
+    _worker_generator = DocumentGenerator(options)
+    _worker_generator.env_file = env_file
+    _worker_generator.body_store = body_store
+    _worker_generator.interner = ContentInterner(options.intern_cache_size)
+    if templates_dir is not None:
+        _worker_generator.api_template = DocumentGenerator.get_template(templates_dir, API_TEMPLATE_FILE_NAME)
+    _worker_generator.markdown_converter.take_converted()
+
+
+def build_api_chunk(chunk: list):
+    """
+    Builds the apis of a chunk with the ids assigned by the sequential pass
+    :param chunk: list of (index, item, api id, response id, group) tuples
+    :return: the list of APIModel and the descriptions converted to html
+    """
+    generator = _worker_generator
+    apis = []
+    for _, item, api_id, response_id, group in chunk:
+        generator.api_id_counter = api_id
+        generator.response_id = response_id
+        generator.top_level_folder = group
+        api = generator.get_api(item)
+        if generator.api_template is not None:
+            api.fragment = generator.api_template.render(api=api)
+        apis.append(api)
+    return apis, generator.markdown_converter.take_converted()
@@ -0,0 +1,109 @@
+import json
+import re
+
+from constants import *
+
+TOKEN_PATTERN = re.compile(r'\{\{([^{}]+)\}\}')
+
+
+class EnvSubstitution:
+    """
+    Precompiled substitution of {{name}} tokens with the values of a postman environment.
+    Every string is scanned once and each token is looked up in a prebuilt dictionary, instead of running one
+    str.replace per environment variable. Since the string is scanned once, a value that itself contains a
+    {{name}} token is not substituted again.
+    """
+    _cached = (None, None)
+
+    def __init__(self, json_env):
+        self.string_values = {}
+        self.tree_values = {}
+        # the values substituted into text that is escaped afterwards, e.g. by the escape sanitizer
+        self.raw_tree_values = {}
+        # keys that can not be matched by the token pattern (e.g. containing braces) fall back to str.replace
+        self.irregular_keys = []
+
+        for item in json_env.get('values', []):
+            key = str(item[KEY])
+            if key in self.string_values:
+                continue
+            escaped = EnvSubstitution.escape_value(str(item[VALUE]))
+            self.string_values[key] = escaped
+            self.tree_values[key] = EnvSubstitution.decode_value(escaped)
+            self.raw_tree_values[key] = EnvSubstitution.decode_value(str(item[VALUE]).replace('\"', '\\"'))
+            if TOKEN_PATTERN.fullmatch('{{' + key + '}}') is None:
+                self.irregular_keys.append(key)
+
+    @staticmethod
+    def escape_value(value):
+        """
+        Escapes the environment value the same way as DocumentGenerator.escape_string
+        :param value: string to format
+        :return: formatted string
+        """
+        return value.replace('\"', '\\"').replace('<', '&lt;').replace('>', '&gt;')
+
+    @staticmethod
+    def decode_value(escaped):
+        """
+        Values substituted into a json document used to be written into its serialized form and decoded again,
+        which turns the escaped quotes (and any other json escape sequence) back into characters
+        :param escaped: the escaped environment value
+        :return: the value as it appears in the decoded document
+        """
+        try:
+            return json.loads('"' + escaped + '"')
+        except ValueError:
+            return escaped.replace('\\"', '\"')
+
+    @classmethod
+    def for_env(cls, json_env):
+        """
+        Returns the substitution engine for an environment, reusing the last one built for the same object
+        :param json_env: postman environment json
+        :return: instance of EnvSubstitution
+        """
+        cached_env, engine = cls._cached
+        if cached_env is not json_env:
+            engine = cls(json_env)
+            cls._cached = (json_env, engine)
+        return engine
+
+    def substitute(self, string_value, values):
+        if '{{' not in string_value:
+            return string_value
+
+        def replace(match):
+            return values.get(match.group(1), match.group(0))
+
+        string_value = TOKEN_PATTERN.sub(replace, string_value)
+        for key in self.irregular_keys:
+            string_value = string_value.replace('{{' + key + '}}', values[key])
+        return string_value
+
+    def substitute_string(self, string_value):
+        """
+        Applies the environment values to a string, escaping quotes in the values
+        :param string_value: the string to format
+        :return: string with replaced values
+        """
+        return self.substitute(string_value, self.string_values)
+
+    def substitute_tree(self, node, escaped: bool = True):
+        """
+        Applies the environment values to the string leaves (and keys) of a parsed json document
+        :param node: the json node
+        :param escaped: [Optional] escape the < and > of the values, False when the text is escaped afterwards
+        :return: a copy of the node with replaced values
+        """
+        return self.substitute_node(node, self.tree_values if escaped else self.raw_tree_values)
+
+    def substitute_node(self, node, values):
+        if isinstance(node, str):
+            return self.substitute(node, values)
+        if isinstance(node, dict):
+            return {self.substitute(str(key), values): self.substitute_node(value, values)
+                    for key, value in node.items()}
+        if isinstance(node, (list, tuple)):
+            return [self.substitute_node(value, values) for value in node]
+        return node
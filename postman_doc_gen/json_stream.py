@@ -0,0 +1,157 @@
+import json
+import re
+from json.decoder import scanstring
+
+from constants import *
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class JsonStreamReader:
+    """
+    Incremental, pull based json reader. Objects and arrays can be walked member by member with iter_object and
+    iter_array, while read_value decodes a single member with the C json decoder. Only the members currently being
+    read are kept in memory, so the buffer is bounded by the largest value read at once, not by the document size.
+    """
+
+    def __init__(self, fp, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        :param fp: a text file object
+        :param chunk_size: [Optional] the number of characters read at once
+        """
+        super().__init__()
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        """
+        Reads the next chunk, dropping the consumed part of the buffer. A value that does not fit in the buffer makes
+        the reads grow with it, so decoding it again after every read stays linear in its size.
+        :return: False at the end of the file
+        """
+        if self.eof:
+            return False
+        chunk = self.fp.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        :return: the next non whitespace character, or an empty string at the end of the file
+        """
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def error(self, message):
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self.error('Expecting ' + repr(char))
+        self.pos = self.pos + 1
+
+    def read_string(self) -> str:
+        self.expect('"')
+        while True:
+            try:
+                value, self.pos = scanstring(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError:
+                # keep the opening quote in the buffer while reading more
+                self.pos = self.pos - 1
+                if not self.fill():
+                    raise
+                self.pos = self.pos + 1
+
+    def read_value(self):
+        """
+        Decodes the next value as a whole
+        :return: the decoded value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            if end == len(self.buffer) and self.fill():
+                # a number can continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        """
+        Skips the next value without building it
+        """
+        depth = 0
+        while True:
+            char = self.peek()
+            if char in ('{', '['):
+                depth = depth + 1
+                self.pos = self.pos + 1
+            elif char in ('}', ']'):
+                depth = depth - 1
+                self.pos = self.pos + 1
+            elif char in (',', ':'):
+                self.pos = self.pos + 1
+            elif char == '"':
+                self.read_string()
+            elif char == '':
+                raise self.error('Unexpected end of file')
+            else:
+                self.read_value()
+            if depth == 0:
+                return
+
+    def iter_object(self):
+        """
+        Walks an object. Yields the key of every member, the caller has to read, skip or walk its value before
+        the next key is read.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos = self.pos + 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos = self.pos + 1
+                continue
+            self.expect('}')
+            return
+
+    def iter_array(self):
+        """
+        Walks an array. Yields the index of every element, the caller has to read, skip or walk the element before
+        the next one is read.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos = self.pos + 1
+            return
+        index = 0
+        while True:
+            yield index
+            index = index + 1
+            if self.peek() == ',':
+                self.pos = self.pos + 1
+                continue
+            self.expect(']')
+            return
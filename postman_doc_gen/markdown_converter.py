@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from constants import *
+
+MARKDOWN_EXTENSIONS = ['markdown.extensions.abbr',
+                       'markdown.extensions.attr_list', 'markdown.extensions.def_list',
+                       'markdown.extensions.fenced_code',
+                       'markdown.extensions.footnotes',
+                       'markdown.extensions.md_in_html', 'markdown.extensions.tables',
+                       'markdown.extensions.admonition',
+                       'markdown.extensions.codehilite',
+                       'markdown.extensions.legacy_attrs',
+                       'markdown.extensions.legacy_em',
+                       'markdown.extensions.meta', 'markdown.extensions.nl2br',
+                       'markdown.extensions.sane_lists', 'markdown.extensions.smarty',
+                       'markdown.extensions.toc', 'markdown.extensions.wikilinks']
+
+
+class MarkdownConverter:
+    """
+    Long-lived markdown converter. The Markdown instance and its extensions are loaded with the first description
+    converted and reset between documents, and converted descriptions are kept in an LRU cache keyed by a hash of
+    the markdown text. A collection without descriptions never imports markdown (nor pygments, via codehilite).
+    """
+
+    def __init__(self, cache_size: int = MARKDOWN_CACHE_SIZE, cache_file: str = None):
+        """
+        :param cache_size: [Optional] maximum number of converted descriptions to keep, 0 disables the cache
+        :param cache_file: [Optional] json file used to persist the cache across runs
+        """
+        super().__init__()
+        self.markdown = None
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_file = cache_file
+        self.modified = False
+        # when set to a dict, newly converted descriptions are also collected in it (see take_converted)
+        self.converted = None
+        # the Markdown instance keeps the state of the document being converted, runs in other threads wait for it
+        self.lock = threading.Lock()
+
+        if cache_file is not None:
+            self.load(cache_file)
+
+    @staticmethod
+    def fingerprint() -> str:
+        """
+        Identifies the markdown and pygments versions and the extensions used, so a persisted cache is discarded when
+        they change. Without pygments, codehilite leaves the code blocks as they are.
+        :return: fingerprint string
+        """
+        import markdown
+        try:
+            import pygments
+            pygments_version = pygments.__version__
+        except ImportError:
+            pygments_version = 'none'
+        return markdown.__version__ + ':' + pygments_version + ':' + ','.join(MARKDOWN_EXTENSIONS)
+
+    @staticmethod
+    def content_hash(md_text: str) -> str:
+        return hashlib.sha1(md_text.encode('utf-8')).hexdigest()
+
+    def convert(self, md_text: str) -> str:
+        """
+        Converts the markdown text to html
+        :param md_text: the text with markdown
+        :return: the converted html code
+        """
+        with self.lock:
+            if self.cache_size <= 0:
+                return self.get_markdown().reset().convert(md_text)
+
+            key = MarkdownConverter.content_hash(md_text)
+            html = self.cache.get(key)
+            if html is not None:
+                self.cache.move_to_end(key)
+                return html
+
+            html = self.get_markdown().reset().convert(md_text)
+            self.add(key, html)
+            if self.converted is not None:
+                self.converted[key] = html
+            return html
+
+    def get_markdown(self):
+        """
+        Loads the Markdown instance the first time it is needed, the caller holds the lock
+        :return: the Markdown instance
+        """
+        if self.markdown is None:
+            import markdown
+            self.markdown = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, output_format='html5')
+        return self.markdown
+
+    def add(self, key: str, html: str):
+        self.cache[key] = html
+        self.modified = True
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def take_converted(self) -> dict:
+        """
+        Returns the descriptions converted since the last call, so a worker process can hand them to the converter
+        of the main process
+        :return: dictionary of hash to html
+        """
+        converted = self.converted if self.converted is not None else {}
+        self.converted = {}
+        return converted
+
+    def update(self, converted: dict):
+        """
+        Adds descriptions converted by another converter
+        :param converted: dictionary of hash to html, see take_converted
+        """
+        if self.cache_size <= 0:
+            return
+        with self.lock:
+            for key, html in converted.items():
+                self.add(key, html)
+
+    def load(self, cache_file: str):
+        """
+        Loads a persisted cache, ignoring it if it is missing, unreadable or was built with other settings
+        :param cache_file: the cache json file
+        """
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache_json = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if cache_json.get(MARKDOWN_CACHE_FINGERPRINT) != MarkdownConverter.fingerprint():
+            return
+
+        for key, html in cache_json.get(MARKDOWN_CACHE_ENTRIES, {}).items():
+            self.cache[key] = html
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def save(self, cache_file: str = None):
+        """
+        Writes the cache to disk if anything was converted since it was loaded
+        :param cache_file: [Optional] defaults to the file the cache was loaded from
+        """
+        cache_file = cache_file if cache_file is not None else self.cache_file
+        if cache_file is None or not self.modified:
+            return
+
+        cache_dir = os.path.dirname(os.path.abspath(cache_file))
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = cache_file + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        with self.lock:
+            entries = dict(self.cache)
+            self.modified = False
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                MARKDOWN_CACHE_FINGERPRINT: MarkdownConverter.fingerprint(),
+                MARKDOWN_CACHE_ENTRIES: entries
+            }, f)
+        os.replace(tmp_file, cache_file)
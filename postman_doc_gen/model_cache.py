@@ -0,0 +1,127 @@
+import hashlib
+import os
+import pickle
+import threading
+
+from constants import *
+
+# marks the end of the apis in the cache file
+END_OF_APIS = 'end_of_apis'
+
+
+class ModelCache:
+    """
+    Keeps the processed model of a run (the collection, its apis, the sidebar tree, the search index and the body
+    files used) in the output directory, so a later run of the same collection, environment, tool version and
+    processing options goes straight to rendering, e.g. after a change of the templates or css. The model is
+    pickled one api after the other, so it is written and read back as the page is rendered in streaming mode. The
+    file is only ever read from the output directory it was written to, like the other caches of the generator.
+    """
+
+    def __init__(self, output_dir: str, key: str, streaming: bool = False):
+        """
+        :param output_dir: the output directory the cache is stored in
+        :param key: identifies the inputs and options the model was processed with, see cache_key
+        :param streaming: [Optional] the apis are pickled on their own instead of sharing their common objects (e.g.
+        interned headers), so the memory used while writing and reading the cache stays bounded
+        """
+        super().__init__()
+        self.file_name = os.path.join(output_dir, MODEL_CACHE_FILE_NAME)
+        self.key = key
+        self.streaming = streaming
+        self.file = None
+        self.unpickler = None
+        self.shared = not streaming
+        self.loaded = False
+
+    @staticmethod
+    def cache_key(*parts) -> str:
+        """
+        :param parts: the hashes and options the model depends on
+        :return: hex digest
+        """
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def load(self):
+        """
+        Opens the cached model, its apis are then read with apis
+        :return: the cached APICollectionModel, or None if the model of the key is not cached
+        """
+        try:
+            self.file = open(self.file_name, 'rb')
+            self.unpickler = pickle.Unpickler(self.file)
+            if self.unpickler.load() == self.key:
+                self.shared = self.unpickler.load()
+                api_collection = self.unpickler.load()
+                self.loaded = True
+                return api_collection
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError, IndexError):
+            # a missing, truncated or outdated cache results in a full build
+            pass
+        self.close()
+        return None
+
+    def apis(self, finish):
+        """
+        Reads the cached apis one at a time
+        :param finish: called with the dict of the cached sidebar tree, search index... once all the apis are read
+        :return: generator of APIModel
+        """
+        try:
+            while True:
+                api = self.read()
+                if isinstance(api, str) and api == END_OF_APIS:
+                    break
+                yield api
+            finish(self.read())
+        finally:
+            self.close()
+
+    def save(self, api_collection, apis, finish):
+        """
+        Writes the model to the cache as the apis are built, the cache is only replaced once all of them are written
+        :param api_collection: the APICollectionModel
+        :param apis: iterable of APIModel
+        :param finish: called once all the apis are built, returns the dict of the sidebar tree, search index...
+        :return: generator of APIModel, passing the apis through
+        """
+        tmp_file_name = self.file_name + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        completed = False
+        try:
+            with open(tmp_file_name, 'wb') as f:
+                pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+                pickler.dump(self.key)
+                pickler.dump(self.shared)
+                pickler.dump(api_collection)
+                for api in apis:
+                    self.write(f, pickler, api)
+                    yield api
+                self.write(f, pickler, END_OF_APIS)
+                self.write(f, pickler, finish())
+            os.replace(tmp_file_name, self.file_name)
+            completed = True
+        finally:
+            if not completed and os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+
+    def write(self, f, pickler, value):
+        if self.shared:
+            # the objects already pickled are referenced instead of pickled again
+            pickler.dump(value)
+        else:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+
+    def read(self):
+        if self.shared:
+            return self.unpickler.load()
+        return pickle.load(self.file)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.unpickler = None
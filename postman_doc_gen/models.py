@@ -1,16 +1,35 @@
 import json
 
+from constants import VALIDATE_FULL, MARKDOWN_CACHE_SIZE, SHARD_NONE, SHARD_SIZE_KB, SANITIZE_BLEACH, \
+    BODY_PREVIEW_LENGTH, BODY_FILE, INTERN_CACHE_SIZE, PUBLISH_KEEP_BUILDS
+
+
+def to_json_default(o):
+    """
+    json.dumps default for the models, reading the attributes of slotted and regular classes alike
+    :param o: the model instance
+    :return: dictionary of its attributes
+    """
+    if hasattr(o, '__dict__'):
+        return o.__dict__
+    return {name: getattr(o, name) for cls in type(o).__mro__ for name in getattr(cls, '__slots__', ())
+            if hasattr(o, name)}
+
 
 class KeyValueModel:
-    key: str = None
-    description: str = None
-    value: str = None
+    __slots__ = ('key', 'description', 'value')
+    key: str
+    description: str
+    value: str
 
     def __init__(self, key, value, desc):
         self.key = key
         self.value = value
         self.description = desc
 
+    def toJSON(self):
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
+
 
 class APIBodyModel:
     mode: str = ''
@@ -19,41 +38,75 @@ class APIBodyModel:
 
 
 class APIExampleModel:
-    id: str = None
-    request_id: str = None
-    name: str = None
-    method: str = None
+    __slots__ = ('id', 'request_id', 'name', 'method', 'request_body', 'url', 'status', 'code', 'response_body',
+                 'request_body_file', 'response_body_file')
+    id: str
+    request_id: str
+    name: str
+    method: str
     request_body: str
-    url: str = None
-    status: str = None
-    code: int = None
+    url: str
+    status: str
+    code: int
     response_body: str
+    request_body_file: str
+    response_body_file: str
 
     def __init__(self):
         super().__init__()
+        self.id = None
+        self.request_id = None
+        self.name = None
+        self.method = None
+        self.request_body = None
+        self.url = None
+        self.status = None
+        self.code = None
+        self.response_body = None
+        self.request_body_file = None
+        self.response_body_file = None
 
     def toJSON(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
 
 
 class APIModel:
-    id: int = None
-    name: str = None
-    description: str = None
-    method: str = None
-    body: APIBodyModel = None
-    headers: list = None
-    params: list = None
-    path_variables: list = None
-
-    url: str = None
-    examples: list = []
+    __slots__ = ('id', 'name', 'description', 'method', 'body', 'headers', 'params', 'path_variables', 'url',
+                 'examples', 'group', 'content_hash', 'fragment')
+    id: int
+    name: str
+    description: str
+    method: str
+    body: APIBodyModel
+    headers: list
+    params: list
+    path_variables: list
+
+    url: str
+    examples: list
+
+    group: int
+    content_hash: str
+    fragment: str
 
     def __init__(self):
         super().__init__()
+        self.id = None
+        self.name = None
+        self.description = None
+        self.method = None
+        self.body = None
+        self.headers = None
+        self.params = None
+        self.path_variables = None
+        self.url = None
+        self.examples = []
+        self.group = None
+        self.content_hash = None
+        self.fragment = None
 
     def toJSON(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
 
 
 class APICollectionModel:
@@ -67,4 +120,125 @@ class APICollectionModel:
         super().__init__()
 
     def toJSON(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
+
+
+class ShardModel:
+    file_name: str = None
+    first_id: int = None
+    api_count: int = 0
+
+    def __init__(self, file_name, first_id):
+        self.file_name = file_name
+        self.first_id = first_id
+
+    def toJSON(self):
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
+
+
+class RunContext:
+    """
+    The state of a single generate_doc run. Every run gets its own context, so a DocumentGenerator can be reused
+    and shared between threads without one document picking up the apis of another.
+    """
+    side_tree: list = None
+    api_info: list = None
+    api_collection: APICollectionModel = None
+    api_id_counter: int = 0
+    response_id: int = 0
+    env_file = None
+    manifest = None
+    item_validator = None
+    folder_validator = None
+    api_template = None
+    top_level_folder: int = None
+    pending_apis: list = None
+    assets = None
+    shards: list = None
+    precompressor = None
+    search_index = None
+    body_store = None
+    interner = None
+    model_cache = None
+    publisher = None
+
+    def __init__(self):
+        super().__init__()
+        self.side_tree = []
+        self.api_info = []
+
+
+class SharedModel:
+    """
+    The models of a collection that do not depend on the environment, built once for the documents of several
+    environments, see DocumentGenerator.generate_env_docs
+    """
+    api_collection: APICollectionModel = None
+    side_tree: list = None
+    search_index = None
+    # the apis without their examples, and the (item, api id, response id, group) their examples are built from
+    apis: list = None
+    items: list = None
+    api_count: int = 0
+
+    def __init__(self):
+        super().__init__()
+        self.side_tree = []
+        self.apis = []
+        self.items = []
+
+
+class BatchJobModel:
+    collection: str = None
+    env: str = None
+    out: str = None
+    seconds: float = None
+    api_count: int = None
+    error: str = None
+
+    def __init__(self, collection, env=None, out=None):
+        self.collection = collection
+        self.env = env
+        self.out = out
+
+    def toJSON(self):
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
+
+
+class GeneratorOptions:
+    validation_mode: str = VALIDATE_FULL
+    cache_validator: bool = False
+    markdown_cache_size: int = MARKDOWN_CACHE_SIZE
+    markdown_cache_file: str = None
+    incremental: bool = False
+    streaming: bool = False
+    shard_mode: str = SHARD_NONE
+    shard_size: int = SHARD_SIZE_KB
+    jobs: int = 1
+    hashed_assets: bool = False
+    assets_dir: str = None
+    assets_url: str = None
+    precompress: list = None
+    compress_level: int = None
+    compress_workers: int = 0
+    search_index: bool = False
+    sanitizer: str = SANITIZE_BLEACH
+    body_threshold: int = None
+    body_preview: int = BODY_PREVIEW_LENGTH
+    body_mode: str = BODY_FILE
+    intern_cache_size: int = INTERN_CACHE_SIZE
+    tree_file: bool = False
+    model_cache: bool = False
+    render_only: bool = False
+    publish: bool = False
+    keep_builds: int = PUBLISH_KEEP_BUILDS
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        for key, value in kwargs.items():
+            if not hasattr(self, key):
+                raise TypeError('Unknown generator option: ' + key)
+            setattr(self, key, value)
+
+    def toJSON(self):
+        return json.dumps(self, default=to_json_default, sort_keys=True, indent=4)
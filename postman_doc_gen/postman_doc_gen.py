@@ -1,30 +1,332 @@
-from document_generator import DocumentGenerator
+from constants import VERSION, VALIDATION_MODES, VALIDATE_FULL, MARKDOWN_CACHE_SIZE, SHARD_MODES, SHARD_NONE, \
+    SHARD_SIZE_KB, BATCH_COMMAND, COMPRESSION_FORMATS, PROFILE_REPORT_FILE_NAME, SANITIZER_MODES, SANITIZE_BLEACH, \
+    BODY_PREVIEW_LENGTH, BODY_MODES, BODY_FILE, INTERN_CACHE_SIZE, SIDE_TREE_FILE_NAME, PUBLISH_KEEP_BUILDS, \
+    PUBLISH_BUILDS_SUFFIX, ROLLBACK_COMMAND, SERVE_COMMAND, SERVE_HOST, SERVE_PORT, WATCH_INTERVAL, OUTPUT_DIR, \
+    SEARCH_INDEX_FILE_NAME
+from models import GeneratorOptions
+from profiler import Profiler
 import argparse
+import os
+import sys
+import tracemalloc
 
 
 def init_arg_parse() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        usage="%(prog)s [COLLECTION FILE PATH]",
+        usage="%(prog)s [COLLECTION FILE PATH]\n       %(prog)s batch [COLLECTION GLOB ...] [-m MANIFEST]\n"
+              "       %(prog)s rollback -o [OUTPUT DIRECTORY]\n"
+              "       %(prog)s serve [COLLECTION FILE PATH] -o [OUTPUT DIRECTORY]",
         description='''Generates an HTML document from a Postman collection. Copies the resulting html file along with 
         css and js to an output directory in the same path, unless an output directory is specified.
-        If an environment file is provided, applies the env values to the API examples. '''
+        If an environment file is provided, applies the env values to the API examples. With several environment 
+        files, the collection is processed once and a document is written for every environment. '''
     )
     parser.add_argument(
         "-v", "--version", action="version",
-        version=f"{parser.prog} Version 1.2.0"
+        version=f"{parser.prog} Version {VERSION}"
     )
     parser.add_argument('collection', help='The Postman collection json')
+    parser.add_argument('-e', '--env', help='The Postman environment json, given several times the document of every '
+                                            'environment is written to a sub directory named after its file',
+                        action='append')
+    parser.add_argument('-o', '--out', help='The output directory')
+    parser.add_argument('--env-workers', help='The number of processes rendering the documents of several '
+                                              'environments, 0 uses all cpus', type=int, default=0)
+    add_generator_arguments(parser)
+
+    return parser
+
+
+def init_batch_arg_parse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='postman_doc_gen batch',
+        usage="%(prog)s [COLLECTION GLOB ...] [-m MANIFEST]",
+        description='''Generates the HTML documents of many Postman collections in one process. The collections are 
+        either matched by glob patterns or listed in a manifest json, a list of objects with the collection and 
+        optionally the env and out paths (relative to the manifest). Every collection is written to a directory 
+        named after it in the output directory, unless the manifest sets its out path. '''
+    )
+    parser.add_argument('patterns', help='Glob patterns matching Postman collection jsons', nargs='*')
+    parser.add_argument('-m', '--manifest', help='A json file listing the collections to generate')
+    parser.add_argument('-e', '--env', help='The Postman environment json applied to the collections matched by '
+                                            'the patterns')
+    parser.add_argument('-o', '--out', help='The directory containing the output directories, defaults to the '
+                                            'current directory')
+    parser.add_argument('-w', '--workers', help='The number of processes the collections are spread across, 0 uses '
+                                                'all cpus', type=int, default=1)
+    add_generator_arguments(parser)
+
+    return parser
+
+
+def init_rollback_arg_parse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='postman_doc_gen rollback',
+        usage="%(prog)s -o [OUTPUT DIRECTORY]",
+        description='''Publishes again the build that preceded the current one in an output directory published with 
+        --publish. '''
+    )
+    parser.add_argument('-o', '--out', help='The published output directory', required=True)
+
+    return parser
+
+
+def init_serve_arg_parse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='postman_doc_gen serve',
+        usage="%(prog)s [COLLECTION FILE PATH] -o [OUTPUT DIRECTORY]",
+        description='''Serves the HTML document of a Postman collection over http, with ETags, cache headers, 
+        ranges and the compressed copies written by --precompress. The document is generated again when the 
+        collection or environment file changes, and the previous build is served until the new one is published. 
+        Without a collection, the output directory is served as it is. '''
+    )
+    parser.add_argument('collection', help='The Postman collection json', nargs='?')
     parser.add_argument('-e', '--env', help='The Postman environment json')
     parser.add_argument('-o', '--out', help='The output directory')
+    parser.add_argument('--host', help='The address to listen on', default=SERVE_HOST)
+    parser.add_argument('-p', '--port', help='The port to listen on', type=int, default=SERVE_PORT)
+    parser.add_argument('--watch-interval', help='The number of seconds between two checks of the collection and '
+                                                 'environment files', type=float, default=WATCH_INTERVAL)
+    parser.add_argument('--no-watch', help='Do not generate the document again when the files change',
+                        action='store_true')
+    parser.add_argument('--quiet', help='Do not print the requests', action='store_true')
+    add_generator_arguments(parser)
+
+    return parser
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser):
+    """
+    Adds the arguments shared by the single collection and the batch command
+    :param parser: the parser of the command
+    """
     parser.add_argument('-d', '--download', help='Enable download links to the collection and env files', default=False,
                         type=lambda x: (str(x).lower() in ['true', '1', 'yes']))
+    parser.add_argument('--validate', help='Validate the collection against the postman schema (full) or trust '
+                                           'the input (skip)', choices=VALIDATION_MODES, default=VALIDATE_FULL)
+    parser.add_argument('--cache-validator', help='Save the compiled schema validator next to the schema so later '
+                                                  'runs skip compiling it', action='store_true')
+    parser.add_argument('--sanitizer', help='Escape the request and response bodies (escape) or clean their html with '
+                                            'bleach, rendering the tags it allows (bleach)', choices=SANITIZER_MODES,
+                        default=SANITIZE_BLEACH)
+    parser.add_argument('--body-threshold', help='Write the example bodies larger than this size in KB (utf-8 '
+                                                 'encoded) to separate files under bodies/, loaded when they are '
+                                                 'expanded', type=int)
+    parser.add_argument('--body-preview', help='The number of characters of a body written to a file shown in the '
+                                               'page', type=int, default=BODY_PREVIEW_LENGTH)
+    parser.add_argument('--body-mode', help='Where the bodies above --body-threshold are kept, in their files (file) '
+                                            'or once in the page for all the examples using them (page)',
+                        choices=BODY_MODES, default=BODY_FILE)
+    parser.add_argument('--intern-cache-size', help='The number of characters of repeated bodies and headers kept '
+                                                    'to build them once (0 disables it)', type=int,
+                        default=INTERN_CACHE_SIZE)
+    parser.add_argument('--markdown-cache', help='A json file used to keep converted descriptions across runs')
+    parser.add_argument('--markdown-cache-size', help='The number of converted descriptions kept in memory '
+                                                      '(0 disables the cache)', type=int, default=MARKDOWN_CACHE_SIZE)
+    parser.add_argument('--incremental', help='Reuse the html rendered by the previous run in the output directory '
+                                              'for unchanged requests', action='store_true')
+    parser.add_argument('--stream', help='Read the collection incrementally and render one request at a time, '
+                                         'for collections too large to load at once', action='store_true')
+    parser.add_argument('--shard', help='Write the request sections to separate files loaded on demand, one per '
+                                        'request (endpoint), per top level folder (folder) or per --shard-size KB '
+                                        '(size)', choices=SHARD_MODES, default=SHARD_NONE)
+    parser.add_argument('--shard-size', help='The size of a shard in KB (utf-8 encoded) when sharding by size',
+                        type=int, default=SHARD_SIZE_KB)
+    parser.add_argument('-j', '--jobs', help='The number of processes used to build the request sections, 0 uses '
+                                             'all cpus (not used with --stream)', type=int, default=1)
+    parser.add_argument('--hashed-assets', help='Add a hash of the content to the names of the css and js files, so '
+                                                'they can be cached forever', action='store_true')
+    parser.add_argument('--assets-dir', help='Publish the css and js files to this directory instead of the output '
+                                             'directory, e.g. one directory shared by many documents')
+    parser.add_argument('--assets-url', help='The url of the assets directory used in the page, defaults to its path '
+                                             'relative to the output directory')
+    parser.add_argument('--precompress', help='Write compressed copies of the page, css, js and shards next to them '
+                                              '(.gz and .br), all the available formats unless some are given',
+                        nargs='*', choices=COMPRESSION_FORMATS)
+    parser.add_argument('--compress-level', help='The compression level, defaults to the maximum of every format',
+                        type=int)
+    parser.add_argument('--compress-workers', help='The number of threads compressing the files, 0 uses all cpus',
+                        type=int, default=0)
+    parser.add_argument('--search-index', help='Add a search box to the page, its index is written to '
+                                               + SEARCH_INDEX_FILE_NAME + ' and loaded when it is first used',
+                        action='store_true')
+    parser.add_argument('--tree-file', help='Write the sidebar tree to ' + SIDE_TREE_FILE_NAME + ' loaded by the page, '
+                                            'instead of into the page', action='store_true')
+    parser.add_argument('--model-cache', help='Keep the processed collection in the output directory, so a later run '
+                                              'of the same collection, environment and options only renders the '
+                                              'templates', action='store_true')
+    parser.add_argument('--render-only', help='Render the model kept by --model-cache, e.g. after a change of the '
+                                              'templates or css, and fail if it is not cached', action='store_true')
+    parser.add_argument('--publish', help='Build in a new directory next to the output directory (e.g. docs' +
+                                          PUBLISH_BUILDS_SUFFIX + '/build_000002) and publish it by flipping the '
+                                          'output directory, a symlink, once it is complete', action='store_true')
+    parser.add_argument('--keep-builds', help='The number of previous builds kept by --publish for rollback',
+                        type=int, default=PUBLISH_KEEP_BUILDS)
+    parser.add_argument('--profile', help='Record the time, calls and peak memory of every stage, print them and '
+                                          'write them to a json report', action='store_true')
+    parser.add_argument('--profile-report', help='The json report written by --profile, defaults to ' +
+                                                 PROFILE_REPORT_FILE_NAME + ' in the output directory')
 
-    return parser
 
+def build_options(args) -> GeneratorOptions:
+    return GeneratorOptions(
+        validation_mode=args.validate,
+        cache_validator=args.cache_validator,
+        markdown_cache_size=args.markdown_cache_size,
+        markdown_cache_file=args.markdown_cache,
+        incremental=args.incremental,
+        streaming=args.stream,
+        shard_mode=args.shard,
+        shard_size=args.shard_size,
+        jobs=args.jobs,
+        hashed_assets=args.hashed_assets,
+        assets_dir=args.assets_dir,
+        assets_url=args.assets_url,
+        precompress=args.precompress,
+        compress_level=args.compress_level,
+        compress_workers=args.compress_workers,
+        search_index=args.search_index,
+        sanitizer=args.sanitizer,
+        body_threshold=args.body_threshold,
+        body_preview=args.body_preview,
+        body_mode=args.body_mode,
+        intern_cache_size=args.intern_cache_size,
+        tree_file=args.tree_file,
+        model_cache=args.model_cache,
+        render_only=args.render_only,
+        publish=args.publish,
+        keep_builds=args.keep_builds
+    )
 
-if __name__ == '__main__':
+
+def start_profiler(args) -> Profiler:
+    """
+    :param args: the parsed arguments
+    :return: a Profiler if --profile is set, else None
+    """
+    if not args.profile:
+        return None
+    tracemalloc.start()
+    return Profiler()
+
+
+def stop_profiler(profiler: Profiler, args, output_dir):
+    if profiler is None:
+        return
+    tracemalloc.stop()
+    print(profiler.format_table())
+    report = args.profile_report if args.profile_report is not None \
+        else os.path.join(output_dir, PROFILE_REPORT_FILE_NAME)
+    profiler.save(report)
+    print("Profile written to " + report)
+
+
+def main(argv) -> int:
     parser = init_arg_parse()
-    args = parser.parse_args()
-    d = DocumentGenerator()
-    output_dir = d.generate_doc(args.collection, args.env, args.out, args.download)
+    args = parser.parse_args(argv)
+    env_files = args.env if args.env is not None else []
+    if args.profile and len(env_files) > 1 and args.env_workers != 1:
+        parser.error('--profile with several environments needs --env-workers 1')
+    # the generator and its dependencies (jinja2, bleach, markdown...) are imported once the arguments are parsed,
+    # so --help, --version and argument errors return without loading them
+    from document_generator import DocumentGenerator
+    profiler = start_profiler(args)
+    d = DocumentGenerator(build_options(args), profiler)
+    if len(env_files) > 1:
+        output_dirs = d.generate_env_docs(args.collection, env_files, args.out, args.download, args.env_workers)
+        stop_profiler(profiler, args, os.path.dirname(output_dirs[0]))
+        print("Success. Documents generated at " + ', '.join(output_dirs))
+        return 0
+    output_dir = d.generate_doc(args.collection, env_files[0] if len(env_files) > 0 else None, args.out,
+                                args.download)
+    if d.manifest is not None:
+        print("Reused {} of {} items".format(d.manifest.reused, d.manifest.reused + d.manifest.rebuilt))
+    if d.model_cache is not None and d.model_cache.loaded:
+        print("Rendered the cached model")
+    stop_profiler(profiler, args, output_dir)
     print("Success. Document generated at " + output_dir)
+    return 0
+
+
+def batch_main(argv) -> int:
+    parser = init_batch_arg_parse()
+    args = parser.parse_args(argv)
+    from batch import read_batch_jobs, run_batch, format_batch_summary
+    if len(args.patterns) == 0 and args.manifest is None:
+        parser.error('a collection glob or a manifest is required')
+    if args.profile and args.workers != 1:
+        parser.error('--profile needs --workers 1')
+    try:
+        jobs = read_batch_jobs(args.patterns, args.manifest, args.out, args.env)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    profiler = start_profiler(args)
+    jobs = run_batch(jobs, build_options(args), args.download, args.workers, profiler)
+    print(format_batch_summary(jobs))
+    stop_profiler(profiler, args, args.out if args.out is not None else os.getcwd())
+    return 1 if any(job.error is not None for job in jobs) else 0
+
+
+def rollback_main(argv) -> int:
+    parser = init_rollback_arg_parse()
+    args = parser.parse_args(argv)
+    from publisher import Publisher
+    try:
+        build_dir = Publisher(args.out).rollback()
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    print("Rolled back " + args.out + " to " + build_dir)
+    return 0
+
+
+def serve_main(argv) -> int:
+    parser = init_serve_arg_parse()
+    args = parser.parse_args(argv)
+    if args.collection is None and args.env is not None:
+        parser.error('-e needs a collection')
+    if args.profile:
+        parser.error('--profile can not be used with serve')
+    output_dir = args.out if args.out is not None else os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                    OUTPUT_DIR)
+    from server import DocumentServer, SourceWatcher
+    watcher = None
+    if args.collection is not None:
+        from document_generator import DocumentGenerator
+        options = build_options(args)
+        # every build is published while the previous one is served, and reuses the requests that did not change
+        options.publish = True
+        options.incremental = True
+        d = DocumentGenerator(options)
+        watcher = SourceWatcher(d, args.collection, args.env, output_dir, args.download, args.watch_interval)
+        d.generate_doc(args.collection, args.env, output_dir, args.download)
+    elif not os.path.isdir(output_dir):
+        parser.error('No document in ' + output_dir + ', give a collection to generate it')
+
+    server = DocumentServer(output_dir, (args.host, args.port), not args.quiet)
+    if watcher is not None and not args.no_watch:
+        watcher.start()
+    print("Serving " + output_dir + " at " + server.url + " (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if watcher is not None:
+            watcher.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    if getattr(sys, 'frozen', False):
+        # the worker processes of the executable start from its entry point
+        import multiprocessing
+        multiprocessing.freeze_support()
+    if len(sys.argv) > 1 and sys.argv[1] == BATCH_COMMAND:
+        sys.exit(batch_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == ROLLBACK_COMMAND:
+        sys.exit(rollback_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == SERVE_COMMAND:
+        sys.exit(serve_main(sys.argv[2:]))
+    sys.exit(main(sys.argv[1:]))
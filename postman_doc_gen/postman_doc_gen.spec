@@ -3,13 +3,25 @@
 
 block_cipher = None
 
+import sys
+sys.path.insert(0, SPECPATH)
+from constants import ITEM_DEFINITION, FOLDER_DEFINITION
+from schema_validator import get_validator
+
+# ship the compiled schema validators so the executable does not compile the schema on every run, the item and
+# folder validators are used by --stream and --incremental
+get_validator(persist=True)
+get_validator(persist=True, definition=ITEM_DEFINITION)
+get_validator(persist=True, definition=FOLDER_DEFINITION)
+
 
 a = Analysis(
     ['postman_doc_gen.py'],
     pathex=['/Users/karthsub/Desktop/Personal/postman-doc-gen/postman_doc_gen'],
     binaries=[],
     datas=[('./schemas/schema_2_1_0.json', 'schemas'),
-                    ('./templates/index.html', 'templates'),
+                    ('./schemas/schema_2_1_0.validator_*.py', 'schemas'),
+                    ('./templates/*.html', 'templates'),
                     ('./templates/css/*.css', 'templates/css'),
                     ('./templates/js/*.js', 'templates/js')],
     hiddenimports=[],
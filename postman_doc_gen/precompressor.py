@@ -0,0 +1,146 @@
+import functools
+import gzip
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import *
+
+
+@functools.lru_cache(maxsize=None)
+def load_brotli():
+    """
+    Imports the optional brotli package when it is first needed, so the runs without --precompress do not load it
+    :return: the brotli module, or None if it is not installed
+    """
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def available_formats() -> list:
+    """
+    :return: the compression formats that can be written, brotli needs the optional brotli package
+    """
+    return COMPRESSION_FORMATS if load_brotli() is not None else [COMPRESSION_GZIP]
+
+
+class Precompressor:
+    """
+    Writes compressed copies of the output files next to them (index.html.gz, index.html.br), so a static file server
+    can send them as they are. The files are compressed in a thread pool, zlib and brotli release the GIL while they
+    work. The hash of every compressed file is recorded in the output directory, and a file whose hash did not change
+    since its copies were written is skipped.
+    """
+
+    def __init__(self, output_dir: str, formats: list = None, level: int = None, workers: int = 0):
+        """
+        :param output_dir: the output directory, the record of the compressed files is kept in it
+        :param formats: [Optional] the formats to write, defaults to all the available ones
+        :param level: [Optional] the compression level, capped to the maximum of every format, defaults to the
+        maximum
+        :param workers: [Optional] the number of threads, 0 uses all cpus
+        """
+        super().__init__()
+        self.output_dir = output_dir
+        self.formats = formats if formats is not None else available_formats()
+        for compression_format in self.formats:
+            if compression_format not in available_formats():
+                raise ValueError('Unknown or unavailable compression format: ' + str(compression_format))
+        self.level = level
+        self.workers = workers if workers > 0 else os.cpu_count()
+        self.record_file = os.path.join(output_dir, COMPRESSION_RECORD_FILE_NAME)
+        self.compressed = []
+        self.skipped = []
+
+    def format_level(self, compression_format: str) -> int:
+        max_level = COMPRESSION_MAX_LEVELS[compression_format]
+        return max_level if self.level is None else max(0, min(self.level, max_level))
+
+    def load_record(self) -> dict:
+        try:
+            with open(self.record_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_record(self, record: dict):
+        tmp_file = self.record_file + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(record, f, sort_keys=True)
+        os.replace(tmp_file, self.record_file)
+
+    def compress_file(self, file_name: str, previous: str) -> str:
+        """
+        Writes the compressed copies of a file, unless they were written for the same content
+        :param file_name: the file to compress
+        :param previous: the signature recorded when the copies were last written, or None
+        :return: the signature of the file, its hash together with the formats and levels used
+        """
+        for compression_format, extension in COMPRESSION_EXTENSIONS.items():
+            if compression_format not in self.formats and os.path.exists(file_name + extension):
+                # a copy left by a run with other formats would be served with outdated content
+                os.remove(file_name + extension)
+
+        with open(file_name, 'rb') as f:
+            data = f.read()
+        signature = ':'.join([hashlib.sha256(data).hexdigest()] +
+                             [compression_format + str(self.format_level(compression_format))
+                              for compression_format in self.formats])
+        if signature == previous and all(os.path.exists(file_name + COMPRESSION_EXTENSIONS[compression_format])
+                                   for compression_format in self.formats):
+            self.skipped.append(file_name)
+            return signature
+
+        for compression_format in self.formats:
+            level = self.format_level(compression_format)
+            if compression_format == COMPRESSION_GZIP:
+                # no timestamp in the header, the same content always gives the same file
+                compressed = gzip.compress(data, compresslevel=level, mtime=0)
+            else:
+                compressed = load_brotli().compress(data, quality=level)
+            destination = file_name + COMPRESSION_EXTENSIONS[compression_format]
+            tmp_file = destination + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+            with open(tmp_file, 'wb') as f:
+                f.write(compressed)
+            os.replace(tmp_file, destination)
+        self.compressed.append(file_name)
+        return signature
+
+    def compress(self, file_names: list):
+        """
+        Compresses the files in parallel
+        :param file_names: the files to compress
+        """
+        record = self.load_record()
+        paths = [os.path.relpath(os.path.abspath(file_name), os.path.abspath(self.output_dir)).replace(os.sep, '/')
+                 for file_name in file_names]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(file_names)))) as executor:
+            recorded = list(executor.map(lambda i: self.compress_file(file_names[i], record.get(paths[i])),
+                                       range(len(file_names))))
+        # the copies of the files no longer written, e.g. the shards of another shard mode
+        self.remove_copies(set(record) - set(paths))
+        self.save_record(dict(zip(paths, recorded)))
+
+    def clear(self):
+        """
+        Removes the copies listed in the record, and the record, for a run without precompression: the copies of an
+        earlier run would otherwise be served in place of the files written since
+        """
+        self.remove_copies(self.load_record())
+        if os.path.exists(self.record_file):
+            os.remove(self.record_file)
+
+    def remove_copies(self, paths):
+        """
+        :param paths: the paths of compressed files, relative to the output directory
+        """
+        for path in paths:
+            file_name = os.path.join(self.output_dir, *path.split('/'))
+            for extension in COMPRESSION_EXTENSIONS.values():
+                if os.path.exists(file_name + extension):
+                    os.remove(file_name + extension)
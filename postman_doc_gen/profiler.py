@@ -0,0 +1,132 @@
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from constants import *
+
+# tracemalloc.reset_peak was added in Python 3.9, before it the memory traced at the end of a stage is used as its
+# peak, which misses the memory freed within the stage
+RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+class StageStats:
+    name: str = None
+    calls: int = 0
+    seconds: float = 0.0
+    peak_memory: int = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def toJSON(self):
+        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+
+
+class Profiler:
+    """
+    Records the wall time, the number of calls and the peak memory of the stages of a run. The memory is only
+    measured while tracemalloc is tracing, the peak of a stage is the highest traced memory above the memory traced
+    when it started, including its nested stages. Observers are called at the end of every stage with its name, wall
+    time and peak memory, e.g. to export the numbers to the metrics of an embedding service.
+    The stages of a profiler are expected to run in one thread at a time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.stats = OrderedDict()
+        self.observers = []
+        # [start time, traced memory at the start, highest traced memory seen] of the running stages
+        self.stack = []
+
+    def add_observer(self, observer):
+        """
+        :param observer: callable taking the stage name, the wall time in seconds and the peak memory in bytes
+        (None when tracemalloc is not tracing)
+        """
+        self.observers.append(observer)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Context manager measuring a stage, stages can be nested
+        :param name: the name of the stage, the calls of a stage are added up
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if len(self.stack) > 0:
+                # the peak is reset for the nested stage, keep the one of the enclosing stage
+                self.stack[-1][2] = max(self.stack[-1][2], peak if RESET_PEAK else current)
+            if RESET_PEAK:
+                tracemalloc.reset_peak()
+            frame = [time.perf_counter(), current, current]
+        else:
+            frame = [time.perf_counter(), None, None]
+        self.stack.append(frame)
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - frame[0]
+            self.stack.pop()
+            peak_memory = None
+            if tracing and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                frame[2] = max(frame[2], peak if RESET_PEAK else current)
+                peak_memory = frame[2] - frame[1]
+                if len(self.stack) > 0 and self.stack[-1][2] is not None:
+                    self.stack[-1][2] = max(self.stack[-1][2], frame[2])
+            self.record(name, seconds, peak_memory)
+
+    def record(self, name: str, seconds: float, peak_memory: int = None):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = StageStats(name)
+            self.stats[name] = stats
+        stats.calls = stats.calls + 1
+        stats.seconds = stats.seconds + seconds
+        if peak_memory is not None:
+            stats.peak_memory = peak_memory if stats.peak_memory is None else max(stats.peak_memory, peak_memory)
+        for observer in self.observers:
+            observer(name, seconds, peak_memory)
+
+    def report(self) -> dict:
+        """
+        :return: the stats of every stage, in the order the stages were first run
+        """
+        return {PROFILE_STAGES: [dict(vars(stats)) for stats in self.stats.values()]}
+
+    def format_table(self) -> str:
+        lines = ['{:<16}{:>8}{:>12}{:>14}'.format('stage', 'calls', 'seconds', 'peak memory')]
+        for stats in self.stats.values():
+            peak = '-' if stats.peak_memory is None else '{:.1f} MB'.format(stats.peak_memory / (1024 * 1024))
+            lines.append('{:<16}{:>8}{:>12.3f}{:>14}'.format(stats.name, stats.calls, stats.seconds, peak))
+        return '\n'.join(lines)
+
+    def save(self, file_name: str):
+        """
+        Writes the report as json
+        :param file_name: the report file
+        """
+        report_dir = os.path.dirname(os.path.abspath(file_name))
+        os.makedirs(report_dir, exist_ok=True)
+        # the report is replaced rather than written in place, it may be linked to a published build
+        tmp_file = file_name + '.tmp' + str(os.getpid())
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=4)
+        os.replace(tmp_file, file_name)
+
+
+class NullProfiler:
+    """
+    Profiler used when profiling is off, its stages do nothing
+    """
+    null_stage = contextlib.nullcontext()
+
+    def stage(self, name: str):
+        return NullProfiler.null_stage
+
+    def add_observer(self, observer):
+        pass
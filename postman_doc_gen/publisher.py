@@ -0,0 +1,177 @@
+import os
+import shutil
+import threading
+
+from constants import *
+
+
+class Publisher:
+    """
+    Publishes the documentation atomically, so a web server serving the output directory during a run never sees a
+    half written page or a page whose css does not match. Every run is built in a new directory next to the output
+    directory (docs.builds/build_000002 for docs), and the output directory is a symlink flipped to the new build with
+    a single rename once it is complete. The new build starts as a hard linked copy of the published one, so the
+    caches kept in the output directory (manifest, model, compressed files...) stay warm; the generator never writes
+    to an existing file in place, it replaces it. The previous builds are kept for rollback.
+    """
+
+    def __init__(self, output_dir: str, keep: int = PUBLISH_KEEP_BUILDS, compressed: bool = False):
+        """
+        :param output_dir: the published output directory, a symlink to the current build
+        :param keep: [Optional] the number of previous builds kept next to the published one
+        :param compressed: [Optional] the run writes compressed copies, the ones of the published build are reused
+        when their file did not change. Otherwise they are left out of the new build, they would be served in place
+        of the files written by the run.
+        """
+        super().__init__()
+        self.output_dir = os.path.normpath(os.path.abspath(output_dir))
+        self.builds_dir = self.output_dir + PUBLISH_BUILDS_SUFFIX
+        self.keep = max(0, keep)
+        self.compressed = compressed
+        self.build_dir = None
+
+    @staticmethod
+    def build_number(name: str) -> int:
+        """
+        :param name: the name of a directory in the builds directory
+        :return: the number of the build, or None if it is not a build
+        """
+        prefix, _, number = name.rpartition('_')
+        if prefix + '_' != PUBLISH_BUILD_PREFIX or not number.isdigit():
+            return None
+        return int(number)
+
+    def builds(self) -> list:
+        """
+        :return: the build directories, oldest first
+        """
+        try:
+            names = os.listdir(self.builds_dir)
+        except FileNotFoundError:
+            return []
+        numbered = sorted((Publisher.build_number(name), name) for name in names
+                          if Publisher.build_number(name) is not None)
+        return [os.path.join(self.builds_dir, name) for _, name in numbered]
+
+    def current(self) -> str:
+        """
+        :return: the build the output directory links to, or None if it is not a published build
+        """
+        if not os.path.islink(self.output_dir):
+            return None
+        return os.path.normpath(os.path.join(os.path.dirname(self.output_dir), os.readlink(self.output_dir)))
+
+    def new_build_dir(self) -> str:
+        """
+        Creates the directory of the next build, the numbers of builds started at the same time never collide
+        :return: the new build directory
+        """
+        os.makedirs(self.builds_dir, exist_ok=True)
+        builds = self.builds()
+        number = Publisher.build_number(os.path.basename(builds[-1])) + 1 if len(builds) > 0 else 1
+        while True:
+            build_dir = os.path.join(self.builds_dir, PUBLISH_BUILD_PREFIX + PUBLISH_BUILD_FORMAT.format(number))
+            try:
+                os.mkdir(build_dir)
+                return build_dir
+            except FileExistsError:
+                number = number + 1
+
+    def prepare(self) -> str:
+        """
+        Creates the build directory of the run, starting from the files of the published build
+        :return: the directory the run writes to
+        """
+        if os.path.isdir(self.output_dir) and not os.path.islink(self.output_dir):
+            # the output directory of a run without publishing becomes the first build, this move is the only step
+            # that is not atomic
+            previous = self.new_build_dir()
+            os.rmdir(previous)
+            os.rename(self.output_dir, previous)
+            self.link(previous)
+
+        self.build_dir = self.new_build_dir()
+        current = self.current()
+        if current is not None and os.path.isdir(current):
+            link_tree(current, self.build_dir, None if self.compressed else is_compressed_copy)
+        return self.build_dir
+
+    def publish(self):
+        """
+        Flips the output directory to the build of the run and removes the builds no longer kept
+        """
+        self.link(self.build_dir)
+        self.prune()
+
+    def discard(self):
+        """
+        Removes the build of a failed run, the published build is left as it is
+        """
+        if self.build_dir is not None:
+            shutil.rmtree(self.build_dir, ignore_errors=True)
+            self.build_dir = None
+
+    def rollback(self) -> str:
+        """
+        Flips the output directory back to the build published before the current one
+        :return: the build now published
+        """
+        current = self.current()
+        previous = [build for build in self.builds() if current is None or
+                    Publisher.build_number(os.path.basename(build)) <
+                    Publisher.build_number(os.path.basename(current))]
+        if len(previous) == 0:
+            raise ValueError('No build to roll back to in ' + self.builds_dir)
+        self.link(previous[-1])
+        return previous[-1]
+
+    def link(self, build_dir: str):
+        """
+        Points the output directory to a build, the link is replaced with a single rename
+        :param build_dir: the build directory
+        """
+        tmp_link = self.output_dir + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        os.symlink(os.path.relpath(build_dir, os.path.dirname(self.output_dir)), tmp_link, target_is_directory=True)
+        try:
+            os.replace(tmp_link, self.output_dir)
+        except BaseException:
+            os.remove(tmp_link)
+            raise
+
+    def prune(self):
+        """
+        Removes the builds older than the published one, except the last keep of them. Newer builds belong to runs
+        that are not published yet.
+        """
+        current = Publisher.build_number(os.path.basename(self.build_dir))
+        older = [build for build in self.builds() if Publisher.build_number(os.path.basename(build)) < current]
+        for build in older[:max(0, len(older) - self.keep)]:
+            shutil.rmtree(build, ignore_errors=True)
+
+
+def is_compressed_copy(file_name: str) -> bool:
+    """
+    :param file_name: the name of a file of the output directory
+    :return: True for the copies written by the Precompressor and its record
+    """
+    return file_name == COMPRESSION_RECORD_FILE_NAME or \
+        any(file_name.endswith(extension) for extension in COMPRESSION_EXTENSIONS.values())
+
+
+def link_tree(source: str, destination: str, skip=None):
+    """
+    Hard links the files of a directory into another one, copying them where links are not supported
+    :param source: the directory to link
+    :param destination: an existing directory
+    :param skip: [Optional] called with the name of every file, the files it returns True for are left out
+    """
+    for root, dirs, files in os.walk(source):
+        target = os.path.join(destination, os.path.relpath(root, source))
+        os.makedirs(target, exist_ok=True)
+        for file_name in files:
+            if skip is not None and skip(file_name):
+                continue
+            try:
+                os.link(os.path.join(root, file_name), os.path.join(target, file_name))
+            except OSError:
+                shutil.copy2(os.path.join(root, file_name), os.path.join(target, file_name))
@@ -0,0 +1,51 @@
+import html
+
+from constants import *
+
+
+def escape_code(text: str) -> str:
+    """
+    Escapes a body shown as code, in a single pass over the text. Nothing in the body can open a tag or an entity,
+    so it is as safe as cleaning it with bleach, and the body is shown exactly as it is (bleach would render the
+    tags it allows and drop comments or xml declarations). Line breaks are normalized like the html parser does.
+    :param text: the request or response body
+    :return: the escaped body
+    """
+    return html.escape(text.replace('\r\n', '\n').replace('\r', '\n'), quote=False)
+
+
+def clean_html(text: str) -> str:
+    """
+    Cleans the html of the text with bleach, keeping the tags it allows
+    :param text: text containing html
+    :return: the sanitized text
+    """
+    import bleach
+    return bleach.clean(text)
+
+
+SANITIZERS = {SANITIZE_ESCAPE: escape_code, SANITIZE_BLEACH: clean_html}
+
+
+def get_sanitizer(sanitizer_mode: str = SANITIZE_BLEACH):
+    """
+    :param sanitizer_mode: [Optional] 'escape' escapes the bodies, 'bleach' cleans their html
+    :return: the function sanitizing a body
+    """
+    sanitizer = SANITIZERS.get(sanitizer_mode)
+    if sanitizer is None:
+        raise ValueError('Unknown sanitizer: ' + str(sanitizer_mode))
+    return sanitizer
+
+
+def sanitizer_fingerprint(sanitizer_mode: str = SANITIZE_BLEACH) -> str:
+    """
+    Identifies the sanitizer, so the fragments rendered with another one (or another bleach version) are rebuilt
+    :param sanitizer_mode: [Optional] see get_sanitizer
+    :return: fingerprint string
+    """
+    get_sanitizer(sanitizer_mode)
+    if sanitizer_mode == SANITIZE_BLEACH:
+        import bleach
+        return sanitizer_mode + ':' + bleach.__version__
+    return sanitizer_mode
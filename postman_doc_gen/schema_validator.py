@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+from constants import *
+
+_validators = {}
+_lock = threading.Lock()
+
+
+def schema_path() -> str:
+    """
+    Returns the path of the bundled postman collection schema (2.1.0)
+    :return: absolute path of the schema file
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(root, POSTMAN_SCHEMA_DIR, POSTMAN_JSON_SCHEMA)
+
+
+def schema_hash(schema_bytes: bytes, definition: str = None) -> str:
+    """
+    Hashes the schema together with the fastjsonschema version, since the generated code depends on both
+    :param schema_bytes: raw contents of the schema file
+    :param definition: [Optional] the schema definition validated instead of the whole schema
+    :return: hex digest used to key the cached validator
+    """
+    import fastjsonschema
+    digest = hashlib.sha256(schema_bytes)
+    digest.update(fastjsonschema.VERSION.encode('utf-8'))
+    digest.update(b'use_default=False')
+    if definition is not None:
+        digest.update(definition.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def definition_schema(schema: dict, definition: str) -> dict:
+    """
+    Builds a schema validating a single definition of the given schema, e.g. one collection item
+    :param schema: the json schema
+    :param definition: the name of the definition
+    :return: the derived json schema
+    """
+    derived = {key: value for key, value in schema.items() if key in ('$schema', 'id', 'definitions')}
+    derived['$ref'] = '#/definitions/' + definition
+    return derived
+
+
+def cached_module_path(schema_filename: str, digest: str) -> str:
+    """
+    Path of the generated validator module saved next to the schema
+    :param schema_filename: the schema file path
+    :param digest: the schema hash
+    :return: path of the generated python module
+    """
+    base = os.path.splitext(schema_filename)[0]
+    return base + VALIDATOR_MODULE_SUFFIX.format(digest)
+
+
+def load_validator_module(module_filename: str):
+    """
+    Loads a validator module generated by fastjsonschema.compile_to_code
+    :param module_filename: path of the generated module
+    :return: the validate function, or None if the module could not be loaded
+    """
+    try:
+        with open(module_filename, 'r', encoding='utf-8') as f:
+            code = f.read()
+    except OSError:
+        return None
+
+    entry = re.search(r'^def (\w+)\(', code, re.MULTILINE)
+    if entry is None:
+        return None
+
+    namespace = {}
+    exec(compile(code, module_filename, 'exec'), namespace)
+    return namespace[entry.group(1)]
+
+
+def save_validator_module(schema: dict, module_filename: str) -> bool:
+    """
+    Generates the validator code for the schema and writes it to disk
+    :param schema: the json schema
+    :param module_filename: destination of the generated module
+    :return: True if the module was written
+    """
+    import fastjsonschema
+    code = fastjsonschema.compile_to_code(schema, use_default=False)
+    tmp_filename = module_filename + '.tmp' + str(os.getpid())
+    try:
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            f.write(code)
+        os.replace(tmp_filename, module_filename)
+    except OSError:
+        # the schema directory can be read only, e.g. inside an installed package
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        return False
+    return True
+
+
+def get_validator(schema_filename: str = None, persist: bool = False, definition: str = None):
+    """
+    Returns a compiled validator for the schema. The validator is compiled once per process and, if a generated
+    module for the same schema hash exists next to the schema, it is loaded instead of being compiled.
+    Schema defaults are not filled into the validated document, so a validated and a skipped collection are equal.
+    :param schema_filename: [Optional] the schema file path, defaults to the bundled postman schema
+    :param persist: [Optional] save the generated validator module next to the schema for later runs
+    :param definition: [Optional] validate a single definition of the schema instead of a whole document
+    :return: the validate function
+    """
+    if schema_filename is None:
+        schema_filename = schema_path()
+
+    with open(schema_filename, 'rb') as f:
+        schema_bytes = f.read()
+    digest = schema_hash(schema_bytes, definition)
+
+    with _lock:
+        validator = _validators.get(digest)
+        if validator is not None:
+            return validator
+
+        module_filename = cached_module_path(schema_filename, digest)
+        validator = load_validator_module(module_filename)
+
+        if validator is None:
+            schema = json.loads(schema_bytes.decode('utf-8'))
+            if definition is not None:
+                schema = definition_schema(schema, definition)
+            if persist and save_validator_module(schema, module_filename):
+                validator = load_validator_module(module_filename)
+            if validator is None:
+                import fastjsonschema
+                validator = fastjsonschema.compile(schema, use_default=False)
+
+        _validators[digest] = validator
+        return validator
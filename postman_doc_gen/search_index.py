@@ -0,0 +1,95 @@
+import json
+import os
+import re
+import threading
+
+from constants import *
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class SearchIndex:
+    """
+    An inverted index of the apis, built while the collection is read and loaded by the page when the search box is
+    used. The apis are numbered in the order they are added, so every posting list is already sorted and is written
+    as the gaps between the numbers, which keeps the file small for large collections.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.docs = []
+        self.postings = dict()
+
+    def add(self, api, item: json):
+        """
+        Indexes the name, method, url, parameter keys and description of the api
+        :param api: the APIModel of the item, with its id and name
+        :param item: json node representing an api
+        """
+        request = item.get(REQUEST, {})
+        if not isinstance(request, dict):
+            request = {}
+        url = request.get(URL, None)
+        raw_url = url.get(RAW, None) if isinstance(url, dict) else url
+
+        texts = [api.name, request.get(METHOD, None), raw_url, SearchIndex.description_text(request)]
+        if isinstance(url, dict):
+            texts.extend(SearchIndex.keys(url.get(QUERY, None)))
+            texts.extend(SearchIndex.keys(url.get(PATH_VARIABLE, None)))
+        body = request.get(BODY, None)
+        if isinstance(body, dict) and body.get(RAW, None) is None:
+            texts.extend(SearchIndex.keys(body.get(body.get(MODE, ''), None)))
+
+        doc = len(self.docs)
+        self.docs.append([api.id, api.name, request.get(METHOD, None)])
+        for token in SearchIndex.tokens(texts):
+            self.postings.setdefault(token, []).append(doc)
+
+    @staticmethod
+    def description_text(request: json) -> str:
+        description = request.get(DESCRIPTION, None)
+        if isinstance(description, dict):
+            description = description.get(CONTENT, None)
+        return description if isinstance(description, str) else None
+
+    @staticmethod
+    def keys(key_values) -> list:
+        if not isinstance(key_values, list):
+            return []
+        return [key_value.get(KEY, None) for key_value in key_values if isinstance(key_value, dict)]
+
+    @staticmethod
+    def tokens(texts: list) -> set:
+        """
+        :param texts: list of strings, None values are skipped
+        :return: the distinct lower case words of the texts
+        """
+        tokens = set()
+        for text in texts:
+            if not isinstance(text, str):
+                continue
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                if SEARCH_TOKEN_MIN_LENGTH <= len(token) <= SEARCH_TOKEN_MAX_LENGTH:
+                    tokens.add(token)
+        return tokens
+
+    def to_json(self) -> dict:
+        terms = dict()
+        for token, docs in self.postings.items():
+            terms[token] = [docs[0]] + [docs[i] - docs[i - 1] for i in range(1, len(docs))]
+        return {SEARCH_DOCS: self.docs, SEARCH_TERMS: terms}
+
+    def write(self, output_dir: str) -> str:
+        """
+        Writes the index as a script passing it to the page, so it can also be loaded by a page opened from disk
+        :param output_dir: the output directory
+        :return: the path of the index file
+        """
+        file_name = os.path.join(output_dir, SEARCH_INDEX_FILE_NAME)
+        tmp_file_name = file_name + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+        with open(tmp_file_name, 'w', encoding='utf-8') as f:
+            f.write(SEARCH_INDEX_CALLBACK + '(')
+            json.dump(self.to_json(), f, separators=(',', ':'), sort_keys=True)
+            f.write(');\n')
+        os.replace(tmp_file_name, file_name)
+        return file_name
@@ -0,0 +1,393 @@
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote
+
+from constants import *
+
+# the css and js published with --hashed-assets, e.g. css/main.3f9a1c2b.min.css
+HASHED_ASSET_PATTERN = re.compile(r'\.[0-9a-f]{' + str(ASSET_HASH_LENGTH) + r'}\.')
+
+
+def accepted_encodings(header: str) -> set:
+    """
+    :param header: the Accept-Encoding header, or None
+    :return: the content codings the client accepts
+    """
+    encodings = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.partition(';')
+        name, _, quality = params.strip().partition('=')
+        try:
+            accepted = name.strip() != 'q' or float(quality) > 0
+        except ValueError:
+            accepted = False
+        if accepted and coding.strip() != '':
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+def byte_range(header: str, size: int) -> tuple:
+    """
+    Reads a Range header, only single byte ranges are served, the whole file is sent for the others
+    :param header: the Range header
+    :param size: the size of the file
+    :return: the first and last byte of the range, or None to send the whole file
+    :raise ValueError: if the range is outside of the file
+    """
+    unit, _, spec = header.partition('=')
+    first, dash, last = spec.strip().partition('-')
+    if unit.strip() != 'bytes' or dash != '-' or not (first == '' or first.isdigit()) or \
+            not (last == '' or last.isdigit()) or first == last == '':
+        # several or malformed ranges
+        return None
+    if first == '':
+        # the last bytes of the file
+        if int(last) == 0:
+            raise ValueError('Empty range')
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last != '' else size - 1
+    if start >= size or start > end:
+        raise ValueError('Range outside of the file')
+    return start, end
+
+
+class DocumentServer(ThreadingHTTPServer):
+    """
+    Serves an output directory. Every response has a strong ETag, the hash of the file sent, and the css and js with
+    a hashed name as well as the body files, which are named after their content, are cached forever by the
+    browsers; the other files are revalidated. The .br and .gz copies written by --precompress are sent to the
+    clients accepting them as long as the record of the Precompressor lists them for the current content of the
+    file, and single byte ranges are supported. Every request reads the build published at the
+    time, so a page and its files come from one build while a new one is generated with --publish.
+    """
+    daemon_threads = True
+
+    def __init__(self, root: str, address: tuple = (SERVE_HOST, SERVE_PORT), log_requests: bool = True):
+        """
+        :param root: the directory to serve, e.g. the output directory
+        :param address: [Optional] the host and port to listen on, port 0 picks a free port
+        :param log_requests: [Optional] print every request to stderr
+        """
+        self.root = root
+        self.log_requests = log_requests
+        # file path -> ((mtime, size, inode), sha256)
+        self.digests = {}
+        # record file path -> ((mtime, size, inode), record of the Precompressor)
+        self.records = {}
+        self.lock = threading.Lock()
+        super().__init__(address, DocumentRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return 'http://' + host + ':' + str(port) + '/'
+
+    def digest(self, file_name: str, stat: os.stat_result) -> str:
+        """
+        :param file_name: a file served
+        :param stat: its stat result
+        :return: the sha256 of its content, hashed once for as long as the file does not change
+        """
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self.lock:
+            cached = self.digests.get(file_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(file_name, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        with self.lock:
+            self.digests[file_name] = (key, digest.hexdigest())
+        return digest.hexdigest()
+
+    def etag(self, file_name: str, stat: os.stat_result) -> str:
+        """
+        :param file_name: the file sent
+        :param stat: its stat result
+        :return: the strong ETag of its content
+        """
+        return '"' + self.digest(file_name, stat)[:ETAG_LENGTH] + '"'
+
+    def load_record(self, record_file: str) -> dict:
+        """
+        :param record_file: the record of the compressed files written by the Precompressor
+        :return: the signature of every compressed file, read once for as long as the record does not change
+        """
+        try:
+            stat = os.stat(record_file)
+        except OSError:
+            return {}
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self.lock:
+            cached = self.records.get(record_file)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(record_file, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            record = {}
+        with self.lock:
+            self.records[record_file] = (key, record)
+        return record
+
+    def compressed_formats(self, root: str, file_name: str) -> list:
+        """
+        A copy found next to a file is not enough, it may have been left by an earlier run: only the copies recorded
+        for the current content of the file are served
+        :param root: the directory served
+        :param file_name: a file under it
+        :return: the formats of the compressed copies of the file, in the order they are preferred
+        """
+        directory = os.path.dirname(file_name)
+        while not os.path.isfile(os.path.join(directory, COMPRESSION_RECORD_FILE_NAME)):
+            if directory == root or os.path.dirname(directory) == directory:
+                return []
+            directory = os.path.dirname(directory)
+        path = os.path.relpath(file_name, directory).replace(os.sep, '/')
+        signature = self.load_record(os.path.join(directory, COMPRESSION_RECORD_FILE_NAME)).get(path)
+        if signature is None:
+            return []
+        digest, *formats = signature.split(':')
+        try:
+            if digest != self.digest(file_name, os.stat(file_name)):
+                return []
+        except OSError:
+            return []
+        # the formats are recorded with their level, e.g. gzip9
+        formats = [compression_format.rstrip('0123456789') for compression_format in formats]
+        return [compression_format for compression_format in SERVE_ENCODINGS if compression_format in formats and
+                os.path.isfile(file_name + COMPRESSION_EXTENSIONS[compression_format])]
+
+    @staticmethod
+    def cache_control(path: str) -> str:
+        """
+        :param path: the url path of the file
+        :return: the Cache-Control header of the file
+        """
+        if path.startswith(BODIES_DIR + '/') or HASHED_ASSET_PATTERN.search(posixpath.basename(path)) is not None:
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+
+class DocumentRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'postman_doc_gen/' + VERSION
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_document(True)
+
+    def do_HEAD(self):
+        self.send_document(False)
+
+    def log_message(self, format, *args):
+        if self.server.log_requests:
+            super().log_message(format, *args)
+
+    def resolve(self, root: str) -> str:
+        """
+        :param root: the directory served
+        :return: the file or directory of the url, None for the hidden files (the caches of the generator)
+        """
+        parts = [part for part in posixpath.normpath(unquote(urlsplit(self.path).path)).split('/')
+                 if part not in ['', '.']]
+        for part in parts:
+            if part.startswith('.') or os.sep in part or (os.altsep is not None and os.altsep in part):
+                return None
+        return os.path.join(root, *parts)
+
+    def send_document(self, send_body: bool):
+        root = os.path.realpath(self.server.root)
+        file_name = self.resolve(root)
+        url_path = urlsplit(self.path).path
+        if file_name is not None and os.path.isdir(file_name):
+            if not url_path.endswith('/'):
+                # the relative links of the page are resolved against its directory
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', url_path + '/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            file_name = os.path.join(file_name, OUTPUT_FILE_NAME)
+        if file_name is None or not os.path.isfile(file_name):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        path = os.path.relpath(file_name, root).replace(os.sep, '/')
+
+        content_type, _ = mimetypes.guess_type(file_name)
+        if content_type is None:
+            content_type = 'application/octet-stream'
+        elif content_type.startswith('text/') or content_type.endswith('javascript'):
+            content_type = content_type + '; charset=utf-8'
+
+        # ranges are served from the file itself, not its compressed copies
+        range_header = self.headers.get('Range')
+        variants = self.server.compressed_formats(root, file_name)
+        encoding = None
+        if range_header is None:
+            accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+            encoding = next((variant for variant in variants if variant in accepted), None)
+        if encoding is not None:
+            file_name = file_name + COMPRESSION_EXTENSIONS[encoding]
+
+        try:
+            f = open(file_name, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            etag = self.server.etag(file_name, stat)
+            headers = [('ETag', etag), ('Cache-Control', DocumentServer.cache_control(path)),
+                       ('Accept-Ranges', 'bytes')]
+            if len(variants) > 0:
+                headers.append(('Vary', 'Accept-Encoding'))
+
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match is not None and \
+                    any(tag.strip() in ['*', etag, 'W/' + etag] for tag in if_none_match.split(',')):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                for header in headers:
+                    self.send_header(*header)
+                self.end_headers()
+                return
+
+            start, end = 0, stat.st_size - 1
+            status = HTTPStatus.OK
+            if range_header is not None and self.headers.get('If-Range', etag) == etag:
+                try:
+                    requested = byte_range(range_header, stat.st_size)
+                except ValueError:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header('Content-Range', 'bytes */' + str(stat.st_size))
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if requested is not None:
+                    start, end = requested
+                    status = HTTPStatus.PARTIAL_CONTENT
+                    headers.append(('Content-Range', 'bytes {}-{}/{}'.format(start, end, stat.st_size)))
+
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            if encoding is not None:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(end - start + 1))
+            for header in headers:
+                self.send_header(*header)
+            self.end_headers()
+            if send_body:
+                self.copy_range(f, start, end - start + 1)
+
+    def copy_range(self, f, start: int, length: int):
+        f.seek(start)
+        try:
+            while length > 0:
+                chunk = f.read(min(OUTPUT_BUFFER_SIZE, length))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                length = length - len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client went away, e.g. it only needed the first bytes
+            pass
+
+
+class SourceWatcher:
+    """
+    Regenerates the documentation when the collection or environment file changes. The files are polled, so no
+    dependency is needed, and every build is published with --publish: the previous build is served until the new
+    one is complete, and it stays published when the new one fails. The generator is kept for all the builds, so
+    the converted descriptions, templates, schema validator and the caches of the published build stay warm.
+    """
+
+    def __init__(self, generator, collection_file_name: str, environment_file_name: str = None,
+                 output_dir: str = None, download_enabled: bool = False, interval: float = WATCH_INTERVAL):
+        """
+        :param generator: the DocumentGenerator, publishing its builds
+        :param collection_file_name: the postman collection json
+        :param environment_file_name: [Optional] the postman environment json
+        :param output_dir: [Optional] the output directory
+        :param download_enabled: [Optional] enable the download links
+        :param interval: [Optional] the number of seconds between two checks of the files
+        """
+        super().__init__()
+        self.generator = generator
+        self.collection_file_name = collection_file_name
+        self.environment_file_name = environment_file_name
+        self.output_dir = output_dir
+        self.download_enabled = download_enabled
+        self.interval = interval
+        self.files = [file_name for file_name in [collection_file_name, environment_file_name]
+                      if file_name is not None]
+        self.signature = self.read_signature()
+        self.builds = 0
+        self.error = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def read_signature(self) -> list:
+        signature = []
+        for file_name in self.files:
+            try:
+                stat = os.stat(file_name)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return signature
+
+    def generate(self) -> bool:
+        """
+        Builds and publishes the documentation
+        :return: True if it was published, the error is kept in error otherwise
+        """
+        try:
+            self.generator.generate_doc(self.collection_file_name, self.environment_file_name, self.output_dir,
+                                        self.download_enabled)
+        except Exception as e:
+            # e.g. a collection saved halfway, the next change is built again
+            self.error = e
+            print('Regeneration failed, the previous build is still served: ' + str(e), file=sys.stderr)
+            return False
+        self.builds = self.builds + 1
+        self.error = None
+        return True
+
+    def check(self) -> bool:
+        """
+        Regenerates the documentation if the files changed since the last check
+        :return: True if a new build was published
+        """
+        signature = self.read_signature()
+        if signature == self.signature:
+            return False
+        # read before the build, so a change made while building is built again
+        self.signature = signature
+        return self.generate()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name='source_watcher', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
@@ -0,0 +1,80 @@
+import os
+
+from constants import *
+from models import ShardModel
+
+
+class ShardWriter:
+    """
+    Writes the rendered api sections to shard files instead of the page. Shards always hold consecutive apis, so the
+    page only needs the first api id of every shard to find the one holding an api.
+    """
+
+    def __init__(self, output_dir: str, api_template, shard_mode: str = SHARD_ENDPOINT,
+                 shard_size: int = SHARD_SIZE_KB):
+        """
+        :param output_dir: the output directory, the shards are written to its shards folder
+        :param api_template: the JINJA 2 template of an api section
+        :param shard_mode: [Optional] a shard per endpoint, per top level folder or per shard_size KB
+        :param shard_size: [Optional] the size of a shard in KB (utf-8 encoded) when sharding by size
+        """
+        super().__init__()
+        if shard_mode not in SHARD_MODES or shard_mode == SHARD_NONE:
+            raise ValueError('Unknown shard mode: ' + str(shard_mode))
+        self.shards_dir = os.path.join(output_dir, SHARDS_DIR)
+        self.api_template = api_template
+        self.shard_mode = shard_mode
+        self.shard_size = shard_size * 1024
+        self.shards = []
+        self.current_file = None
+        self.current_size = 0
+        self.current_group = None
+
+    def write(self, api_info):
+        """
+        Renders the apis into the shard files
+        :param api_info: iterable of APIModel
+        :return: the list of ShardModel written
+        """
+        os.makedirs(self.shards_dir, exist_ok=True)
+        for file_name in os.listdir(self.shards_dir):
+            # shards of a previous run
+            os.remove(os.path.join(self.shards_dir, file_name))
+
+        try:
+            for api in api_info:
+                self.add(api)
+        finally:
+            self.close()
+        return self.shards
+
+    def add(self, api):
+        fragment = api.fragment if api.fragment is not None else self.api_template.render(api=api)
+        # the size of the fragment and its new line in the file, only measured when sharding by size
+        size = len(fragment.encode('utf-8')) + 1 if self.shard_mode == SHARD_SIZE else 0
+
+        if self.current_file is None or self.starts_new_shard(api, size):
+            self.close()
+            shard = ShardModel(SHARDS_DIR + '/' + SHARD_FILE_NAME.format(len(self.shards) + 1), api.id)
+            self.shards.append(shard)
+            self.current_file = open(os.path.join(self.shards_dir, os.path.basename(shard.file_name)), 'w',
+                                     encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+            self.current_size = 0
+            self.current_group = api.group
+
+        self.current_file.write(fragment)
+        self.current_file.write('\n')
+        self.current_size = self.current_size + size
+        self.shards[-1].api_count = self.shards[-1].api_count + 1
+
+    def starts_new_shard(self, api, size: int) -> bool:
+        if self.shard_mode == SHARD_ENDPOINT:
+            return True
+        if self.shard_mode == SHARD_FOLDER:
+            return api.group != self.current_group
+        return self.current_size + size > self.shard_size
+
+    def close(self):
+        if self.current_file is not None:
+            self.current_file.close()
+            self.current_file = None
@@ -0,0 +1,34 @@
+import json
+import os
+import threading
+
+from constants import *
+
+# characters escaped so the json can be put in a script tag as is
+SCRIPT_ESCAPES = {ord('<'): '\\u003c', ord('>'): '\\u003e', ord('&'): '\\u0026',
+                  0x2028: '\\u2028', 0x2029: '\\u2029'}
+
+
+def tree_json(side_tree: list) -> str:
+    """
+    Serializes the sidebar tree for the page
+    :param side_tree: the list of folder and request nodes
+    :return: the compact json of the tree, safe to put in a script tag
+    """
+    return json.dumps(side_tree, separators=(',', ':'), ensure_ascii=False).translate(SCRIPT_ESCAPES)
+
+
+def write_tree(output_dir: str, side_tree: list) -> str:
+    """
+    Writes the sidebar tree as a script passing it to the page, so the page itself stays small and it can still be
+    loaded by a page opened from disk
+    :param output_dir: the output directory
+    :param side_tree: the list of folder and request nodes
+    :return: the path of the tree file
+    """
+    file_name = os.path.join(output_dir, SIDE_TREE_FILE_NAME)
+    tmp_file_name = file_name + '.tmp' + str(os.getpid()) + '_' + str(threading.get_ident())
+    with open(tmp_file_name, 'w', encoding='utf-8') as f:
+        f.write(SIDE_TREE_CALLBACK + '(' + tree_json(side_tree) + ');\n')
+    os.replace(tmp_file_name, file_name)
+    return file_name
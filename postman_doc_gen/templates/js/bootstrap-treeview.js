@@ -60,6 +60,14 @@
 		multiSelect: false,
 		showMethod: false,
 
+		// with lazyLoad, the nodes of a collapsed node are set up when it is first expanded, and the data is used
+		// as is instead of copied. Methods looking through all the nodes (search...) only see the nodes set up.
+		lazyLoad: false,
+		// above this number of visible rows, only the rows in view (and overscan rows around them) are rendered
+		virtualizeAbove: 0,
+		overscan: 20,
+		// the element scrolling the tree, the window is used otherwise
+		scrollParent: undefined,
 
 		// Event handlers
 		onNodeChecked: undefined,
@@ -157,7 +165,7 @@
 			if (typeof options.data === 'string') {
 				options.data = $.parseJSON(options.data);
 			}
-			this.tree = $.extend(true, [], options.data);
+			this.tree = options.lazyLoad ? options.data : $.extend(true, [], options.data);
 			delete options.data;
 		}
 		this.options = $.extend({}, _default.settings, options);
@@ -201,6 +209,12 @@
 		this.$element.off('nodeUnselected');
 		this.$element.off('searchComplete');
 		this.$element.off('searchCleared');
+
+		if (this.renderRowsHandler) {
+			$(window).off('scroll resize', this.renderRowsHandler);
+			this.$scrollParent.off('scroll', this.renderRowsHandler);
+			this.renderRowsHandler = null;
+		}
 	};
 
 	Tree.prototype.subscribeEvents = function () {
@@ -248,6 +262,13 @@
 		if (typeof (this.options.onSearchCleared) === 'function') {
 			this.$element.on('searchCleared', this.options.onSearchCleared);
 		}
+
+		if (this.options.virtualizeAbove > 0) {
+			this.renderRowsHandler = $.proxy(this.renderRows, this);
+			this.$scrollParent = $(this.options.scrollParent);
+			$(window).on('scroll resize', this.renderRowsHandler);
+			this.$scrollParent.on('scroll', this.renderRowsHandler);
+		}
 	};
 
 	/*
@@ -307,11 +328,17 @@
 			}
 
 			// index nodes in a flattened structure for use later
+			node.level = level;
 			_this.nodes.push(node);
 
-			// recurse child nodes and transverse the tree
+			// recurse child nodes and transverse the tree, unless they are set up on expand
 			if (node.nodes) {
-				_this.setInitialStates(node, level);
+				if (_this.options.lazyLoad && !node.state.expanded) {
+					node.lazyNodes = true;
+				}
+				else {
+					_this.setInitialStates(node, level);
+				}
 			}
 		});
 	};
@@ -367,11 +394,16 @@
 
 	Tree.prototype.setExpandedState = function (node, state, options) {
 
-		if (state === node.state.expanded) return;
+		// a node not set up yet (see lazyLoad) is collapsed
+		if (!node.state || state === node.state.expanded) return;
 
 		if (state && node.nodes) {
 
-			// Expand a node
+			// Expand a node, setting up its child nodes the first time
+			if (node.lazyNodes) {
+				node.lazyNodes = false;
+				this.setInitialStates(node, node.level);
+			}
 			node.state.expanded = true;
 			if (!options.silent) {
 				this.$element.trigger('nodeExpanded', $.extend(true, {}, node));
@@ -494,142 +526,203 @@
 
 			this.injectStyle();
 
+			this.$element.empty().append(this.$wrapper);
 			this.initialized = true;
 		}
 
-		this.$element.empty().append(this.$wrapper.empty());
+		// List the visible nodes
+		this.rows = [];
+		this.buildRows(this.tree);
+
+		this.virtualized = this.options.virtualizeAbove > 0 && this.rows.length > this.options.virtualizeAbove;
+		this.$element.toggleClass('virtualized', this.virtualized);
+		if (this.virtualized) {
+			this.firstRow = this.lastRow = -1;
+			this.renderRows();
+			return;
+		}
 
 		// Build tree
-		this.buildTree(this.tree, 0);
+		var items = $.map(this.rows, $.proxy(function (node) {
+			return this.buildItem(node)[0];
+		}, this));
+		this.$wrapper.empty().css({ paddingTop: '', paddingBottom: '' }).append(items);
 	};
 
 	// Starting from the root node, and recursing down the
-	// structure we build the tree one node at a time
-	Tree.prototype.buildTree = function (nodes, level) {
+	// structure we list the nodes shown, in order
+	Tree.prototype.buildRows = function (nodes) {
 
 		if (!nodes) return;
-		level += 1;
 
-		var _this = this;
-		$.each(nodes, function addNodes(id, node) {
-
-			var treeItem = $(_this.template.item)
-				.addClass('node-' + _this.elementId)
-				.addClass(node.state.checked ? 'node-checked' : '')
-				.addClass(node.state.disabled ? 'node-disabled': '')
-				.addClass(node.state.selected ? 'node-selected' : '')
-				.addClass(node.searchResult ? 'search-result' : '') 
-				.attr('data-nodeid', node.nodeId)
-				.attr('style', _this.buildStyleOverride(node));
-
-			// Add indent/spacer to mimic tree structure
-			for (var i = 0; i < (level - 1); i++) {
-				treeItem.append(_this.template.indent);
-			}
+		for (var i = 0; i < nodes.length; i++) {
+			var node = nodes[i];
+			this.rows.push(node);
 
-			// Add expand, collapse or empty spacer icons
-			var classList = [];
-			if (node.nodes) {
-				classList.push('expand-icon');
-				if (node.state.expanded) {
-					classList.push(_this.options.collapseIcon);
-				}
-				else {
-					classList.push(_this.options.expandIcon);
-				}
-			}
-			else {
-				classList.push(_this.options.emptyIcon);
+			// Recursively add child nodes
+			if (node.nodes && node.state.expanded && !node.state.disabled) {
+				this.buildRows(node.nodes);
 			}
+		}
+	};
 
-			treeItem
-				.append($(_this.template.icon)
-					.addClass(classList.join(' '))
-				);
+	// Renders the rows of a virtualized tree in view of the scroll parent, the rows above and below are
+	// replaced by padding. The rows are kept on one line, so they all have the height of the first one.
+	Tree.prototype.renderRows = function () {
 
+		if (!this.virtualized) return;
 
-			// Add node icon
-			if (_this.options.showIcon) {
-				
-				var classList = ['node-icon'];
+		if (!this.rowHeight) {
+			var firstItem = this.buildItem(this.rows[0]);
+			this.$wrapper.empty().css({ paddingTop: 0, paddingBottom: 0 }).append(firstItem);
+			this.rowHeight = firstItem.outerHeight(true);
+			if (!this.rowHeight) {
+				// the tree is hidden, its rows are rendered once it is shown and scrolled or resized
+				return;
+			}
+		}
 
-				classList.push(node.icon || _this.options.nodeIcon);
-				if (node.state.selected) {
-					classList.pop();
-					classList.push(node.selectedIcon || _this.options.selectedIcon || 
-									node.icon || _this.options.nodeIcon);
-				}
+		var top = 0;
+		var bottom = window.innerHeight;
+		if (this.$scrollParent.length) {
+			var bounds = this.$scrollParent[0].getBoundingClientRect();
+			top = Math.max(top, bounds.top);
+			bottom = Math.min(bottom, bounds.bottom);
+		}
+		var offset = this.$wrapper[0].getBoundingClientRect().top;
+		var count = this.rows.length;
+		var first = Math.min(count, Math.max(0, Math.floor((top - offset) / this.rowHeight) - this.options.overscan));
+		var last = Math.min(count, Math.max(first, Math.ceil((bottom - offset) / this.rowHeight) + this.options.overscan));
+		if (first === this.firstRow && last === this.lastRow) return;
+		this.firstRow = first;
+		this.lastRow = last;
+
+		var items = [];
+		for (var i = first; i < last; i++) {
+			items.push(this.buildItem(this.rows[i])[0]);
+		}
+		this.$wrapper.empty().css({
+			paddingTop: first * this.rowHeight,
+			paddingBottom: (count - last) * this.rowHeight
+		}).append(items);
+	};
 
-				treeItem
-					.append($(_this.template.icon)
-						.addClass(classList.join(' '))
-					);
+	// Builds the list item of a node
+	Tree.prototype.buildItem = function (node) {
+
+		var _this = this;
+		var level = node.level;
+
+		var treeItem = $(_this.template.item)
+			.addClass('node-' + _this.elementId)
+			.addClass(node.state.checked ? 'node-checked' : '')
+			.addClass(node.state.disabled ? 'node-disabled': '')
+			.addClass(node.state.selected ? 'node-selected' : '')
+			.addClass(node.searchResult ? 'search-result' : '') 
+			.attr('data-nodeid', node.nodeId)
+			.attr('style', _this.buildStyleOverride(node));
+
+		// Add indent/spacer to mimic tree structure
+		for (var i = 0; i < (level - 1); i++) {
+			treeItem.append(_this.template.indent);
+		}
+
+		// Add expand, collapse or empty spacer icons
+		var classList = [];
+		if (node.nodes) {
+			classList.push('expand-icon');
+			if (node.state.expanded) {
+				classList.push(_this.options.collapseIcon);
 			}
+			else {
+				classList.push(_this.options.expandIcon);
+			}
+		}
+		else {
+			classList.push(_this.options.emptyIcon);
+		}
 
-			// Add node method
-			if (_this.options.showMethod) {
+		treeItem
+			.append($(_this.template.icon)
+				.addClass(classList.join(' '))
+			);
 
-				var classList = ['method'];
 
-				classList.push(node.method || '');
+		// Add node icon
+		if (_this.options.showIcon) {
+			
+			var classList = ['node-icon'];
 
-				treeItem
-					.append($(_this.template.method)
-						.addClass(classList.join(' '))
-						.append(node.method)
-					);
+			classList.push(node.icon || _this.options.nodeIcon);
+			if (node.state.selected) {
+				classList.pop();
+				classList.push(node.selectedIcon || _this.options.selectedIcon || 
+								node.icon || _this.options.nodeIcon);
 			}
 
-			// Add check / unchecked icon
-			if (_this.options.showCheckbox) {
+			treeItem
+				.append($(_this.template.icon)
+					.addClass(classList.join(' '))
+				);
+		}
 
-				var classList = ['check-icon'];
-				if (node.state.checked) {
-					classList.push(_this.options.checkedIcon); 
-				}
-				else {
-					classList.push(_this.options.uncheckedIcon);
-				}
+		// Add node method
+		if (_this.options.showMethod) {
 
-				treeItem
-					.append($(_this.template.icon)
-						.addClass(classList.join(' '))
-					);
-			}
+			var classList = ['method'];
 
-			// Add text
-			if (_this.options.enableLinks) {
-				// Add hyperlink
-				treeItem
-					.append($(_this.template.link)
-						.attr('href', node.href)
-						.append(node.text)
-					);
+			classList.push(node.method || '');
+
+			treeItem
+				.append($(_this.template.method)
+					.addClass(classList.join(' '))
+					.append(node.method)
+				);
+		}
+
+		// Add check / unchecked icon
+		if (_this.options.showCheckbox) {
+
+			var classList = ['check-icon'];
+			if (node.state.checked) {
+				classList.push(_this.options.checkedIcon); 
 			}
 			else {
-				// otherwise just text
-				treeItem
-					.append(node.text);
+				classList.push(_this.options.uncheckedIcon);
 			}
 
-			// Add tags as badges
-			if (_this.options.showTags && node.tags) {
-				$.each(node.tags, function addTag(id, tag) {
-					treeItem
-						.append($(_this.template.badge)
-							.append(tag)
-						);
-				});
-			}
+			treeItem
+				.append($(_this.template.icon)
+					.addClass(classList.join(' '))
+				);
+		}
+
+		// Add text
+		if (_this.options.enableLinks) {
+			// Add hyperlink
+			treeItem
+				.append($(_this.template.link)
+					.attr('href', node.href)
+					.append(node.text)
+				);
+		}
+		else {
+			// otherwise just text
+			treeItem
+				.append(node.text);
+		}
 
-			// Add item to the tree
-			_this.$wrapper.append(treeItem);
+		// Add tags as badges
+		if (_this.options.showTags && node.tags) {
+			$.each(node.tags, function addTag(id, tag) {
+				treeItem
+					.append($(_this.template.badge)
+						.append(tag)
+					);
+			});
+		}
 
-			// Recursively add child ndoes
-			if (node.nodes && node.state.expanded && !node.state.disabled) {
-				return _this.buildTree(node.nodes, level);
-			}
-		});
+		return treeItem;
 	};
 
 	// Define any node level style override for
@@ -712,7 +805,7 @@
 		method: '<span class="method"></span>'
 	};
 
-	Tree.prototype.css = '.treeview .list-group-item{cursor:pointer}.treeview span.indent{margin-left:10px;margin-right:10px}.treeview span.icon{width:12px;margin-right:10px}.treeview .node-disabled{color:silver;cursor:not-allowed}'
+	Tree.prototype.css = '.treeview .list-group-item{cursor:pointer}.treeview span.indent{margin-left:10px;margin-right:10px}.treeview span.icon{width:12px;margin-right:10px}.treeview .node-disabled{color:silver;cursor:not-allowed}.treeview.virtualized .list-group-item{white-space:nowrap;overflow:hidden;text-overflow:ellipsis}'
 
 
 	/**
@@ -1 +1,75 @@
-!function(e,t,o,s){"use strict";var n={settings:{injectStyle:!0,levels:2,expandIcon:"glyphicon glyphicon-plus",collapseIcon:"glyphicon glyphicon-minus",emptyIcon:"glyphicon",nodeIcon:"",selectedIcon:"",checkedIcon:"glyphicon glyphicon-check",uncheckedIcon:"glyphicon glyphicon-unchecked",color:void 0,backColor:void 0,borderColor:void 0,onhoverColor:"#F5F5F5",selectedColor:"#FFFFFF",selectedBackColor:"#428bca",searchResultColor:"#D9534F",searchResultBackColor:void 0,enableLinks:!1,highlightSelected:!0,highlightSearchResults:!0,showBorder:!0,showIcon:!0,showCheckbox:!1,showTags:!1,multiSelect:!1,showMethod:!1,onNodeChecked:void 0,onNodeCollapsed:void 0,onNodeDisabled:void 0,onNodeEnabled:void 0,onNodeExpanded:void 0,onNodeSelected:void 0,onNodeUnchecked:void 0,onNodeUnselected:void 0,onSearchComplete:void 0,onSearchCleared:void 0},options:{silent:!1,ignoreChildren:!1},searchOptions:{ignoreCase:!0,exactMatch:!1,revealResults:!0}},i=function(t,o){return this.$element=e(t),this.elementId=t.id,this.styleId=this.elementId+"-style",this.init(o),{options:this.options,init:e.proxy(this.init,this),remove:e.proxy(this.remove,this),getNode:e.proxy(this.getNode,this),getParent:e.proxy(this.getParent,this),getSiblings:e.proxy(this.getSiblings,this),getSelected:e.proxy(this.getSelected,this),getUnselected:e.proxy(this.getUnselected,this),getExpanded:e.proxy(this.getExpanded,this),getCollapsed:e.proxy(this.getCollapsed,this),getChecked:e.proxy(this.getChecked,this),getUnchecked:e.proxy(this.getUnchecked,this),getDisabled:e.proxy(this.getDisabled,this),getEnabled:e.proxy(this.getEnabled,this),selectNode:e.proxy(this.selectNode,this),unselectNode:e.proxy(this.unselectNode,this),toggleNodeSelected:e.proxy(this.toggleNodeSelected,this),collapseAll:e.proxy(this.collapseAll,this),collapseNode:e.proxy(this.collapseNode,this),expandAll:e.proxy(this.expandAll,this),expandNode:e.proxy(this.expandNode,this),toggleNodeExpanded:e.proxy(this.toggleNodeExpanded,this),revealNode:e.proxy(this.revealNode,this),checkAll:e.proxy(this.checkAll,this),checkNode:e.proxy(this.checkNode,this),uncheckAll:e.proxy(this.uncheckAll,this),uncheckNode:e.proxy(this.uncheckNode,this),toggleNodeChecked:e.proxy(this.toggleNodeChecked,this),disableAll:e.proxy(this.disableAll,this),disableNode:e.proxy(this.disableNode,this),enableAll:e.proxy(this.enableAll,this),enableNode:e.proxy(this.enableNode,this),toggleNodeDisabled:e.proxy(this.toggleNodeDisabled,this),search:e.proxy(this.search,this),clearSearch:e.proxy(this.clearSearch,this)}};i.prototype.init=function(t){this.tree=[],this.nodes=[],t.data&&("string"==typeof t.data&&(t.data=e.parseJSON(t.data)),this.tree=e.extend(!0,[],t.data),delete t.data),this.options=e.extend({},n.settings,t),this.destroy(),this.subscribeEvents(),this.setInitialStates({nodes:this.tree},0),this.render()},i.prototype.remove=function(){this.destroy(),e.removeData(this,"treeview"),e("#"+this.styleId).remove()},i.prototype.destroy=function(){this.initialized&&(this.$wrapper.remove(),this.$wrapper=null,this.unsubscribeEvents(),this.initialized=!1)},i.prototype.unsubscribeEvents=function(){this.$element.off("click"),this.$element.off("nodeChecked"),this.$element.off("nodeCollapsed"),this.$element.off("nodeDisabled"),this.$element.off("nodeEnabled"),this.$element.off("nodeExpanded"),this.$element.off("nodeSelected"),this.$element.off("nodeUnchecked"),this.$element.off("nodeUnselected"),this.$element.off("searchComplete"),this.$element.off("searchCleared")},i.prototype.subscribeEvents=function(){this.unsubscribeEvents(),this.$element.on("click",e.proxy(this.clickHandler,this)),"function"==typeof this.options.onNodeChecked&&this.$element.on("nodeChecked",this.options.onNodeChecked),"function"==typeof this.options.onNodeCollapsed&&this.$element.on("nodeCollapsed",this.options.onNodeCollapsed),"function"==typeof this.options.onNodeDisabled&&this.$element.on("nodeDisabled",this.options.onNodeDisabled),"function"==typeof this.options.onNodeEnabled&&this.$element.on("nodeEnabled",this.options.onNodeEnabled),"function"==typeof this.options.onNodeExpanded&&this.$element.on("nodeExpanded",this.options.onNodeExpanded),"function"==typeof this.options.onNodeSelected&&this.$element.on("nodeSelected",this.options.onNodeSelected),"function"==typeof this.options.onNodeUnchecked&&this.$element.on("nodeUnchecked",this.options.onNodeUnchecked),"function"==typeof this.options.onNodeUnselected&&this.$element.on("nodeUnselected",this.options.onNodeUnselected),"function"==typeof this.options.onSearchComplete&&this.$element.on("searchComplete",this.options.onSearchComplete),"function"==typeof this.options.onSearchCleared&&this.$element.on("searchCleared",this.options.onSearchCleared)},i.prototype.setInitialStates=function(t,o){if(t.nodes){o+=1;var s=t,n=this;e.each(t.nodes,function(e,t){t.nodeId=n.nodes.length,t.parentId=s.nodeId,t.hasOwnProperty("selectable")||(t.selectable=!0),t.state=t.state||{},t.state.hasOwnProperty("checked")||(t.state.checked=!1),t.state.hasOwnProperty("disabled")||(t.state.disabled=!1),t.state.hasOwnProperty("expanded")||(!t.state.disabled&&o<n.options.levels&&t.nodes&&t.nodes.length>0?t.state.expanded=!0:t.state.expanded=!1),t.state.hasOwnProperty("selected")||(t.state.selected=!1),n.nodes.push(t),t.nodes&&n.setInitialStates(t,o)})}},i.prototype.clickHandler=function(t){this.options.enableLinks||t.preventDefault();var o=e(t.target),s=this.findNode(o);if(s&&!s.state.disabled){var i=o.attr("class")?o.attr("class").split(" "):[];-1!==i.indexOf("expand-icon")?(this.toggleExpandedState(s,n.options),this.render()):-1!==i.indexOf("check-icon")?(this.toggleCheckedState(s,n.options),this.render()):(s.selectable?this.toggleSelectedState(s,n.options):this.toggleExpandedState(s,n.options),this.render())}},i.prototype.findNode=function(e){var t=e.closest("li.list-group-item").attr("data-nodeid"),o=this.nodes[t];return o||console.log("Error: node does not exist"),o},i.prototype.toggleExpandedState=function(e,t){e&&this.setExpandedState(e,!e.state.expanded,t)},i.prototype.setExpandedState=function(t,o,s){o!==t.state.expanded&&(o&&t.nodes?(t.state.expanded=!0,s.silent||this.$element.trigger("nodeExpanded",e.extend(!0,{},t))):o||(t.state.expanded=!1,s.silent||this.$element.trigger("nodeCollapsed",e.extend(!0,{},t)),t.nodes&&!s.ignoreChildren&&e.each(t.nodes,e.proxy(function(e,t){this.setExpandedState(t,!1,s)},this))))},i.prototype.toggleSelectedState=function(e,t){e&&this.setSelectedState(e,!e.state.selected,t)},i.prototype.setSelectedState=function(t,o,s){o!==t.state.selected&&(o?(this.options.multiSelect||e.each(this.findNodes("true","g","state.selected"),e.proxy(function(e,t){this.setSelectedState(t,!1,s)},this)),t.state.selected=!0,s.silent||this.$element.trigger("nodeSelected",e.extend(!0,{},t))):(t.state.selected=!1,s.silent||this.$element.trigger("nodeUnselected",e.extend(!0,{},t))))},i.prototype.toggleCheckedState=function(e,t){e&&this.setCheckedState(e,!e.state.checked,t)},i.prototype.setCheckedState=function(t,o,s){o!==t.state.checked&&(o?(t.state.checked=!0,s.silent||this.$element.trigger("nodeChecked",e.extend(!0,{},t))):(t.state.checked=!1,s.silent||this.$element.trigger("nodeUnchecked",e.extend(!0,{},t))))},i.prototype.setDisabledState=function(t,o,s){o!==t.state.disabled&&(o?(t.state.disabled=!0,this.setExpandedState(t,!1,s),this.setSelectedState(t,!1,s),this.setCheckedState(t,!1,s),s.silent||this.$element.trigger("nodeDisabled",e.extend(!0,{},t))):(t.state.disabled=!1,s.silent||this.$element.trigger("nodeEnabled",e.extend(!0,{},t))))},i.prototype.render=function(){this.initialized||(this.$element.addClass("treeview"),this.$wrapper=e(this.template.list),this.injectStyle(),this.initialized=!0),this.$element.empty().append(this.$wrapper.empty()),this.buildTree(this.tree,0)},i.prototype.buildTree=function(t,o){if(t){o+=1;var s=this;e.each(t,function(t,n){for(var i=e(s.template.item).addClass("node-"+s.elementId).addClass(n.state.checked?"node-checked":"").addClass(n.state.disabled?"node-disabled":"").addClass(n.state.selected?"node-selected":"").addClass(n.searchResult?"search-result":"").attr("data-nodeid",n.nodeId).attr("style",s.buildStyleOverride(n)),d=0;d<o-1;d++)i.append(s.template.indent);var r=[];(n.nodes?(r.push("expand-icon"),n.state.expanded?r.push(s.options.collapseIcon):r.push(s.options.expandIcon)):r.push(s.options.emptyIcon),i.append(e(s.template.icon).addClass(r.join(" "))),s.options.showIcon)&&((r=["node-icon"]).push(n.icon||s.options.nodeIcon),n.state.selected&&(r.pop(),r.push(n.selectedIcon||s.options.selectedIcon||n.icon||s.options.nodeIcon)),i.append(e(s.template.icon).addClass(r.join(" "))));s.options.showMethod&&((r=["method"]).push(n.method||""),i.append(e(s.template.method).addClass(r.join(" ")).append(n.method)));if(s.options.showCheckbox){r=["check-icon"];n.state.checked?r.push(s.options.checkedIcon):r.push(s.options.uncheckedIcon),i.append(e(s.template.icon).addClass(r.join(" ")))}if(s.options.enableLinks?i.append(e(s.template.link).attr("href",n.href).append(n.text)):i.append(n.text),s.options.showTags&&n.tags&&e.each(n.tags,function(t,o){i.append(e(s.template.badge).append(o))}),s.$wrapper.append(i),n.nodes&&n.state.expanded&&!n.state.disabled)return s.buildTree(n.nodes,o)})}},i.prototype.buildStyleOverride=function(e){if(e.state.disabled)return"";var t=e.color,o=e.backColor;return this.options.highlightSelected&&e.state.selected&&(this.options.selectedColor&&(t=this.options.selectedColor),this.options.selectedBackColor&&(o=this.options.selectedBackColor)),this.options.highlightSearchResults&&e.searchResult&&!e.state.disabled&&(this.options.searchResultColor&&(t=this.options.searchResultColor),this.options.searchResultBackColor&&(o=this.options.searchResultBackColor)),"color:"+t+";background-color:"+o+";"},i.prototype.injectStyle=function(){this.options.injectStyle&&!o.getElementById(this.styleId)&&e('<style type="text/css" id="'+this.styleId+'"> '+this.buildStyle()+" </style>").appendTo("head")},i.prototype.buildStyle=function(){var e=".node-"+this.elementId+"{";return this.options.color&&(e+="color:"+this.options.color+";"),this.options.backColor&&(e+="background-color:"+this.options.backColor+";"),this.options.showBorder?this.options.borderColor&&(e+="border:1px solid "+this.options.borderColor+";"):e+="border:none;",e+="}",this.options.onhoverColor&&(e+=".node-"+this.elementId+":not(.node-disabled):hover{background-color:"+this.options.onhoverColor+";}"),this.css+e},i.prototype.template={list:'<ul class="list-group"></ul>',item:'<li class="list-group-item"></li>',indent:'<span class="indent"></span>',icon:'<span class="icon"></span>',link:'<a href="#" style="color:inherit;"></a>',badge:'<span class="badge"></span>',method:'<span class="method"></span>'},i.prototype.css=".treeview .list-group-item{cursor:pointer}.treeview span.indent{margin-left:10px;margin-right:10px}.treeview span.icon{width:12px;margin-right:10px}.treeview .node-disabled{color:silver;cursor:not-allowed}",i.prototype.getNode=function(e){return this.nodes[e]},i.prototype.getParent=function(e){var t=this.identifyNode(e);return this.nodes[t.parentId]},i.prototype.getSiblings=function(e){var t=this.identifyNode(e),o=this.getParent(t);return(o?o.nodes:this.tree).filter(function(e){return e.nodeId!==t.nodeId})},i.prototype.getSelected=function(){return this.findNodes("true","g","state.selected")},i.prototype.getUnselected=function(){return this.findNodes("false","g","state.selected")},i.prototype.getExpanded=function(){return this.findNodes("true","g","state.expanded")},i.prototype.getCollapsed=function(){return this.findNodes("false","g","state.expanded")},i.prototype.getChecked=function(){return this.findNodes("true","g","state.checked")},i.prototype.getUnchecked=function(){return this.findNodes("false","g","state.checked")},i.prototype.getDisabled=function(){return this.findNodes("true","g","state.disabled")},i.prototype.getEnabled=function(){return this.findNodes("false","g","state.disabled")},i.prototype.selectNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setSelectedState(e,!0,t)},this)),this.render()},i.prototype.unselectNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setSelectedState(e,!1,t)},this)),this.render()},i.prototype.toggleNodeSelected=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.toggleSelectedState(e,t)},this)),this.render()},i.prototype.collapseAll=function(t){var o=this.findNodes("true","g","state.expanded");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setExpandedState(e,!1,t)},this)),this.render()},i.prototype.collapseNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setExpandedState(e,!1,t)},this)),this.render()},i.prototype.expandAll=function(t){if((t=e.extend({},n.options,t))&&t.levels)this.expandLevels(this.tree,t.levels,t);else{var o=this.findNodes("false","g","state.expanded");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setExpandedState(e,!0,t)},this))}this.render()},i.prototype.expandNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setExpandedState(e,!0,t),e.nodes&&t&&t.levels&&this.expandLevels(e.nodes,t.levels-1,t)},this)),this.render()},i.prototype.expandLevels=function(t,o,s){s=e.extend({},n.options,s),e.each(t,e.proxy(function(e,t){this.setExpandedState(t,o>0,s),t.nodes&&this.expandLevels(t.nodes,o-1,s)},this))},i.prototype.revealNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){for(var o=this.getParent(e);o;)this.setExpandedState(o,!0,t),o=this.getParent(o)},this)),this.render()},i.prototype.toggleNodeExpanded=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.toggleExpandedState(e,t)},this)),this.render()},i.prototype.checkAll=function(t){var o=this.findNodes("false","g","state.checked");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setCheckedState(e,!0,t)},this)),this.render()},i.prototype.checkNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setCheckedState(e,!0,t)},this)),this.render()},i.prototype.uncheckAll=function(t){var o=this.findNodes("true","g","state.checked");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setCheckedState(e,!1,t)},this)),this.render()},i.prototype.uncheckNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setCheckedState(e,!1,t)},this)),this.render()},i.prototype.toggleNodeChecked=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.toggleCheckedState(e,t)},this)),this.render()},i.prototype.disableAll=function(t){var o=this.findNodes("false","g","state.disabled");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setDisabledState(e,!0,t)},this)),this.render()},i.prototype.disableNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setDisabledState(e,!0,t)},this)),this.render()},i.prototype.enableAll=function(t){var o=this.findNodes("true","g","state.disabled");this.forEachIdentifier(o,t,e.proxy(function(e,t){this.setDisabledState(e,!1,t)},this)),this.render()},i.prototype.enableNode=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setDisabledState(e,!1,t)},this)),this.render()},i.prototype.toggleNodeDisabled=function(t,o){this.forEachIdentifier(t,o,e.proxy(function(e,t){this.setDisabledState(e,!e.state.disabled,t)},this)),this.render()},i.prototype.forEachIdentifier=function(t,o,s){o=e.extend({},n.options,o),t instanceof Array||(t=[t]),e.each(t,e.proxy(function(e,t){s(this.identifyNode(t),o)},this))},i.prototype.identifyNode=function(e){return"number"==typeof e?this.nodes[e]:e},i.prototype.search=function(t,o){o=e.extend({},n.searchOptions,o),this.clearSearch({render:!1});var s=[];if(t&&t.length>0){o.exactMatch&&(t="^"+t+"$");var i="g";o.ignoreCase&&(i+="i"),s=this.findNodes(t,i),e.each(s,function(e,t){t.searchResult=!0})}return o.revealResults?this.revealNode(s):this.render(),this.$element.trigger("searchComplete",e.extend(!0,{},s)),s},i.prototype.clearSearch=function(t){t=e.extend({},{render:!0},t);var o=e.each(this.findNodes("true","g","searchResult"),function(e,t){t.searchResult=!1});t.render&&this.render(),this.$element.trigger("searchCleared",e.extend(!0,{},o))},i.prototype.findNodes=function(t,o,s){o=o||"g",s=s||"text";var n=this;return e.grep(this.nodes,function(e){var i=n.getNodeValue(e,s);if("string"==typeof i)return i.match(new RegExp(t,o))})},i.prototype.getNodeValue=function(e,t){var o=t.indexOf(".");if(o>0){var s=e[t.substring(0,o)],n=t.substring(o+1,t.length);return this.getNodeValue(s,n)}return e.hasOwnProperty(t)?e[t].toString():void 0};var d=function(e){t.console&&t.console.error(e)};e.fn.treeview=function(t,o){var s;return this.each(function(){var n=e.data(this,"treeview");"string"==typeof t?n?e.isFunction(n[t])&&"_"!==t.charAt(0)?(o instanceof Array||(o=[o]),s=n[t].apply(n,o)):d("No such method : "+t):d("Not initialized, can not call method : "+t):"boolean"==typeof t?s=n:e.data(this,"treeview",new i(this,e.extend(!0,{},t)))}),s||this}}(jQuery,window,document);
\ No newline at end of file
+;(function($,window,document,undefined){'use strict';var pluginName='treeview';var _default={};_default.settings={injectStyle:true,levels:2,expandIcon:'glyphicon glyphicon-plus',collapseIcon:'glyphicon glyphicon-minus',emptyIcon:'glyphicon',nodeIcon:'',selectedIcon:'',checkedIcon:'glyphicon glyphicon-check',uncheckedIcon:'glyphicon glyphicon-unchecked',color:undefined,backColor:undefined,borderColor:undefined,onhoverColor:'#F5F5F5',selectedColor:'#FFFFFF',selectedBackColor:'#428bca',searchResultColor:'#D9534F',searchResultBackColor:undefined,enableLinks:false,highlightSelected:true,highlightSearchResults:true,showBorder:true,showIcon:true,showCheckbox:false,showTags:false,multiSelect:false,showMethod:false,lazyLoad:false,virtualizeAbove:0,overscan:20,scrollParent:undefined,onNodeChecked:undefined,onNodeCollapsed:undefined,onNodeDisabled:undefined,onNodeEnabled:undefined,onNodeExpanded:undefined,onNodeSelected:undefined,onNodeUnchecked:undefined,onNodeUnselected:undefined,onSearchComplete:undefined,onSearchCleared:undefined};_default.options={silent:false,ignoreChildren:false};_default.searchOptions={ignoreCase:true,exactMatch:false,revealResults:true};var Tree=function(element,options){this.$element=$(element);this.elementId=element.id;this.styleId=this.elementId+'-style';this.init(options);return{options:this.options,init:$.proxy(this.init,this),remove:$.proxy(this.remove,this),getNode:$.proxy(this.getNode,this),getParent:$.proxy(this.getParent,this),getSiblings:$.proxy(this.getSiblings,this),getSelected:$.proxy(this.getSelected,this),getUnselected:$.proxy(this.getUnselected,this),getExpanded:$.proxy(this.getExpanded,this),getCollapsed:$.proxy(this.getCollapsed,this),getChecked:$.proxy(this.getChecked,this),getUnchecked:$.proxy(this.getUnchecked,this),getDisabled:$.proxy(this.getDisabled,this),getEnabled:$.proxy(this.getEnabled,this),selectNode:$.proxy(this.selectNode,this),unselectNode:$.proxy(this.unselectNode,this),toggleNodeSelected:$.proxy(this.toggleNodeSelected,this),collapseAll:$.proxy(this.collapseAll,this),collapseNode:$.proxy(this.collapseNode,this),expandAll:$.proxy(this.expandAll,this),expandNode:$.proxy(this.expandNode,this),toggleNodeExpanded:$.proxy(this.toggleNodeExpanded,this),revealNode:$.proxy(this.revealNode,this),checkAll:$.proxy(this.checkAll,this),checkNode:$.proxy(this.checkNode,this),uncheckAll:$.proxy(this.uncheckAll,this),uncheckNode:$.proxy(this.uncheckNode,this),toggleNodeChecked:$.proxy(this.toggleNodeChecked,this),disableAll:$.proxy(this.disableAll,this),disableNode:$.proxy(this.disableNode,this),enableAll:$.proxy(this.enableAll,this),enableNode:$.proxy(this.enableNode,this),toggleNodeDisabled:$.proxy(this.toggleNodeDisabled,this),search:$.proxy(this.search,this),clearSearch:$.proxy(this.clearSearch,this)};};Tree.prototype.init=function(options){this.tree=[];this.nodes=[];if(options.data){if(typeof options.data==='string'){options.data=$.parseJSON(options.data);}
+this.tree=options.lazyLoad?options.data:$.extend(true,[],options.data);delete options.data;}
+this.options=$.extend({},_default.settings,options);this.destroy();this.subscribeEvents();this.setInitialStates({nodes:this.tree},0);this.render();};Tree.prototype.remove=function(){this.destroy();$.removeData(this,pluginName);$('#'+this.styleId).remove();};Tree.prototype.destroy=function(){if(!this.initialized)return;this.$wrapper.remove();this.$wrapper=null;this.unsubscribeEvents();this.initialized=false;};Tree.prototype.unsubscribeEvents=function(){this.$element.off('click');this.$element.off('nodeChecked');this.$element.off('nodeCollapsed');this.$element.off('nodeDisabled');this.$element.off('nodeEnabled');this.$element.off('nodeExpanded');this.$element.off('nodeSelected');this.$element.off('nodeUnchecked');this.$element.off('nodeUnselected');this.$element.off('searchComplete');this.$element.off('searchCleared');if(this.renderRowsHandler){$(window).off('scroll resize',this.renderRowsHandler);this.$scrollParent.off('scroll',this.renderRowsHandler);this.renderRowsHandler=null;}};Tree.prototype.subscribeEvents=function(){this.unsubscribeEvents();this.$element.on('click',$.proxy(this.clickHandler,this));if(typeof(this.options.onNodeChecked)==='function'){this.$element.on('nodeChecked',this.options.onNodeChecked);}
+if(typeof(this.options.onNodeCollapsed)==='function'){this.$element.on('nodeCollapsed',this.options.onNodeCollapsed);}
+if(typeof(this.options.onNodeDisabled)==='function'){this.$element.on('nodeDisabled',this.options.onNodeDisabled);}
+if(typeof(this.options.onNodeEnabled)==='function'){this.$element.on('nodeEnabled',this.options.onNodeEnabled);}
+if(typeof(this.options.onNodeExpanded)==='function'){this.$element.on('nodeExpanded',this.options.onNodeExpanded);}
+if(typeof(this.options.onNodeSelected)==='function'){this.$element.on('nodeSelected',this.options.onNodeSelected);}
+if(typeof(this.options.onNodeUnchecked)==='function'){this.$element.on('nodeUnchecked',this.options.onNodeUnchecked);}
+if(typeof(this.options.onNodeUnselected)==='function'){this.$element.on('nodeUnselected',this.options.onNodeUnselected);}
+if(typeof(this.options.onSearchComplete)==='function'){this.$element.on('searchComplete',this.options.onSearchComplete);}
+if(typeof(this.options.onSearchCleared)==='function'){this.$element.on('searchCleared',this.options.onSearchCleared);}
+if(this.options.virtualizeAbove>0){this.renderRowsHandler=$.proxy(this.renderRows,this);this.$scrollParent=$(this.options.scrollParent);$(window).on('scroll resize',this.renderRowsHandler);this.$scrollParent.on('scroll',this.renderRowsHandler);}};Tree.prototype.setInitialStates=function(node,level){if(!node.nodes)return;level+=1;var parent=node;var _this=this;$.each(node.nodes,function checkStates(index,node){node.nodeId=_this.nodes.length;node.parentId=parent.nodeId;if(!node.hasOwnProperty('selectable')){node.selectable=true;}
+node.state=node.state||{};if(!node.state.hasOwnProperty('checked')){node.state.checked=false;}
+if(!node.state.hasOwnProperty('disabled')){node.state.disabled=false;}
+if(!node.state.hasOwnProperty('expanded')){if(!node.state.disabled&&(level<_this.options.levels)&&(node.nodes&&node.nodes.length>0)){node.state.expanded=true;}
+else{node.state.expanded=false;}}
+if(!node.state.hasOwnProperty('selected')){node.state.selected=false;}
+node.level=level;_this.nodes.push(node);if(node.nodes){if(_this.options.lazyLoad&&!node.state.expanded){node.lazyNodes=true;}
+else{_this.setInitialStates(node,level);}}});};Tree.prototype.clickHandler=function(event){if(!this.options.enableLinks)event.preventDefault();var target=$(event.target);var node=this.findNode(target);if(!node||node.state.disabled)return;var classList=target.attr('class')?target.attr('class').split(' '):[];if((classList.indexOf('expand-icon')!==-1)){this.toggleExpandedState(node,_default.options);this.render();}
+else if((classList.indexOf('check-icon')!==-1)){this.toggleCheckedState(node,_default.options);this.render();}
+else{if(node.selectable){this.toggleSelectedState(node,_default.options);}else{this.toggleExpandedState(node,_default.options);}
+this.render();}};Tree.prototype.findNode=function(target){var nodeId=target.closest('li.list-group-item').attr('data-nodeid');var node=this.nodes[nodeId];if(!node){console.log('Error: node does not exist');}
+return node;};Tree.prototype.toggleExpandedState=function(node,options){if(!node)return;this.setExpandedState(node,!node.state.expanded,options);};Tree.prototype.setExpandedState=function(node,state,options){if(!node.state||state===node.state.expanded)return;if(state&&node.nodes){if(node.lazyNodes){node.lazyNodes=false;this.setInitialStates(node,node.level);}
+node.state.expanded=true;if(!options.silent){this.$element.trigger('nodeExpanded',$.extend(true,{},node));}}
+else if(!state){node.state.expanded=false;if(!options.silent){this.$element.trigger('nodeCollapsed',$.extend(true,{},node));}
+if(node.nodes&&!options.ignoreChildren){$.each(node.nodes,$.proxy(function(index,node){this.setExpandedState(node,false,options);},this));}}};Tree.prototype.toggleSelectedState=function(node,options){if(!node)return;this.setSelectedState(node,!node.state.selected,options);};Tree.prototype.setSelectedState=function(node,state,options){if(state===node.state.selected)return;if(state){if(!this.options.multiSelect){$.each(this.findNodes('true','g','state.selected'),$.proxy(function(index,node){this.setSelectedState(node,false,options);},this));}
+node.state.selected=true;if(!options.silent){this.$element.trigger('nodeSelected',$.extend(true,{},node));}}
+else{node.state.selected=false;if(!options.silent){this.$element.trigger('nodeUnselected',$.extend(true,{},node));}}};Tree.prototype.toggleCheckedState=function(node,options){if(!node)return;this.setCheckedState(node,!node.state.checked,options);};Tree.prototype.setCheckedState=function(node,state,options){if(state===node.state.checked)return;if(state){node.state.checked=true;if(!options.silent){this.$element.trigger('nodeChecked',$.extend(true,{},node));}}
+else{node.state.checked=false;if(!options.silent){this.$element.trigger('nodeUnchecked',$.extend(true,{},node));}}};Tree.prototype.setDisabledState=function(node,state,options){if(state===node.state.disabled)return;if(state){node.state.disabled=true;this.setExpandedState(node,false,options);this.setSelectedState(node,false,options);this.setCheckedState(node,false,options);if(!options.silent){this.$element.trigger('nodeDisabled',$.extend(true,{},node));}}
+else{node.state.disabled=false;if(!options.silent){this.$element.trigger('nodeEnabled',$.extend(true,{},node));}}};Tree.prototype.render=function(){if(!this.initialized){this.$element.addClass(pluginName);this.$wrapper=$(this.template.list);this.injectStyle();this.$element.empty().append(this.$wrapper);this.initialized=true;}
+this.rows=[];this.buildRows(this.tree);this.virtualized=this.options.virtualizeAbove>0&&this.rows.length>this.options.virtualizeAbove;this.$element.toggleClass('virtualized',this.virtualized);if(this.virtualized){this.firstRow=this.lastRow=-1;this.renderRows();return;}
+var items=$.map(this.rows,$.proxy(function(node){return this.buildItem(node)[0];},this));this.$wrapper.empty().css({paddingTop:'',paddingBottom:''}).append(items);};Tree.prototype.buildRows=function(nodes){if(!nodes)return;for(var i=0;i<nodes.length;i++){var node=nodes[i];this.rows.push(node);if(node.nodes&&node.state.expanded&&!node.state.disabled){this.buildRows(node.nodes);}}};Tree.prototype.renderRows=function(){if(!this.virtualized)return;if(!this.rowHeight){var firstItem=this.buildItem(this.rows[0]);this.$wrapper.empty().css({paddingTop:0,paddingBottom:0}).append(firstItem);this.rowHeight=firstItem.outerHeight(true);if(!this.rowHeight){return;}}
+var top=0;var bottom=window.innerHeight;if(this.$scrollParent.length){var bounds=this.$scrollParent[0].getBoundingClientRect();top=Math.max(top,bounds.top);bottom=Math.min(bottom,bounds.bottom);}
+var offset=this.$wrapper[0].getBoundingClientRect().top;var count=this.rows.length;var first=Math.min(count,Math.max(0,Math.floor((top-offset)/this.rowHeight)-this.options.overscan));var last=Math.min(count,Math.max(first,Math.ceil((bottom-offset)/this.rowHeight)+this.options.overscan));if(first===this.firstRow&&last===this.lastRow)return;this.firstRow=first;this.lastRow=last;var items=[];for(var i=first;i<last;i++){items.push(this.buildItem(this.rows[i])[0]);}
+this.$wrapper.empty().css({paddingTop:first*this.rowHeight,paddingBottom:(count-last)*this.rowHeight}).append(items);};Tree.prototype.buildItem=function(node){var _this=this;var level=node.level;var treeItem=$(_this.template.item).addClass('node-'+_this.elementId).addClass(node.state.checked?'node-checked':'').addClass(node.state.disabled?'node-disabled':'').addClass(node.state.selected?'node-selected':'').addClass(node.searchResult?'search-result':'').attr('data-nodeid',node.nodeId).attr('style',_this.buildStyleOverride(node));for(var i=0;i<(level-1);i++){treeItem.append(_this.template.indent);}
+var classList=[];if(node.nodes){classList.push('expand-icon');if(node.state.expanded){classList.push(_this.options.collapseIcon);}
+else{classList.push(_this.options.expandIcon);}}
+else{classList.push(_this.options.emptyIcon);}
+treeItem.append($(_this.template.icon).addClass(classList.join(' ')));if(_this.options.showIcon){var classList=['node-icon'];classList.push(node.icon||_this.options.nodeIcon);if(node.state.selected){classList.pop();classList.push(node.selectedIcon||_this.options.selectedIcon||node.icon||_this.options.nodeIcon);}
+treeItem.append($(_this.template.icon).addClass(classList.join(' ')));}
+if(_this.options.showMethod){var classList=['method'];classList.push(node.method||'');treeItem.append($(_this.template.method).addClass(classList.join(' ')).append(node.method));}
+if(_this.options.showCheckbox){var classList=['check-icon'];if(node.state.checked){classList.push(_this.options.checkedIcon);}
+else{classList.push(_this.options.uncheckedIcon);}
+treeItem.append($(_this.template.icon).addClass(classList.join(' ')));}
+if(_this.options.enableLinks){treeItem.append($(_this.template.link).attr('href',node.href).append(node.text));}
+else{treeItem.append(node.text);}
+if(_this.options.showTags&&node.tags){$.each(node.tags,function addTag(id,tag){treeItem.append($(_this.template.badge).append(tag));});}
+return treeItem;};Tree.prototype.buildStyleOverride=function(node){if(node.state.disabled)return'';var color=node.color;var backColor=node.backColor;if(this.options.highlightSelected&&node.state.selected){if(this.options.selectedColor){color=this.options.selectedColor;}
+if(this.options.selectedBackColor){backColor=this.options.selectedBackColor;}}
+if(this.options.highlightSearchResults&&node.searchResult&&!node.state.disabled){if(this.options.searchResultColor){color=this.options.searchResultColor;}
+if(this.options.searchResultBackColor){backColor=this.options.searchResultBackColor;}}
+return'color:'+color+';background-color:'+backColor+';';};Tree.prototype.injectStyle=function(){if(this.options.injectStyle&&!document.getElementById(this.styleId)){$('<style type="text/css" id="'+this.styleId+'"> '+this.buildStyle()+' </style>').appendTo('head');}};Tree.prototype.buildStyle=function(){var style='.node-'+this.elementId+'{';if(this.options.color){style+='color:'+this.options.color+';';}
+if(this.options.backColor){style+='background-color:'+this.options.backColor+';';}
+if(!this.options.showBorder){style+='border:none;';}
+else if(this.options.borderColor){style+='border:1px solid '+this.options.borderColor+';';}
+style+='}';if(this.options.onhoverColor){style+='.node-'+this.elementId+':not(.node-disabled):hover{'+'background-color:'+this.options.onhoverColor+';'+'}';}
+return this.css+style;};Tree.prototype.template={list:'<ul class="list-group"></ul>',item:'<li class="list-group-item"></li>',indent:'<span class="indent"></span>',icon:'<span class="icon"></span>',link:'<a href="#" style="color:inherit;"></a>',badge:'<span class="badge"></span>',method:'<span class="method"></span>'};Tree.prototype.css='.treeview .list-group-item{cursor:pointer}.treeview span.indent{margin-left:10px;margin-right:10px}.treeview span.icon{width:12px;margin-right:10px}.treeview .node-disabled{color:silver;cursor:not-allowed}.treeview.virtualized .list-group-item{white-space:nowrap;overflow:hidden;text-overflow:ellipsis}'
+Tree.prototype.getNode=function(nodeId){return this.nodes[nodeId];};Tree.prototype.getParent=function(identifier){var node=this.identifyNode(identifier);return this.nodes[node.parentId];};Tree.prototype.getSiblings=function(identifier){var node=this.identifyNode(identifier);var parent=this.getParent(node);var nodes=parent?parent.nodes:this.tree;return nodes.filter(function(obj){return obj.nodeId!==node.nodeId;});};Tree.prototype.getSelected=function(){return this.findNodes('true','g','state.selected');};Tree.prototype.getUnselected=function(){return this.findNodes('false','g','state.selected');};Tree.prototype.getExpanded=function(){return this.findNodes('true','g','state.expanded');};Tree.prototype.getCollapsed=function(){return this.findNodes('false','g','state.expanded');};Tree.prototype.getChecked=function(){return this.findNodes('true','g','state.checked');};Tree.prototype.getUnchecked=function(){return this.findNodes('false','g','state.checked');};Tree.prototype.getDisabled=function(){return this.findNodes('true','g','state.disabled');};Tree.prototype.getEnabled=function(){return this.findNodes('false','g','state.disabled');};Tree.prototype.selectNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setSelectedState(node,true,options);},this));this.render();};Tree.prototype.unselectNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setSelectedState(node,false,options);},this));this.render();};Tree.prototype.toggleNodeSelected=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.toggleSelectedState(node,options);},this));this.render();};Tree.prototype.collapseAll=function(options){var identifiers=this.findNodes('true','g','state.expanded');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setExpandedState(node,false,options);},this));this.render();};Tree.prototype.collapseNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setExpandedState(node,false,options);},this));this.render();};Tree.prototype.expandAll=function(options){options=$.extend({},_default.options,options);if(options&&options.levels){this.expandLevels(this.tree,options.levels,options);}
+else{var identifiers=this.findNodes('false','g','state.expanded');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setExpandedState(node,true,options);},this));}
+this.render();};Tree.prototype.expandNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setExpandedState(node,true,options);if(node.nodes&&(options&&options.levels)){this.expandLevels(node.nodes,options.levels-1,options);}},this));this.render();};Tree.prototype.expandLevels=function(nodes,level,options){options=$.extend({},_default.options,options);$.each(nodes,$.proxy(function(index,node){this.setExpandedState(node,(level>0)?true:false,options);if(node.nodes){this.expandLevels(node.nodes,level-1,options);}},this));};Tree.prototype.revealNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){var parentNode=this.getParent(node);while(parentNode){this.setExpandedState(parentNode,true,options);parentNode=this.getParent(parentNode);};},this));this.render();};Tree.prototype.toggleNodeExpanded=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.toggleExpandedState(node,options);},this));this.render();};Tree.prototype.checkAll=function(options){var identifiers=this.findNodes('false','g','state.checked');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setCheckedState(node,true,options);},this));this.render();};Tree.prototype.checkNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setCheckedState(node,true,options);},this));this.render();};Tree.prototype.uncheckAll=function(options){var identifiers=this.findNodes('true','g','state.checked');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setCheckedState(node,false,options);},this));this.render();};Tree.prototype.uncheckNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setCheckedState(node,false,options);},this));this.render();};Tree.prototype.toggleNodeChecked=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.toggleCheckedState(node,options);},this));this.render();};Tree.prototype.disableAll=function(options){var identifiers=this.findNodes('false','g','state.disabled');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setDisabledState(node,true,options);},this));this.render();};Tree.prototype.disableNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setDisabledState(node,true,options);},this));this.render();};Tree.prototype.enableAll=function(options){var identifiers=this.findNodes('true','g','state.disabled');this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setDisabledState(node,false,options);},this));this.render();};Tree.prototype.enableNode=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setDisabledState(node,false,options);},this));this.render();};Tree.prototype.toggleNodeDisabled=function(identifiers,options){this.forEachIdentifier(identifiers,options,$.proxy(function(node,options){this.setDisabledState(node,!node.state.disabled,options);},this));this.render();};Tree.prototype.forEachIdentifier=function(identifiers,options,callback){options=$.extend({},_default.options,options);if(!(identifiers instanceof Array)){identifiers=[identifiers];}
+$.each(identifiers,$.proxy(function(index,identifier){callback(this.identifyNode(identifier),options);},this));};Tree.prototype.identifyNode=function(identifier){return((typeof identifier)==='number')?this.nodes[identifier]:identifier;};Tree.prototype.search=function(pattern,options){options=$.extend({},_default.searchOptions,options);this.clearSearch({render:false});var results=[];if(pattern&&pattern.length>0){if(options.exactMatch){pattern='^'+pattern+'$';}
+var modifier='g';if(options.ignoreCase){modifier+='i';}
+results=this.findNodes(pattern,modifier);$.each(results,function(index,node){node.searchResult=true;})}
+if(options.revealResults){this.revealNode(results);}
+else{this.render();}
+this.$element.trigger('searchComplete',$.extend(true,{},results));return results;};Tree.prototype.clearSearch=function(options){options=$.extend({},{render:true},options);var results=$.each(this.findNodes('true','g','searchResult'),function(index,node){node.searchResult=false;});if(options.render){this.render();}
+this.$element.trigger('searchCleared',$.extend(true,{},results));};Tree.prototype.findNodes=function(pattern,modifier,attribute){modifier=modifier||'g';attribute=attribute||'text';var _this=this;return $.grep(this.nodes,function(node){var val=_this.getNodeValue(node,attribute);if(typeof val==='string'){return val.match(new RegExp(pattern,modifier));}});};Tree.prototype.getNodeValue=function(obj,attr){var index=attr.indexOf('.');if(index>0){var _obj=obj[attr.substring(0,index)];var _attr=attr.substring(index+1,attr.length);return this.getNodeValue(_obj,_attr);}
+else{if(obj.hasOwnProperty(attr)){return obj[attr].toString();}
+else{return undefined;}}};var logError=function(message){if(window.console){window.console.error(message);}};$.fn[pluginName]=function(options,args){var result;this.each(function(){var _this=$.data(this,pluginName);if(typeof options==='string'){if(!_this){logError('Not initialized, can not call method : '+options);}
+else if(!$.isFunction(_this[options])||options.charAt(0)==='_'){logError('No such method : '+options);}
+else{if(!(args instanceof Array)){args=[args];}
+result=_this[options].apply(_this,args);}}
+else if(typeof options==='boolean'){result=_this;}
+else{$.data(this,pluginName,new Tree(this,$.extend(true,{},options)));}});return result||this;};})(jQuery,window,document);
\ No newline at end of file
@@ -38,13 +38,19 @@ jQuery(function ($) {
         $(".sidebar-content").mCustomScrollbar({
             axis: "y",
             autoHideScrollbar: true,
-            scrollInertia: 300
+            scrollInertia: 300,
+            callbacks: {
+                // the custom scroll bar does not fire scroll events, the sidebar tree renders the rows in view on them
+                whileScrolling: function () {
+                    $(".sidebar-content").triggerHandler("scroll");
+                }
+            }
         });
         $(".sidebar-content").addClass("desktop");
 
     }
 
-    $('.dropdown-menu li').click(function(){
+    $(document).on('click', '.dropdown-menu li', function(){
         $(this).parent().closest('div').find('.response-name-label').text($(this).text());
         var dataId= $(this).data('responseInfo');
         var requestId= $(this).data('requestInfo');
@@ -53,7 +59,7 @@ jQuery(function ($) {
         $(".formatted-requests[data-id=" + dataId + "]").show();
     });
 
-    $('.is-expandable').click(function () {
+    $(document).on('click', '.is-expandable', function () {
         var modal = $('#snippetModal');
         var current = $(this);
         $("#snippetModal .modal-header .title").empty().text(current.data('title'));
@@ -61,6 +67,22 @@ jQuery(function ($) {
         $("#snippetModal code").text($(this).text());
         modal.toggle('.modal-open');
         modal.show();
+
+        // a large body is only previewed in the page, the whole body is loaded from its file when expanded
+        modal.data('source', this);
+        if (current.data('bodyFile')) {
+            if (!current.data('loading')) {
+                // the page can hold the body (--body-mode page), else it is fetched from its file
+                var shared = $('template[data-body-file="' + current.data('bodyFile') + '"]');
+                current.data('loading', shared.length > 0 ? $.when(shared[0].content.textContent) :
+                    $.get(current.data('bodyFile'), null, null, 'text'));
+            }
+            current.data('loading').then(function (body) {
+                if (modal.data('source') === current[0]) {
+                    $("#snippetModal code").text('\n' + body);
+                }
+            });
+        }
     })
 
     $('.close').click(function () {
@@ -68,6 +90,127 @@ jQuery(function ($) {
         modal.toggle('.modal-open');
         modal.hide();
     })
+
+    // sharded output: the request sections are loaded from the shard files when navigated to
+    var shards = $('.shard').toArray();
+
+    function findShard(apiId) {
+        // shards hold consecutive apis and are ordered by their first api id
+        var low = 0, high = shards.length - 1, found = null;
+        while (low <= high) {
+            var mid = (low + high) >> 1;
+            if ($(shards[mid]).data('firstApi') <= apiId) {
+                found = shards[mid];
+                low = mid + 1;
+            } else {
+                high = mid - 1;
+            }
+        }
+        return found;
+    }
+
+    function loadShard(shard) {
+        var placeholder = $(shard);
+        if (!placeholder.data('loading')) {
+            placeholder.data('loading', $.get(placeholder.data('shardFile')).then(function (html) {
+                placeholder.html(html);
+            }));
+        }
+        return placeholder.data('loading');
+    }
+
+    function showSection() {
+        var apiId = parseInt(window.location.hash.substring(1), 10);
+        var shard = isNaN(apiId) ? shards[0] : findShard(apiId);
+        if (!shard) {
+            return;
+        }
+        loadShard(shard).then(function () {
+            var section = document.getElementById(String(apiId));
+            if (section) {
+                section.scrollIntoView();
+            }
+        });
+    }
+
+    if (shards.length > 0) {
+        $(window).on('hashchange', showSection);
+        showSection();
+    }
+
+    // search: the index is loaded from its script file the first time the search box is used
+    var search = $('#search');
+    var searchIndex = null;
+    var searchTerms = null;
+    var maxResults = 20;
+
+    window.loadSearchIndex = function (index) {
+        searchIndex = index;
+        searchTerms = Object.keys(index.terms);
+        showResults();
+    };
+
+    function searchTokens(text) {
+        return text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+    }
+
+    function matchingDocs(token) {
+        // a token matches the words starting with it, the posting lists hold the gaps between the api numbers
+        var docs = {};
+        searchTerms.forEach(function (term) {
+            if (term.lastIndexOf(token, 0) === 0) {
+                var gaps = searchIndex.terms[term], doc = 0;
+                for (var i = 0; i < gaps.length; i++) {
+                    doc += gaps[i];
+                    docs[doc] = true;
+                }
+            }
+        });
+        return docs;
+    }
+
+    function showResults() {
+        var results = $('#search-results').empty();
+        var tokens = searchTokens(search.val());
+        if (searchIndex === null || tokens.length === 0) {
+            return;
+        }
+        var matches = matchingDocs(tokens[0]);
+        tokens.slice(1).forEach(function (token) {
+            var docs = matchingDocs(token);
+            Object.keys(matches).forEach(function (doc) {
+                if (!docs[doc]) {
+                    delete matches[doc];
+                }
+            });
+        });
+
+        // the apis whose name contains every word come first, then the order of the collection
+        var docs = Object.keys(matches).map(function (doc) {
+            var name = String(searchIndex.docs[doc][1]).toLowerCase();
+            var inName = tokens.every(function (token) { return name.indexOf(token) >= 0; });
+            return {doc: searchIndex.docs[doc], rank: (inName ? 0 : searchIndex.docs.length) + parseInt(doc, 10)};
+        }).sort(function (a, b) { return a.rank - b.rank; });
+
+        docs.slice(0, maxResults).forEach(function (result) {
+            var link = $('<a class="list-group-item list-group-item-action py-1 px-2"></a>')
+                .attr('href', '#' + result.doc[0]);
+            if (result.doc[2]) {
+                link.append($('<span class="font-weight-bold mr-1"></span>').text(result.doc[2]));
+            }
+            results.append(link.append($('<span></span>').text(result.doc[1])));
+        });
+        if (docs.length === 0) {
+            results.append($('<div class="list-group-item py-1 px-2 text-muted">No results</div>'));
+        }
+    }
+
+    search.one('focus', function () {
+        var script = document.createElement('script');
+        script.src = search.data('indexFile');
+        document.head.appendChild(script);
+    });
+    search.on('input', showResults);
 });
 
 
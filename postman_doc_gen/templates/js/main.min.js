@@ -1 +1,17 @@
-jQuery(function(e){e("#toggle-sidebar").click(function(){e(".page-wrapper").toggleClass("toggled")}),e("#pin-sidebar").click(function(){e(".page-wrapper").hasClass("pinned")?(e(".page-wrapper").removeClass("pinned"),e("#sidebar").unbind("hover")):(e(".page-wrapper").addClass("pinned"),e("#sidebar").hover(function(){console.log("mouseenter"),e(".page-wrapper").addClass("sidebar-hovered")},function(){console.log("mouseout"),e(".page-wrapper").removeClass("sidebar-hovered")}))}),e("#overlay").click(function(){e(".page-wrapper").toggleClass("toggled")}),/Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent)||(e(".sidebar-content").mCustomScrollbar({axis:"y",autoHideScrollbar:!0,scrollInertia:300}),e(".sidebar-content").addClass("desktop")),e(".dropdown-menu li").click(function(){e(this).parent().closest("div").find(".response-name-label").text(e(this).text());var a=e(this).data("responseInfo"),t=e(this).data("requestInfo");e(".formatted-requests[data-request-id="+t+"]").hide(),e(".formatted-requests[data-id="+a+"]").show()}),e(".is-expandable").click(function(){var a=e("#snippetModal"),t=e(this);e("#snippetModal .modal-header .title").empty().text(t.data("title")),e("#snippetModal code").text(e(this).text()),a.toggle(".modal-open"),a.show()}),e(".close").click(function(){var a=e("#snippetModal");a.toggle(".modal-open"),a.hide()})});
\ No newline at end of file
+jQuery(function($){$("#toggle-sidebar").click(function(){$(".page-wrapper").toggleClass("toggled");});$("#pin-sidebar").click(function(){if($(".page-wrapper").hasClass("pinned")){$(".page-wrapper").removeClass("pinned");$("#sidebar").unbind("hover");}else{$(".page-wrapper").addClass("pinned");$("#sidebar").hover(function(){console.log("mouseenter");$(".page-wrapper").addClass("sidebar-hovered");},function(){console.log("mouseout");$(".page-wrapper").removeClass("sidebar-hovered");})}});$("#overlay").click(function(){$(".page-wrapper").toggleClass("toggled");});if(!/Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent)){$(".sidebar-content").mCustomScrollbar({axis:"y",autoHideScrollbar:true,scrollInertia:300,callbacks:{whileScrolling:function(){$(".sidebar-content").triggerHandler("scroll");}}});$(".sidebar-content").addClass("desktop");}
+$(document).on('click','.dropdown-menu li',function(){$(this).parent().closest('div').find('.response-name-label').text($(this).text());var dataId=$(this).data('responseInfo');var requestId=$(this).data('requestInfo');$(".formatted-requests[data-request-id="+requestId+"]").hide();$(".formatted-requests[data-id="+dataId+"]").show();});$(document).on('click','.is-expandable',function(){var modal=$('#snippetModal');var current=$(this);$("#snippetModal .modal-header .title").empty().text(current.data('title'));$("#snippetModal code").text($(this).text());modal.toggle('.modal-open');modal.show();modal.data('source',this);if(current.data('bodyFile')){if(!current.data('loading')){var shared=$('template[data-body-file="'+current.data('bodyFile')+'"]');current.data('loading',shared.length>0?$.when(shared[0].content.textContent):$.get(current.data('bodyFile'),null,null,'text'));}
+current.data('loading').then(function(body){if(modal.data('source')===current[0]){$("#snippetModal code").text('\n'+body);}});}})
+$('.close').click(function(){var modal=$('#snippetModal');modal.toggle('.modal-open');modal.hide();})
+var shards=$('.shard').toArray();function findShard(apiId){var low=0,high=shards.length-1,found=null;while(low<=high){var mid=(low+high)>>1;if($(shards[mid]).data('firstApi')<=apiId){found=shards[mid];low=mid+1;}else{high=mid-1;}}
+return found;}
+function loadShard(shard){var placeholder=$(shard);if(!placeholder.data('loading')){placeholder.data('loading',$.get(placeholder.data('shardFile')).then(function(html){placeholder.html(html);}));}
+return placeholder.data('loading');}
+function showSection(){var apiId=parseInt(window.location.hash.substring(1),10);var shard=isNaN(apiId)?shards[0]:findShard(apiId);if(!shard){return;}
+loadShard(shard).then(function(){var section=document.getElementById(String(apiId));if(section){section.scrollIntoView();}});}
+if(shards.length>0){$(window).on('hashchange',showSection);showSection();}
+var search=$('#search');var searchIndex=null;var searchTerms=null;var maxResults=20;window.loadSearchIndex=function(index){searchIndex=index;searchTerms=Object.keys(index.terms);showResults();};function searchTokens(text){return text.toLowerCase().match(/[\p{L}\p{N}_]+/gu)||[];}
+function matchingDocs(token){var docs={};searchTerms.forEach(function(term){if(term.lastIndexOf(token,0)===0){var gaps=searchIndex.terms[term],doc=0;for(var i=0;i<gaps.length;i++){doc+=gaps[i];docs[doc]=true;}}});return docs;}
+function showResults(){var results=$('#search-results').empty();var tokens=searchTokens(search.val());if(searchIndex===null||tokens.length===0){return;}
+var matches=matchingDocs(tokens[0]);tokens.slice(1).forEach(function(token){var docs=matchingDocs(token);Object.keys(matches).forEach(function(doc){if(!docs[doc]){delete matches[doc];}});});var docs=Object.keys(matches).map(function(doc){var name=String(searchIndex.docs[doc][1]).toLowerCase();var inName=tokens.every(function(token){return name.indexOf(token)>=0;});return{doc:searchIndex.docs[doc],rank:(inName?0:searchIndex.docs.length)+parseInt(doc,10)};}).sort(function(a,b){return a.rank-b.rank;});docs.slice(0,maxResults).forEach(function(result){var link=$('<a class="list-group-item list-group-item-action py-1 px-2"></a>').attr('href','#'+result.doc[0]);if(result.doc[2]){link.append($('<span class="font-weight-bold mr-1"></span>').text(result.doc[2]));}
+results.append(link.append($('<span></span>').text(result.doc[1])));});if(docs.length===0){results.append($('<div class="list-group-item py-1 px-2 text-muted">No results</div>'));}}
+search.one('focus',function(){var script=document.createElement('script');script.src=search.data('indexFile');document.head.appendChild(script);});search.on('input',showResults);});
\ No newline at end of file
@@ -21,4 +21,4 @@ setup(name='postman_doc_gen',
       zip_safe=False,
 
       setup_requires=['fastjsonschema>=2.14', 'Jinja2>=2.11', 'MarkupSafe>=1.1'],
-      python_requires='>=3.0')
+      python_requires='>=3.7')
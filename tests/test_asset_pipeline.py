@@ -0,0 +1,79 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from asset_pipeline import AssetPipeline
+from constants import OUTPUT_FILE_NAME, TEMPLATES_DIR
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+TEMPLATES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'postman_doc_gen', TEMPLATES_DIR)
+
+
+class AssetPipelineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, None, os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return generator, output_dir, f.read()
+
+    @staticmethod
+    def linked_assets(html):
+        return re.findall(r'(?:href|src)="([^":]+\.(?:css|js))"', html)
+
+    def test_only_referenced_files_are_copied(self):
+        generator, output_dir, html = self.generate('out')
+        linked = self.linked_assets(html)
+        self.assertIn('css/main.min.css', linked)
+        self.assertEqual(len(linked), len(generator.assets.copied))
+        for url in linked:
+            self.assertTrue(os.path.exists(os.path.join(output_dir, url)))
+        self.assertFalse(os.path.exists(os.path.join(output_dir, 'css', 'main.css')))
+
+    def test_unchanged_files_are_skipped(self):
+        self.generate('out')
+        main_css = os.path.join(self.temp_dir, 'out', 'css', 'main.min.css')
+        mtime = os.stat(main_css).st_mtime_ns
+        with open(os.path.join(self.temp_dir, 'out', 'js', 'main.min.js'), 'w', encoding='utf-8') as f:
+            f.write('// modified')
+
+        generator, _, _ = self.generate('out')
+        self.assertEqual([os.path.join(self.temp_dir, 'out', 'js', 'main.min.js')], generator.assets.copied)
+        self.assertEqual(mtime, os.stat(main_css).st_mtime_ns)
+
+    def test_hashed_names(self):
+        digest = AssetPipeline.file_hash(os.path.join(TEMPLATES, 'css', 'main.min.css'))
+        _, output_dir, html = self.generate('out', hashed_assets=True)
+        self.assertIn('css/main.' + digest[:8] + '.min.css', self.linked_assets(html))
+
+    def test_shared_assets(self):
+        assets_dir = os.path.join(self.temp_dir, 'assets')
+        first, output_dir, html = self.generate('first', hashed_assets=True, assets_dir=assets_dir)
+        second, _, second_html = self.generate('second', hashed_assets=True, assets_dir=assets_dir)
+
+        self.assertEqual(0, len(second.assets.copied))
+        for url in self.linked_assets(html):
+            self.assertTrue(url.startswith('../assets/'))
+            self.assertTrue(os.path.exists(os.path.join(output_dir, url)))
+        self.assertEqual(self.linked_assets(html), self.linked_assets(second_html))
+        self.assertFalse(os.path.exists(os.path.join(output_dir, 'css')))
+
+    def test_assets_url(self):
+        _, _, html = self.generate('out', assets_dir=os.path.join(self.temp_dir, 'assets'),
+                                   assets_url='https://cdn.example.com/docs/')
+        self.assertIn('https://cdn.example.com/docs/js/main.min.js', html)
+
+
+if __name__ == '__main__':
+    unittest.main()
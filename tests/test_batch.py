@@ -0,0 +1,92 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from batch import read_batch_jobs, run_batch, format_batch_summary
+from constants import OUTPUT_FILE_NAME
+from document_generator import DocumentGenerator
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class BatchTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collections_dir = os.path.join(self.temp_dir, 'collections')
+        os.makedirs(self.collections_dir)
+        for name in ['orders.postman_collection.json', 'users.json']:
+            shutil.copyfile(os.path.join(EXAMPLE_DIR, 'postman_collection.json'),
+                            os.path.join(self.collections_dir, name))
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+        self.out_dir = os.path.join(self.temp_dir, 'docs')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def read_output(output_dir):
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def expected_output(self, env_file):
+        output_dir = DocumentGenerator().generate_doc(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), env_file,
+                                                      os.path.join(self.temp_dir, 'expected'))
+        return self.read_output(output_dir)
+
+    def test_read_glob(self):
+        jobs = read_batch_jobs([os.path.join(self.collections_dir, '*.json')], out_dir=self.out_dir,
+                               env_file=self.env_file)
+        self.assertEqual([os.path.join(self.out_dir, 'orders'), os.path.join(self.out_dir, 'users')],
+                         [job.out for job in jobs])
+        self.assertEqual([self.env_file, self.env_file], [job.env for job in jobs])
+
+    def test_read_manifest(self):
+        manifest_file = os.path.join(self.temp_dir, 'batch.json')
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump([{'collection': 'collections/users.json', 'out': 'users_docs'},
+                       'collections/orders.postman_collection.json'], f)
+
+        jobs = read_batch_jobs(manifest_file=manifest_file, out_dir=self.out_dir)
+        self.assertEqual(os.path.join(self.temp_dir, 'collections/users.json'), jobs[0].collection)
+        self.assertEqual(os.path.join(self.temp_dir, 'users_docs'), jobs[0].out)
+        self.assertEqual(os.path.join(self.out_dir, 'orders'), jobs[1].out)
+        self.assertIsNone(jobs[1].env)
+
+    def test_same_output_directory(self):
+        shutil.copyfile(os.path.join(self.collections_dir, 'users.json'),
+                        os.path.join(self.collections_dir, 'users.postman_collection.json'))
+        with self.assertRaises(ValueError):
+            read_batch_jobs([os.path.join(self.collections_dir, '*.json')], out_dir=self.out_dir)
+
+    def test_run_batch(self):
+        jobs = read_batch_jobs([os.path.join(self.collections_dir, '*.json')], out_dir=self.out_dir,
+                               env_file=self.env_file)
+        # the environment of a collection does not leak into the next one
+        jobs[0].env = None
+        jobs = run_batch(jobs)
+
+        self.assertEqual(self.expected_output(None), self.read_output(jobs[0].out))
+        self.assertEqual(self.expected_output(self.env_file), self.read_output(jobs[1].out))
+        for job in jobs:
+            self.assertIsNone(job.error)
+            self.assertEqual(3, job.api_count)
+            self.assertIsNotNone(job.seconds)
+
+    def test_failed_collection(self):
+        with open(os.path.join(self.collections_dir, 'broken.json'), 'w', encoding='utf-8') as f:
+            f.write('{')
+        jobs = read_batch_jobs([os.path.join(self.collections_dir, '*.json')], out_dir=self.out_dir)
+        jobs = run_batch(jobs, workers=2)
+
+        self.assertIsNotNone(jobs[0].error)
+        self.assertIsNone(jobs[1].error)
+        self.assertIsNone(jobs[2].error)
+        self.assertTrue(os.path.exists(os.path.join(jobs[2].out, OUTPUT_FILE_NAME)))
+        self.assertIn('3 collections, 1 failed', format_batch_summary(jobs))
+
+
+if __name__ == '__main__':
+    unittest.main()
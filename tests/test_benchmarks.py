@@ -0,0 +1,61 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from document_generator import DocumentGenerator
+from model_memory import measure
+from run_benchmarks import STAGES, run_benchmarks, compare, collection_requests
+from synthetic_collection import SyntheticCollection, SyntheticConfig
+
+
+class BenchmarksTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_synthetic_collection(self):
+        config = SyntheticConfig(requests=23, depth=2, fan_out=3, examples=2)
+        synthetic = SyntheticCollection(config)
+        collection = synthetic.collection()
+        self.assertEqual(23, len(collection_requests(collection)))
+        self.assertEqual(collection, SyntheticCollection(config).collection())
+
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        env_file = os.path.join(self.temp_dir, 'environment.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+        with open(env_file, 'w', encoding='utf-8') as f:
+            json.dump(synthetic.environment(), f)
+
+        # a valid collection
+        generator = DocumentGenerator()
+        generator.generate_doc(collection_file, env_file, os.path.join(self.temp_dir, 'out'))
+        self.assertEqual(23, generator.api_id_counter)
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(SyntheticConfig(requests=5, examples=1), repeat=1)
+        self.assertEqual(STAGES, list(results['stages'].keys()))
+        self.assertEqual(5, results['counts']['requests'])
+        json.dumps(results)
+
+        lines, regressions = compare(results, results, 1.2)
+        self.assertEqual([], regressions)
+        self.assertEqual(len(STAGES) + 1, len(lines))
+
+    def test_model_memory(self):
+        results = measure(SyntheticConfig(requests=10, examples=2, headers=3))
+        self.assertEqual(10, results['models']['APIModel']['count'])
+        self.assertEqual(20, results['models']['APIExampleModel']['count'])
+        self.assertGreater(results['retained_bytes'], results['model_bytes'] / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from body_store import BodyStore
+from constants import OUTPUT_FILE_NAME, BODIES_DIR, BODY_PREVIEW_SUFFIX, COMPRESSION_GZIP
+from document_generator import DocumentGenerator
+from models import APIModel, APIExampleModel, GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class BodyStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            self.collection = json.load(f)
+        # a recorded response of a few KB on the first request
+        self.large_body = json.dumps([{'id': i, 'name': 'item <' + str(i) + '> & co'} for i in range(200)], indent=4)
+        self.collection['item'][0]['item'][0]['response'][0]['body'] = self.large_body
+        self.collection_file = self.write_collection(self.collection)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def write_collection(self, collection) -> str:
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+        return collection_file
+
+    def generate(self, output_name='out', **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, None, os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return output_dir, f.read()
+
+    @staticmethod
+    def body_files(output_dir) -> list:
+        return sorted(os.listdir(os.path.join(output_dir, BODIES_DIR)))
+
+    def test_store(self):
+        store = BodyStore(self.temp_dir, 1, 10)
+        self.assertIsNone(store.store('small body'))
+        file_name = store.store(self.large_body)
+        self.assertTrue(file_name.startswith(BODIES_DIR + '/'))
+        # the same body is written once
+        self.assertEqual(file_name, store.store(self.large_body))
+        with open(os.path.join(self.temp_dir, file_name), 'r', encoding='utf-8') as f:
+            self.assertEqual(self.large_body, f.read())
+        self.assertEqual(self.large_body[:10] + BODY_PREVIEW_SUFFIX, store.preview(self.large_body))
+        with self.assertRaises(ValueError):
+            BodyStore(self.temp_dir, None)
+
+    def test_threshold_bytes(self):
+        store = BodyStore(self.temp_dir, 1)
+        # 600 characters, 1200 bytes in utf-8
+        self.assertIsNotNone(store.store('\u00e9' * 600))
+        self.assertIsNone(store.store('e' * 1024))
+        self.assertIsNotNone(store.store('e' * 1025))
+        self.assertNotEqual(BodyStore.fingerprint(1, 100), BodyStore.fingerprint(1, 200))
+        self.assertNotEqual(BodyStore.fingerprint(None, 100), BodyStore.fingerprint(0, 100))
+
+    def test_reference(self):
+        store = BodyStore(self.temp_dir, 1)
+        api = APIModel()
+        example = APIExampleModel()
+        example.response_body_file = BODIES_DIR + '/0123456789abcdef.txt'
+        api.examples.append(example)
+        store.reference(api)
+
+        reused = APIModel()
+        reused.fragment = '<pre data-title="x" data-body-file="' + BODIES_DIR + '/fedcba9876543210.txt">'
+        store.reference(reused)
+        self.assertEqual({'0123456789abcdef.txt', 'fedcba9876543210.txt'}, store.referenced)
+
+    def test_generate_doc(self):
+        _, inline_html = self.generate('inline')
+        self.assertIn('item &lt;199&gt; &amp; co', inline_html)
+
+        output_dir, html = self.generate(body_threshold=1, body_preview=100)
+        self.assertNotIn('item &lt;199&gt; &amp; co', html)
+        self.assertIn('item &lt;0&gt; &amp; co', html)
+        file_names = re.findall(r'data-body-file="([^"]+)"', html)
+        self.assertEqual(1, len(file_names))
+        with open(os.path.join(output_dir, file_names[0]), 'r', encoding='utf-8') as f:
+            self.assertEqual(self.large_body, f.read())
+        # the other bodies stay in the page
+        self.assertEqual(inline_html.count('is-expandable'), html.count('is-expandable'))
+
+    def test_build_modes(self):
+        output_dir, expected = self.generate('serial', body_threshold=1)
+        expected_files = self.body_files(output_dir)
+        for name, options in [('streaming', {'streaming': True}), ('parallel', {'jobs': 2}),
+                              ('incremental', {'incremental': True})]:
+            output_dir, html = self.generate(name, body_threshold=1, **options)
+            self.assertEqual(expected, html, name)
+            self.assertEqual(expected_files, self.body_files(output_dir), name)
+
+        # the fragments reused by the second incremental run still use their body files
+        output_dir, html = self.generate('incremental', body_threshold=1, incremental=True)
+        self.assertEqual(expected, html)
+        self.assertEqual(expected_files, self.body_files(output_dir))
+
+    def test_remove_stale(self):
+        output_dir, _ = self.generate(body_threshold=1, precompress=[COMPRESSION_GZIP])
+        first_files = self.body_files(output_dir)
+        self.assertEqual(2, len(first_files))
+
+        self.collection['item'][0]['item'][0]['response'][0]['body'] = self.large_body.replace('item', 'entry')
+        self.collection_file = self.write_collection(self.collection)
+        output_dir, _ = self.generate(body_threshold=1, precompress=[COMPRESSION_GZIP])
+        second_files = self.body_files(output_dir)
+        self.assertEqual(2, len(second_files))
+        self.assertEqual(0, len(set(first_files) & set(second_files)))
+
+
+if __name__ == '__main__':
+    unittest.main()
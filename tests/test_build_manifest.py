@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from build_manifest import BuildManifest
+from constants import OUTPUT_FILE_NAME
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class BuildManifestTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(self.temp_dir, 'collection.json')
+        shutil.copyfile(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), self.collection_file)
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name, incremental=True):
+        generator = DocumentGenerator(GeneratorOptions(incremental=incremental))
+        output_dir = generator.generate_doc(self.collection_file, self.env_file,
+                                            os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return generator, f.read()
+
+    def rename_first_request(self, name):
+        with open(self.collection_file, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        node = collection
+        while node.get('item') is not None:
+            node = node['item'][0]
+        node['name'] = name
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+    def test_unchanged_items_are_reused(self):
+        generator, first_html = self.generate('out')
+        self.assertEqual(0, generator.manifest.reused)
+        total = generator.manifest.rebuilt
+
+        generator, second_html = self.generate('out')
+        self.assertEqual(total, generator.manifest.reused)
+        self.assertEqual(0, generator.manifest.rebuilt)
+        self.assertEqual(first_html, second_html)
+
+    def test_changed_item_is_rebuilt(self):
+        self.generate('out')
+        self.rename_first_request('Renamed request')
+
+        generator, incremental_html = self.generate('out')
+        self.assertEqual(1, generator.manifest.rebuilt)
+        self.assertIn('Renamed request', incremental_html)
+
+        _, full_html = self.generate('full', incremental=False)
+        self.assertEqual(full_html, incremental_html)
+
+    def test_outdated_manifest_is_ignored(self):
+        self.generate('out')
+        manifest = BuildManifest.load(os.path.join(self.temp_dir, 'out'), 'another fingerprint')
+        self.assertEqual({}, manifest.previous_items)
@@ -0,0 +1,96 @@
+import gc
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import OUTPUT_FILE_NAME
+from document_generator import DocumentGenerator
+from models import APIModel
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+THREADS = 8
+RUNS_PER_ROUND = 24
+
+
+class ConcurrentGenerationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+        # a second collection with other requests, to tell the documents apart
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        collection['item'] = collection['item'][:1]
+        collection['item'][0]['name'] = 'Only folder'
+        self.collections = [os.path.join(EXAMPLE_DIR, 'postman_collection.json'),
+                            os.path.join(self.temp_dir, 'small_collection.json')]
+        with open(self.collections[1], 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def read_output(output_dir):
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def generate(self, generator, run):
+        collection = self.collections[run % len(self.collections)]
+        output_dir = os.path.join(self.temp_dir, 'out_' + str(run % THREADS), str(run % len(self.collections)))
+        return run, self.read_output(generator.generate_doc(collection, self.env_file, output_dir))
+
+    def test_reused_generator(self):
+        generator = DocumentGenerator()
+        first_html = self.read_output(generator.generate_doc(self.collections[0], self.env_file,
+                                                             os.path.join(self.temp_dir, 'out')))
+        second_html = self.read_output(generator.generate_doc(self.collections[0], self.env_file,
+                                                              os.path.join(self.temp_dir, 'out')))
+        self.assertEqual(first_html, second_html)
+        self.assertEqual(3, len(generator.api_info))
+
+    def test_api_examples_are_not_shared(self):
+        api = APIModel()
+        api.examples.append('example')
+        self.assertEqual([], APIModel().examples)
+
+    def test_concurrent_runs(self):
+        expected = [self.read_output(DocumentGenerator().generate_doc(collection, self.env_file,
+                                                                      os.path.join(self.temp_dir, 'expected_' + str(i))))
+                    for i, collection in enumerate(self.collections)]
+        self.assertNotEqual(expected[0], expected[1])
+
+        generator = DocumentGenerator()
+
+        def run_round(first_run):
+            with ThreadPoolExecutor(THREADS) as executor:
+                for run, html in executor.map(lambda r: self.generate(generator, r),
+                                              range(first_run, first_run + RUNS_PER_ROUND)):
+                    self.assertEqual(expected[run % len(self.collections)], html)
+
+        # the first round warms up the caches (templates, validator, markdown)
+        run_round(0)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run_round(RUNS_PER_ROUND)
+            gc.collect()
+            after_one_round, _ = tracemalloc.get_traced_memory()
+            run_round(2 * RUNS_PER_ROUND)
+            run_round(3 * RUNS_PER_ROUND)
+            gc.collect()
+            after_three_rounds, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # nothing is kept from one run to the next
+        self.assertLess(after_three_rounds - after_one_round, 256 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import copy
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, BODY_PAGE, INTERN_BODY, INTERN_KEY_VALUES
+from content_interner import ContentInterner
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ContentInternerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            self.collection = json.load(f)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name='out', **options) -> str:
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump(self.collection, f)
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(collection_file, None, os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_intern(self):
+        interner = ContentInterner(100)
+        first = interner.intern(INTERN_BODY, 'body', lambda: ['built'])
+        self.assertIs(first, interner.intern(INTERN_BODY, 'body', lambda: ['built']))
+        # the same content of another kind is another value
+        self.assertIsNot(first, interner.intern(INTERN_KEY_VALUES, 'body', lambda: ['built']))
+        self.assertEqual(1, interner.hits)
+        self.assertEqual(2, interner.misses)
+
+    def test_eviction(self):
+        interner = ContentInterner(10)
+        interner.intern(INTERN_BODY, 'aaaa', lambda: 'a')
+        interner.intern(INTERN_BODY, 'bbbb', lambda: 'b')
+        # looking up the first value makes the second one the least recently used
+        interner.intern(INTERN_BODY, 'aaaa', lambda: 'a')
+        interner.intern(INTERN_BODY, 'cccc', lambda: 'c')
+        self.assertEqual(8, interner.size)
+        self.assertEqual('a', interner.intern(INTERN_BODY, 'aaaa', lambda: 'other'))
+        self.assertEqual('other', interner.intern(INTERN_BODY, 'bbbb', lambda: 'other'))
+
+        # values above the limit are not kept
+        interner.intern(INTERN_BODY, 'x' * 11, lambda: 'x')
+        self.assertLessEqual(interner.size, 10)
+
+        disabled = ContentInterner(0)
+        self.assertIsNot(disabled.intern(INTERN_BODY, 'body', list), disabled.intern(INTERN_BODY, 'body', list))
+        self.assertEqual(0, len(disabled.values))
+
+    def test_shared_key_values(self):
+        generator = DocumentGenerator()
+        generator.interner = ContentInterner()
+        item = copy.deepcopy(self.collection['item'][0]['item'][0])
+        item['request']['header'] = [{'key': 'Accept', 'value': 'application/json', 'type': 'text'}]
+        first = generator.get_api(item)
+        second = generator.get_api(copy.deepcopy(item))
+        self.assertIs(first.headers, second.headers)
+        self.assertIs(first.examples[0].response_body, second.examples[0].response_body)
+
+    def test_page_mode(self):
+        # the first two examples share their response body
+        html = self.generate(body_threshold=0, body_mode=BODY_PAGE)
+        templates = re.findall(r'<template data-body-file="([^"]+)">', html)
+        self.assertEqual(len(set(templates)), len(templates))
+        referenced = re.findall(r'<pre [^>]*data-body-file="([^"]+)"', html)
+        self.assertLess(len(set(referenced)), len(referenced))
+        self.assertEqual(sorted(set(referenced)), templates)
+
+    def test_build_modes(self):
+        expected = self.generate('serial', body_threshold=0, body_mode=BODY_PAGE)
+        for name, options in [('streaming', {'streaming': True}), ('parallel', {'jobs': 2}),
+                              ('incremental', {'incremental': True}), ('no-interning', {'intern_cache_size': 0})]:
+            self.assertEqual(expected, self.generate(name, body_threshold=0, body_mode=BODY_PAGE, **options), name)
+
+    def test_default_output(self):
+        self.assertEqual(self.generate('default'), self.generate('no-interning', intern_cache_size=0))
+        self.assertNotIn('<template', self.generate('file-mode', body_threshold=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
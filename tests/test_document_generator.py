@@ -1,8 +1,13 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
 import unittest
 
-from constants import RAW, URL_ENCODED
+import document_generator
+from constants import RAW, URL_ENCODED, TEMPLATES_DIR
 from document_generator import DocumentGenerator
-from models import APIModel, APIBodyModel
+from models import APIModel, APIBodyModel, APICollectionModel, APIExampleModel
 
 
 class DocumentGeneratorTest(unittest.TestCase):
@@ -365,3 +370,48 @@ class DocumentGeneratorTest(unittest.TestCase):
         self.assertEqual(2, len(api_model.path_variables))
         self.assertEqual("{{HOST}}/sample/url/path?query_param=<string>", api_model.url)
 
+    def render_peak_memory(self, template, api_count, output_file):
+        api_info = []
+        for api_id in range(api_count):
+            api = APIModel()
+            api.id = api_id
+            api.name = 'Request ' + str(api_id)
+            api.method = 'GET'
+            example = APIExampleModel()
+            example.id = 'response_' + str(api_id)
+            example.request_id = str(api_id)
+            example.name = api.name
+            example.request_body = '\nGET /sample'
+            example.response_body = '\n' + 'x' * 20000
+            api.examples = [example]
+            api_info.append(api)
+        collection = APICollectionModel()
+        collection.name = 'Sample'
+
+        tracemalloc.start()
+        try:
+            DocumentGenerator.write_template(template, output_file, download_enabled=False,
+                                             collection=collection, side_tree=[], api_info=api_info)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_write_template_memory(self):
+        templates_dir = os.path.join(os.path.dirname(os.path.abspath(document_generator.__file__)), TEMPLATES_DIR)
+        template = DocumentGenerator.get_template(templates_dir)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            small_output = os.path.join(temp_dir, 'small.html')
+            large_output = os.path.join(temp_dir, 'large.html')
+            self.render_peak_memory(template, 10, small_output)
+
+            small_peak = self.render_peak_memory(template, 50, small_output)
+            large_peak = self.render_peak_memory(template, 500, large_output)
+            output_size = os.path.getsize(large_output)
+
+            self.assertGreater(output_size, 10 * 1000 * 1000)
+            self.assertLess(large_peak, output_size / 10)
+            self.assertLess(large_peak, small_peak * 2)
+        finally:
+            shutil.rmtree(temp_dir)
+
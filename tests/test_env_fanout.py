@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from constants import OUTPUT_FILE_NAME, SEARCH_INDEX_FILE_NAME
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class EnvFanOutTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        with open(os.path.join(EXAMPLE_DIR, 'postman_environment.json'), 'r', encoding='utf-8') as f:
+            env = json.load(f)
+        self.env_files = []
+        for name in ['dev', 'staging', 'prod']:
+            for value in env['values']:
+                value['value'] = str(value['value']).split('-')[0] + '-' + name
+            env_file = os.path.join(self.temp_dir, name + '.postman_environment.json')
+            with open(env_file, 'w', encoding='utf-8') as f:
+                json.dump(env, f)
+            self.env_files.append(env_file)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def read_output(self, output_dir, file_name=OUTPUT_FILE_NAME) -> str:
+        with open(os.path.join(output_dir, file_name), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def expected_outputs(self, **options) -> list:
+        outputs = []
+        for env_file in self.env_files:
+            output_dir = os.path.join(self.temp_dir, 'single', os.path.basename(env_file))
+            DocumentGenerator(GeneratorOptions(**options)).generate_doc(self.collection_file, env_file, output_dir,
+                                                                        True)
+            outputs.append(self.read_output(output_dir))
+        return outputs
+
+    def test_environment_name(self):
+        self.assertEqual('dev', DocumentGenerator.environment_name('envs/dev.postman_environment.json'))
+        self.assertEqual('prod', DocumentGenerator.environment_name('prod.json'))
+
+    def test_same_output(self):
+        expected = self.expected_outputs(body_threshold=0, search_index=True)
+        for workers in [1, 2]:
+            generator = DocumentGenerator(GeneratorOptions(body_threshold=0, search_index=True))
+            output_dirs = generator.generate_env_docs(self.collection_file, self.env_files,
+                                                      os.path.join(self.temp_dir, 'fan_out_' + str(workers)), True,
+                                                      workers)
+            self.assertEqual(['dev', 'staging', 'prod'], [os.path.basename(out) for out in output_dirs])
+            self.assertEqual(expected, [self.read_output(out) for out in output_dirs])
+            self.assertIn('-staging', expected[1])
+            self.assertEqual(self.read_output(output_dirs[0], SEARCH_INDEX_FILE_NAME),
+                             self.read_output(output_dirs[2], SEARCH_INDEX_FILE_NAME))
+
+    def test_collection_processed_once(self):
+        generator = DocumentGenerator()
+        with mock.patch.object(DocumentGenerator, 'validate_collection',
+                               wraps=generator.validate_collection) as validate, \
+                mock.patch.object(DocumentGenerator, 'markdown_to_html',
+                                  wraps=generator.markdown_to_html) as markdown_to_html:
+            generator.generate_env_docs(self.collection_file, self.env_files, self.temp_dir, workers=1)
+        self.assertEqual(1, validate.call_count)
+        self.assertEqual(3, markdown_to_html.call_count)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            DocumentGenerator(GeneratorOptions(streaming=True)).generate_env_docs(self.collection_file,
+                                                                                  self.env_files, self.temp_dir)
+        with self.assertRaises(ValueError):
+            DocumentGenerator().generate_env_docs(self.collection_file, [self.env_files[0], self.env_files[0]],
+                                                  self.temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import unittest
+
+from document_generator import DocumentGenerator
+from env_substitution import EnvSubstitution
+
+
+def legacy_apply_env_values(json_collection, json_env):
+    collection_string = json.dumps(json_collection)
+    for item in json_env['values']:
+        collection_string = collection_string.replace('{{' + str(item['key']) + '}}',
+                                                      DocumentGenerator.escape_string(str(item['value'])))
+    return json.loads(collection_string)
+
+
+def legacy_apply_env_values_string(string_value, json_env):
+    for item in json_env['values']:
+        string_value = string_value.replace('{{' + str(item['key']) + '}}',
+                                            DocumentGenerator.escape_string(str(item['value'])))
+    return string_value
+
+
+class EnvSubstitutionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.json_env = {
+            "values": [
+                {"key": "HOST", "value": "https://example.com", "enabled": True},
+                {"key": "ID", "value": 5964, "enabled": True},
+                {"key": "QUOTED", "value": "say \"hi\"", "enabled": True},
+                {"key": "TAG", "value": "<string>", "enabled": True},
+                {"key": "PATH", "value": "C:\\temp", "enabled": True},
+                {"key": "HOST", "value": "https://ignored.com", "enabled": True},
+                {"key": "request.url.host", "value": "localhost", "enabled": True},
+                {"key": "{odd}", "value": "braces", "enabled": True}
+            ]
+        }
+        self.json_responses = [
+            {
+                "name": "{{ID}} example",
+                "originalRequest": {
+                    "method": "GET",
+                    "url": {"raw": "{{HOST}}/items/{{ID}}", "host": ["{{HOST}}"]},
+                    "body": {"mode": "raw", "raw": "{\"q\": \"{{QUOTED}}\", \"t\": \"{{TAG}}\"}"}
+                },
+                "code": 200,
+                "body": "{{{HOST}}} {{UNKNOWN}} {{request.url.host}} {{{odd}}} {{PATH}}",
+                "header": [{"key": "X-{{ID}}", "value": "{{TAG}}"}]
+            },
+            {"name": "no tokens", "body": None}
+        ]
+
+    def test_tree_matches_legacy(self):
+        self.assertEqual(legacy_apply_env_values(self.json_responses, self.json_env),
+                         DocumentGenerator.apply_env_values(self.json_responses, self.json_env))
+
+    def test_string_matches_legacy(self):
+        for string_value in ['{{HOST}}/test/{{ID}}', '{{QUOTED}}{{TAG}}', '{{{HOST}}}', '{{{odd}}}', 'plain',
+                             '{{PATH}}', '{{UNKNOWN}}{{ID}']:
+            self.assertEqual(legacy_apply_env_values_string(string_value, self.json_env),
+                             DocumentGenerator.apply_env_values_string(string_value, self.json_env))
+
+    def test_raw_string_matches_legacy(self):
+        raw = '{\n\t"name": {{QUOTED}},\n\t"id": {{ID}}\n}'
+        self.assertEqual(legacy_apply_env_values(raw, self.json_env),
+                         DocumentGenerator.apply_env_values(raw, self.json_env))
+
+    def test_input_is_not_modified(self):
+        DocumentGenerator.apply_env_values(self.json_responses, self.json_env)
+        self.assertEqual('{{ID}} example', self.json_responses[0]['name'])
+
+    def test_engine_is_reused_per_env(self):
+        self.assertIs(EnvSubstitution.for_env(self.json_env), EnvSubstitution.for_env(self.json_env))
+        self.assertIsNot(EnvSubstitution.for_env(self.json_env), EnvSubstitution.for_env({'values': []}))
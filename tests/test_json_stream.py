@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from constants import OUTPUT_FILE_NAME, VALIDATE_SKIP
+from document_generator import DocumentGenerator
+from json_stream import JsonStreamReader
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class JsonStreamReaderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.document = {
+            "info": {"name": "Sample", "numbers": [1, -2.5, 3e10, 12345678901234567890]},
+            "item": [
+                {"name": "escaped \"quote\" é \\ \n", "flags": [True, False, None]},
+                {"item": [], "name": "empty folder"},
+                {"long": "x" * 1000}
+            ],
+            "empty": {}
+        }
+        self.text = json.dumps(self.document, indent=4)
+
+    def reader(self, chunk_size=7):
+        return JsonStreamReader(io.StringIO(self.text), chunk_size)
+
+    def test_read_value(self):
+        self.assertEqual(self.document, self.reader().read_value())
+
+    def test_walk_document(self):
+        reader = self.reader()
+        walked = dict()
+        for key in reader.iter_object():
+            if key == 'item':
+                walked[key] = [reader.read_value() for _ in reader.iter_array()]
+            else:
+                walked[key] = reader.read_value()
+        self.assertEqual(self.document, walked)
+        self.assertEqual('', reader.peek())
+
+    def test_skip_value(self):
+        reader = self.reader()
+        keys = []
+        for key in reader.iter_object():
+            keys.append(key)
+            if key == 'empty':
+                self.assertEqual({}, reader.read_value())
+            else:
+                reader.skip_value()
+        self.assertEqual(['info', 'item', 'empty'], keys)
+
+    def test_buffer_is_bounded_by_largest_value(self):
+        reader = JsonStreamReader(io.StringIO(json.dumps([{"id": i, "data": "y" * 100} for i in range(1000)])), 64)
+        largest_buffer = 0
+        for index in reader.iter_array():
+            self.assertEqual(index, reader.read_value()['id'])
+            largest_buffer = max(largest_buffer, len(reader.buffer))
+        self.assertLess(largest_buffer, 1000)
+
+    def test_invalid_document(self):
+        reader = JsonStreamReader(io.StringIO('{"key": [1, 2'), 4)
+        with self.assertRaises(json.JSONDecodeError):
+            for _ in reader.iter_object():
+                reader.skip_value()
+
+
+class StreamingGenerationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, collection_file, output_name, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(collection_file, self.env_file, os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_streaming_matches_full_load(self):
+        collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        self.assertEqual(self.generate(collection_file, 'full'),
+                         self.generate(collection_file, 'stream', streaming=True))
+
+    def test_folder_name_after_items(self):
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        # move the info and the folder names to the end of their objects
+        collection['info'] = collection.pop('info')
+        for folder in collection['item']:
+            if 'item' in folder:
+                folder['name'] = folder.pop('name')
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+        self.assertEqual(self.generate(collection_file, 'full'),
+                         self.generate(collection_file, 'stream', streaming=True))
+
+    def test_invalid_item_is_rejected(self):
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump({'info': {'name': 'Invalid', 'schema': 'schema'}, 'item': [{'request': 5}]}, f)
+
+        self.assertRaises(Exception, self.generate, collection_file, 'stream', streaming=True)
+
+    def write_large_collection(self, file_name, request_count):
+        items = [{'name': 'Request ' + str(i), 'request': {'method': 'GET', 'url': {'raw': '{{HOST}}/' + str(i)}},
+                  'response': [{'name': 'OK', 'code': 200, 'body': 'z' * 20000}]} for i in range(request_count)]
+        with open(file_name, 'w', encoding='utf-8') as f:
+            json.dump({'info': {'name': 'Large', 'schema': 'schema'}, 'item': [{'name': 'folder', 'item': items}]}, f)
+
+    def peak_memory(self, collection_file, output_name):
+        generator = DocumentGenerator(GeneratorOptions(streaming=True, validation_mode=VALIDATE_SKIP))
+        tracemalloc.start()
+        try:
+            generator.generate_doc(collection_file, self.env_file, os.path.join(self.temp_dir, output_name))
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_memory_does_not_grow_with_collection_size(self):
+        small_file = os.path.join(self.temp_dir, 'small.json')
+        large_file = os.path.join(self.temp_dir, 'large.json')
+        self.write_large_collection(small_file, 50)
+        self.write_large_collection(large_file, 400)
+        # warm up the template and sanitizer caches, which are not part of the per item memory
+        self.generate(small_file, 'warm', streaming=True, validation_mode=VALIDATE_SKIP)
+
+        small_peak = self.peak_memory(small_file, 'small')
+        large_peak = self.peak_memory(large_file, 'large')
+        # eight times the requests, while the largest request stays the same
+        self.assertLess(large_peak, small_peak * 1.5)
+        self.assertLess(large_peak, os.path.getsize(large_file) / 2)
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import markdown
+
+from markdown_converter import MarkdownConverter, MARKDOWN_EXTENSIONS
+
+
+class MarkdownConverterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, 'markdown_cache.json')
+        self.md_text = 'Sample **description**[^1]\n\n[^1]: a footnote\n\n```json\n{"id": 1}\n```'
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_convert_matches_markdown(self):
+        converter = MarkdownConverter(cache_size=0)
+        expected = markdown.markdown(self.md_text, extensions=MARKDOWN_EXTENSIONS, output_format='html5')
+
+        self.assertEqual(expected, converter.convert(self.md_text))
+        # footnotes and other extension state must not leak between documents
+        self.assertEqual(expected, converter.convert(self.md_text))
+        self.assertEqual('<p>Plain</p>', converter.convert('Plain'))
+
+    def test_cache_is_bounded(self):
+        converter = MarkdownConverter(cache_size=2)
+        converter.convert('one')
+        converter.convert('two')
+        converter.convert('one')
+        converter.convert('three')
+
+        self.assertEqual(2, len(converter.cache))
+        self.assertIn(MarkdownConverter.content_hash('one'), converter.cache)
+        self.assertNotIn(MarkdownConverter.content_hash('two'), converter.cache)
+
+    def test_persisted_cache(self):
+        converter = MarkdownConverter(cache_file=self.cache_file)
+        html = converter.convert(self.md_text)
+        converter.save()
+
+        reloaded = MarkdownConverter(cache_file=self.cache_file)
+        self.assertEqual(html, reloaded.cache[MarkdownConverter.content_hash(self.md_text)])
+        self.assertFalse(reloaded.modified)
+
+    def test_library_upgrade(self):
+        converter = MarkdownConverter(cache_file=self.cache_file)
+        converter.convert(self.md_text)
+        converter.save()
+
+        # the html of another pygments version is converted again
+        with mock.patch('pygments.__version__', '0.0.0'):
+            self.assertEqual(0, len(MarkdownConverter(cache_file=self.cache_file).cache))
+        with mock.patch.object(markdown, '__version__', '0.0.0'):
+            self.assertEqual(0, len(MarkdownConverter(cache_file=self.cache_file).cache))
+
+    def test_invalid_cache_file_is_ignored(self):
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            f.write('not json')
+
+        converter = MarkdownConverter(cache_file=self.cache_file)
+        self.assertEqual(0, len(converter.cache))
@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from constants import OUTPUT_FILE_NAME, MODEL_CACHE_FILE_NAME, SEARCH_INDEX_FILE_NAME, BODIES_DIR
+from document_generator import DocumentGenerator
+from model_cache import ModelCache
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ModelCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(self.temp_dir, 'collection.json')
+        shutil.copyfile(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), self.collection_file)
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name='out', download_enabled=False, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, self.env_file,
+                                            os.path.join(self.temp_dir, output_name), download_enabled)
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return generator, f.read()
+
+    def read_output(self, file_name, output_name='out') -> str:
+        with open(os.path.join(self.temp_dir, output_name, file_name), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_render_only(self):
+        _, expected = self.generate('expected')
+        generator, html = self.generate(model_cache=True)
+        self.assertFalse(generator.model_cache.loaded)
+        self.assertEqual(expected, html)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'out', MODEL_CACHE_FILE_NAME)))
+
+        # the collection is not processed again
+        with mock.patch.object(DocumentGenerator, 'process_collection', side_effect=AssertionError):
+            generator, html = self.generate(render_only=True)
+        self.assertTrue(generator.model_cache.loaded)
+        self.assertEqual(expected, html)
+        self.assertEqual(3, generator.api_id_counter)
+
+    def test_not_cached(self):
+        with self.assertRaises(ValueError):
+            self.generate(render_only=True)
+        self.generate(model_cache=True)
+        with self.assertRaises(ValueError):
+            self.generate(render_only=True, sanitizer='escape')
+
+        with open(self.collection_file, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        collection['item'][1]['name'] = 'Renamed request'
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+        with self.assertRaises(ValueError):
+            self.generate(render_only=True)
+        generator, html = self.generate(model_cache=True)
+        self.assertFalse(generator.model_cache.loaded)
+        self.assertIn('Renamed request', html)
+
+    def test_cached_parts(self):
+        options = {'body_threshold': 0, 'tree_file': True, 'search_index': True}
+        _, expected = self.generate('expected', **options)
+        expected_index = self.read_output(SEARCH_INDEX_FILE_NAME, 'expected')
+        self.generate(model_cache=True, **options)
+        for name, streaming in [('serial', False), ('streaming', True)]:
+            generator, html = self.generate(render_only=True, streaming=streaming, **options)
+            self.assertTrue(generator.model_cache.loaded, name)
+            self.assertEqual(expected, html, name)
+            self.assertEqual(expected_index, self.read_output(SEARCH_INDEX_FILE_NAME), name)
+            self.assertEqual(sorted(os.listdir(os.path.join(self.temp_dir, 'expected', BODIES_DIR))),
+                             sorted(os.listdir(os.path.join(self.temp_dir, 'out', BODIES_DIR))), name)
+
+    def test_streaming(self):
+        _, expected = self.generate('expected')
+        self.generate(model_cache=True, streaming=True)
+        for streaming in [True, False]:
+            generator, html = self.generate(render_only=True, streaming=streaming)
+            self.assertEqual(expected, html)
+
+    def test_download_links(self):
+        _, html = self.generate(model_cache=True, download_enabled=True)
+        self.assertIn('postman_environment.json', html)
+        _, html = self.generate(render_only=True)
+        self.assertNotIn('postman_environment.json', html)
+
+    def test_corrupt_cache(self):
+        self.generate(model_cache=True)
+        cache_file = os.path.join(self.temp_dir, 'out', MODEL_CACHE_FILE_NAME)
+        with open(cache_file, 'wb') as f:
+            f.write(b'not a pickle')
+        cache = ModelCache(os.path.join(self.temp_dir, 'out'), 'key')
+        self.assertIsNone(cache.load())
+        generator, _ = self.generate(model_cache=True)
+        self.assertFalse(generator.model_cache.loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
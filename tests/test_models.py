@@ -0,0 +1,57 @@
+import json
+import pickle
+import unittest
+
+from models import APIModel, APIExampleModel, KeyValueModel, APIBodyModel
+
+
+class ModelsTest(unittest.TestCase):
+
+    def build_api(self) -> APIModel:
+        api = APIModel()
+        api.id = 1
+        api.name = 'Sample API'
+        api.body = APIBodyModel()
+        api.body.raw = '{}'
+        api.headers = [KeyValueModel('Accept', 'application/json', 'the accepted type')]
+        example = APIExampleModel()
+        example.id = 'response_1'
+        example.code = 200
+        api.examples.append(example)
+        return api
+
+    def test_slotted_models(self):
+        for model in [APIModel(), APIExampleModel(), KeyValueModel('key', 'value', None)]:
+            self.assertFalse(hasattr(model, '__dict__'))
+            with self.assertRaises(AttributeError):
+                model.unknown_attribute = 1
+
+    def test_defaults(self):
+        api = APIModel()
+        self.assertIsNone(api.body)
+        self.assertIsNone(api.fragment)
+        self.assertEqual([], api.examples)
+        self.assertIsNot(api.examples, APIModel().examples)
+
+        example = APIExampleModel()
+        self.assertIsNone(example.request_body)
+        self.assertIsNone(example.response_body)
+
+    def test_to_json(self):
+        api_json = json.loads(self.build_api().toJSON())
+        self.assertEqual('Sample API', api_json['name'])
+        self.assertEqual('{}', api_json['body']['raw'])
+        self.assertEqual({'key': 'Accept', 'value': 'application/json', 'description': 'the accepted type'},
+                         api_json['headers'][0])
+        self.assertEqual(200, api_json['examples'][0]['code'])
+        self.assertIsNone(api_json['examples'][0]['response_body'])
+
+    def test_pickle(self):
+        api = pickle.loads(pickle.dumps(self.build_api()))
+        self.assertEqual('Sample API', api.name)
+        self.assertEqual('Accept', api.headers[0].key)
+        self.assertEqual('response_1', api.examples[0].id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import copy
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+        # a collection large enough to be split in several chunks, with requests at the root and in folders
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        items = collection['item']
+        collection['item'] = copy.deepcopy(items)
+        for i in range(12):
+            folder = {'name': 'Folder ' + str(i), 'item': copy.deepcopy(items)}
+            collection['item'].append(folder)
+        self.collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, self.env_file,
+                                            os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return generator, f.read()
+
+    def test_output_is_identical(self):
+        serial, serial_html = self.generate('serial')
+        parallel, parallel_html = self.generate('parallel', jobs=3)
+        self.assertEqual(serial_html, parallel_html)
+        self.assertEqual(serial.api_id_counter, parallel.api_id_counter)
+        self.assertEqual([api.group for api in serial.api_info], [api.group for api in parallel.api_info])
+
+    def test_incremental(self):
+        _, serial_html = self.generate('serial')
+        generator, first_html = self.generate('out', jobs=2, incremental=True)
+        self.assertEqual(0, generator.manifest.reused)
+        self.assertEqual(serial_html, first_html)
+
+        generator, second_html = self.generate('out', jobs=2, incremental=True)
+        self.assertEqual(0, generator.manifest.rebuilt)
+        self.assertEqual(serial_html, second_html)
+
+    def test_markdown_cache_is_merged(self):
+        cache_file = os.path.join(self.temp_dir, 'markdown.json')
+        self.generate('out', jobs=2, markdown_cache_file=cache_file)
+        serial = DocumentGenerator(GeneratorOptions(markdown_cache_file=cache_file))
+        self.assertGreater(len(serial.markdown_converter.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, COMPRESSION_GZIP, COMPRESSION_BROTLI, SHARD_ENDPOINT, SEARCH_INDEX_FILE_NAME, \
+    COMPRESSION_RECORD_FILE_NAME
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+from precompressor import Precompressor, load_brotli
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class PrecompressorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        generator.generate_doc(self.collection_file, None, os.path.join(self.temp_dir, 'out'))
+        return generator
+
+    def test_gzip(self):
+        generator = self.generate(precompress=[COMPRESSION_GZIP], shard_mode=SHARD_ENDPOINT, search_index=True)
+        output_dir = os.path.join(self.temp_dir, 'out')
+        files = [os.path.join(output_dir, OUTPUT_FILE_NAME)] + generator.assets.published + \
+            [os.path.join(output_dir, shard.file_name) for shard in generator.shards] + \
+            [os.path.join(output_dir, SEARCH_INDEX_FILE_NAME)]
+        self.assertEqual(sorted(files), sorted(generator.precompressor.compressed))
+
+        for file_name in files:
+            with open(file_name, 'rb') as f, gzip.open(file_name + '.gz', 'rb') as gz:
+                self.assertEqual(f.read(), gz.read())
+            self.assertFalse(os.path.exists(file_name + '.br'))
+
+    def test_unchanged_files_are_skipped(self):
+        self.generate(precompress=[COMPRESSION_GZIP])
+        index_gz = os.path.join(self.temp_dir, 'out', OUTPUT_FILE_NAME + '.gz')
+        mtime = os.stat(index_gz).st_mtime_ns
+
+        generator = self.generate(precompress=[COMPRESSION_GZIP])
+        self.assertEqual([], generator.precompressor.compressed)
+        self.assertEqual(mtime, os.stat(index_gz).st_mtime_ns)
+
+        # another level gives other files
+        generator = self.generate(precompress=[COMPRESSION_GZIP], compress_level=1)
+        self.assertEqual([], generator.precompressor.skipped)
+
+    def test_deterministic_output(self):
+        file_name = os.path.join(self.temp_dir, 'file.txt')
+        with open(file_name, 'w', encoding='utf-8') as f:
+            f.write('content ' * 100)
+        Precompressor(self.temp_dir, [COMPRESSION_GZIP]).compress([file_name])
+        with open(file_name + '.gz', 'rb') as f:
+            first = f.read()
+        os.remove(file_name + '.gz')
+        Precompressor(self.temp_dir, [COMPRESSION_GZIP]).compress([file_name])
+        with open(file_name + '.gz', 'rb') as f:
+            self.assertEqual(first, f.read())
+
+    def test_stale_copies_removed(self):
+        generator = self.generate(precompress=[COMPRESSION_GZIP], shard_mode=SHARD_ENDPOINT, search_index=True)
+        output_dir = os.path.join(self.temp_dir, 'out')
+        shard = os.path.join(output_dir, generator.shards[0].file_name)
+        self.assertTrue(os.path.exists(shard + '.gz'))
+
+        # the shards are no longer written
+        self.generate(precompress=[COMPRESSION_GZIP])
+        self.assertFalse(os.path.exists(shard + '.gz'))
+        self.assertTrue(os.path.exists(os.path.join(output_dir, OUTPUT_FILE_NAME + '.gz')))
+
+        # a run without precompression leaves no copies of the files it wrote
+        self.generate()
+        files = [os.path.join(root, file_name) for root, _, names in os.walk(output_dir) for file_name in names]
+        self.assertEqual([], [file_name for file_name in files if file_name.endswith('.gz')])
+        self.assertFalse(os.path.exists(os.path.join(output_dir, COMPRESSION_RECORD_FILE_NAME)))
+
+    @unittest.skipIf(load_brotli() is None, 'brotli is not installed')
+    def test_brotli(self):
+        self.generate(precompress=[])
+        index = os.path.join(self.temp_dir, 'out', OUTPUT_FILE_NAME)
+        with open(index, 'rb') as f, open(index + '.br', 'rb') as br:
+            self.assertEqual(f.read(), load_brotli().decompress(br.read()))
+
+        # the copies of a format no longer written are removed
+        self.generate(precompress=[COMPRESSION_GZIP])
+        self.assertFalse(os.path.exists(index + '.br'))
+
+    @unittest.skipIf(load_brotli() is not None, 'brotli is installed')
+    def test_brotli_unavailable(self):
+        with self.assertRaises(ValueError):
+            Precompressor(self.temp_dir, [COMPRESSION_BROTLI])
+
+
+if __name__ == '__main__':
+    unittest.main()
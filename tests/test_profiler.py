@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+from constants import OUTPUT_FILE_NAME, STAGE_GENERATE, STAGE_VALIDATE, STAGE_BUILD_APIS, STAGE_MARKDOWN, \
+    STAGE_SANITIZE, STAGE_RENDER, STAGE_ASSETS, PROFILE_STAGES
+from document_generator import DocumentGenerator
+from profiler import Profiler
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def test_stages(self):
+        profiler = Profiler()
+        for _ in range(3):
+            with profiler.stage('outer'):
+                with profiler.stage('inner'):
+                    pass
+        self.assertEqual(['inner', 'outer'], list(profiler.stats.keys()))
+        self.assertEqual(3, profiler.stats['inner'].calls)
+        self.assertIsNone(profiler.stats['outer'].peak_memory)
+        self.assertGreaterEqual(profiler.stats['outer'].seconds, profiler.stats['inner'].seconds)
+
+    def test_nested_peak_memory(self):
+        profiler = Profiler()
+        tracemalloc.start()
+        with profiler.stage('outer'):
+            with profiler.stage('inner'):
+                data = bytearray(4 * 1024 * 1024)
+                del data
+            small = bytearray(1024 * 1024)
+            del small
+        tracemalloc.stop()
+
+        # the peak of the outer stage includes the one of the inner stage, although the peak was reset for it
+        self.assertGreaterEqual(profiler.stats['inner'].peak_memory, 4 * 1024 * 1024)
+        self.assertGreaterEqual(profiler.stats['outer'].peak_memory, profiler.stats['inner'].peak_memory)
+
+    def test_without_reset_peak(self):
+        # python < 3.9
+        profiler = Profiler()
+        tracemalloc.start()
+        with mock.patch('profiler.RESET_PEAK', False), mock.patch.object(tracemalloc, 'reset_peak', None):
+            with profiler.stage('outer'):
+                with profiler.stage('inner'):
+                    data = bytearray(4 * 1024 * 1024)
+                del data
+        tracemalloc.stop()
+
+        self.assertGreaterEqual(profiler.stats['inner'].peak_memory, 4 * 1024 * 1024)
+        self.assertGreaterEqual(profiler.stats['outer'].peak_memory, profiler.stats['inner'].peak_memory)
+
+    def test_observer(self):
+        calls = []
+        profiler = Profiler()
+        profiler.add_observer(lambda name, seconds, peak: calls.append((name, peak)))
+        with self.assertRaises(ValueError):
+            with profiler.stage('failing'):
+                raise ValueError()
+        self.assertEqual([('failing', None)], calls)
+        self.assertEqual(1, profiler.stats['failing'].calls)
+
+    def test_generate_doc(self):
+        profiler = Profiler()
+        stages = []
+        profiler.add_observer(lambda name, seconds, peak: stages.append(name))
+        collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+        tracemalloc.start()
+        output_dir = DocumentGenerator(profiler=profiler).generate_doc(collection_file, env_file,
+                                                                       os.path.join(self.temp_dir, 'out'))
+        tracemalloc.stop()
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            profiled_html = f.read()
+        output_dir = DocumentGenerator().generate_doc(collection_file, env_file, os.path.join(self.temp_dir, 'plain'))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), profiled_html)
+
+        for stage in [STAGE_GENERATE, STAGE_VALIDATE, STAGE_BUILD_APIS, STAGE_MARKDOWN, STAGE_SANITIZE, STAGE_RENDER,
+                      STAGE_ASSETS]:
+            self.assertIn(stage, profiler.stats)
+            self.assertIsNotNone(profiler.stats[stage].peak_memory)
+        self.assertEqual(STAGE_GENERATE, stages[-1])
+        self.assertEqual(3, profiler.stats[STAGE_MARKDOWN].calls)
+
+        report_file = os.path.join(self.temp_dir, 'report.json')
+        profiler.save(report_file)
+        with open(report_file, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(list(profiler.stats.keys()), [stats['name'] for stats in report[PROFILE_STAGES]])
+        self.assertIn(STAGE_RENDER, profiler.format_table())
+
+
+if __name__ == '__main__':
+    unittest.main()
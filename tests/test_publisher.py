@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from constants import OUTPUT_FILE_NAME, PUBLISH_BUILDS_SUFFIX
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+from publisher import Publisher, is_compressed_copy
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class PublisherTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(self.temp_dir, 'collection.json')
+        shutil.copyfile(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), self.collection_file)
+        self.output_dir = os.path.join(self.temp_dir, 'docs')
+        self.builds_dir = self.output_dir + PUBLISH_BUILDS_SUFFIX
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_dir=None, **options) -> DocumentGenerator:
+        options.setdefault('publish', True)
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        generator.generate_doc(self.collection_file, None, output_dir or self.output_dir, True)
+        return generator
+
+    def read(self, *path) -> str:
+        with open(os.path.join(*path), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def rename_request(self, name):
+        with open(self.collection_file, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        collection['item'][1]['name'] = name
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+    def test_publish(self):
+        self.generate(os.path.join(self.temp_dir, 'expected'), publish=False)
+        expected = self.read(self.temp_dir, 'expected', OUTPUT_FILE_NAME)
+        for _ in range(3):
+            generator = self.generate(incremental=True, keep_builds=1)
+        self.assertTrue(os.path.islink(self.output_dir))
+        self.assertEqual(os.path.join(self.builds_dir, 'build_000003'), generator.publisher.current())
+        self.assertEqual(['build_000002', 'build_000003'], sorted(os.listdir(self.builds_dir)))
+        self.assertEqual(expected, self.read(self.output_dir, OUTPUT_FILE_NAME))
+        # the caches of the published build are used
+        self.assertEqual(3, generator.manifest.reused)
+
+    def test_previous_build_unchanged(self):
+        self.generate(precompress=[])
+        first = os.path.join(self.builds_dir, 'build_000001')
+        html = self.read(first, OUTPUT_FILE_NAME)
+        collection = self.read(first, 'collection.json')
+        self.rename_request('Renamed request')
+        self.generate(precompress=[])
+        self.assertIn('Renamed request', self.read(self.output_dir, OUTPUT_FILE_NAME))
+        self.assertEqual(html, self.read(first, OUTPUT_FILE_NAME))
+        self.assertEqual(collection, self.read(first, 'collection.json'))
+        self.assertNotIn('Renamed request', self.read(first, 'collection.json'))
+
+    def test_compressed_copies(self):
+        self.generate(precompress=['gzip'])
+        first = os.path.join(self.builds_dir, 'build_000001')
+        self.assertTrue(os.path.exists(os.path.join(first, OUTPUT_FILE_NAME + '.gz')))
+        generator = self.generate(precompress=['gzip'])
+        # the copies of the unchanged files are reused
+        self.assertIn(os.path.join(self.builds_dir, 'build_000002', OUTPUT_FILE_NAME), generator.precompressor.skipped)
+
+        self.generate()
+        names = [name for _, _, files in os.walk(os.path.join(self.builds_dir, 'build_000003')) for name in files]
+        self.assertEqual([], [name for name in names if is_compressed_copy(name)])
+        self.assertTrue(os.path.exists(os.path.join(first, OUTPUT_FILE_NAME + '.gz')))
+
+    def test_existing_output_dir(self):
+        self.generate(publish=False)
+        html = self.read(self.output_dir, OUTPUT_FILE_NAME)
+        self.rename_request('Renamed request')
+        self.generate()
+        self.assertTrue(os.path.islink(self.output_dir))
+        self.assertEqual(html, self.read(self.builds_dir, 'build_000001', OUTPUT_FILE_NAME))
+        self.assertIn('Renamed request', self.read(self.output_dir, OUTPUT_FILE_NAME))
+
+    def test_failed_run(self):
+        self.generate()
+        with mock.patch.object(DocumentGenerator, 'build_output', side_effect=ValueError('failed')):
+            with self.assertRaises(ValueError):
+                self.generate()
+        self.assertEqual(['build_000001'], os.listdir(self.builds_dir))
+        self.assertEqual(os.path.join(self.builds_dir, 'build_000001'), Publisher(self.output_dir).current())
+
+    def test_rollback(self):
+        self.generate()
+        self.rename_request('Renamed request')
+        self.generate()
+        publisher = Publisher(self.output_dir)
+        self.assertEqual(os.path.join(self.builds_dir, 'build_000001'), publisher.rollback())
+        self.assertNotIn('Renamed request', self.read(self.output_dir, OUTPUT_FILE_NAME))
+        with self.assertRaises(ValueError):
+            publisher.rollback()
+
+        self.generate(keep_builds=1)
+        self.assertEqual(['build_000002', 'build_000003'], sorted(os.listdir(self.builds_dir)))
+
+    def test_assets_dir(self):
+        self.generate(assets_dir=os.path.join(self.temp_dir, 'assets'))
+        self.assertIn('href="../assets/css/', self.read(self.output_dir, OUTPUT_FILE_NAME))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import html
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, SANITIZE_ESCAPE, SANITIZE_BLEACH
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+from sanitizer import escape_code, clean_html, get_sanitizer, sanitizer_fingerprint
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class SanitizerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_safe(self):
+        for body in ['<script>alert(1)</script>', '<img src=x onerror="alert(1)">', '"><svg onload=alert(1)>',
+                     '</code></pre><script>alert(1)</script>', '<!--<script>-->', '&lt;script&gt;']:
+            for sanitizer in [escape_code, clean_html]:
+                sanitized = sanitizer(body)
+                self.assertNotIn('<script', sanitized)
+                self.assertNotIn('<img', sanitized)
+                self.assertNotIn('<svg', sanitized)
+                self.assertNotIn('</code', sanitized)
+
+        # the escaped body is shown exactly as it is
+        body = '<?xml version="1.0"?>\n<order id="1"><b>bold</b> &amp; co</order>'
+        self.assertEqual(body, html.unescape(escape_code(body)))
+
+    def test_identical_looking(self):
+        # the code bodies of a collection, without any html, look the same with both sanitizers
+        bodies = [json.dumps({'id': 1, 'name': "Tom & Jerry's", 'filter': 'a > b', 'tags': ['x', 'y']}, indent=4),
+                  '\n{\r\n    "value": "{{HOST}}/path?a=1&b=2"\r\n}', 'plain text', '']
+        for body in bodies:
+            self.assertEqual(clean_html(body), escape_code(body))
+
+        # bleach renders the entities and tags it allows, the escaped body shows them as they are
+        for body in ['a &amp; b', '<b>bold</b> &lt;tag&gt;', '{"html": "<i>x</i> &copy;"}']:
+            self.assertNotEqual(clean_html(body), escape_code(body))
+            self.assertEqual(body, html.unescape(escape_code(body)))
+            self.assertEqual(clean_html(body), get_sanitizer()(body))
+
+        # the environment values substituted into the bodies are escaped once
+        with open(os.path.join(EXAMPLE_DIR, 'postman_environment.json'), 'r', encoding='utf-8') as f:
+            env = json.load(f)
+        for value in env['values']:
+            if value['key'] == 'SAMPLE_NAME':
+                value['value'] = '<abc> & "quoted"'
+        env_file = os.path.join(self.temp_dir, 'env.json')
+        with open(env_file, 'w', encoding='utf-8') as f:
+            json.dump(env, f)
+        pages = self.generate_pages(env_file)
+        self.assertEqual(pages[0], pages[1])
+        self.assertIn('&lt;abc&gt; &amp; "quoted"', pages[0])
+        self.assertNotIn('&amp;lt;', pages[0])
+
+    def test_env_url(self):
+        # an example whose original request has no body still has its url escaped
+        with open(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        for item in collection['item']:
+            for request in item.get('item', [item]):
+                for response in request.get('response', []):
+                    response['originalRequest'].pop('body', None)
+        collection_file = os.path.join(self.temp_dir, 'collection.json')
+        with open(collection_file, 'w', encoding='utf-8') as f:
+            json.dump(collection, f)
+        with open(os.path.join(EXAMPLE_DIR, 'postman_environment.json'), 'r', encoding='utf-8') as f:
+            env = json.load(f)
+        for value in env['values']:
+            if value['key'] == 'HOST':
+                value['value'] = '<img src=x onerror=alert(1)>'
+        env_file = os.path.join(self.temp_dir, 'env.json')
+        with open(env_file, 'w', encoding='utf-8') as f:
+            json.dump(env, f)
+
+        pages = self.generate_pages(env_file, collection_file)
+        for page in pages:
+            self.assertNotIn('<img src=x', page)
+            self.assertIn('&lt;img src=x onerror=alert(1)&gt;/sample/url/path', page)
+        self.assertEqual(pages[0], pages[1])
+
+    def test_get_sanitizer(self):
+        self.assertIs(clean_html, get_sanitizer())
+        self.assertIs(escape_code, get_sanitizer(SANITIZE_ESCAPE))
+        self.assertIs(clean_html, get_sanitizer(SANITIZE_BLEACH))
+        with self.assertRaises(ValueError):
+            get_sanitizer('unknown')
+        self.assertNotEqual(sanitizer_fingerprint(SANITIZE_ESCAPE), sanitizer_fingerprint(SANITIZE_BLEACH))
+
+    def generate_pages(self, env_file, collection_file=None) -> list:
+        collection_file = collection_file or os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        pages = []
+        for sanitizer in [SANITIZE_ESCAPE, SANITIZE_BLEACH]:
+            generator = DocumentGenerator(GeneratorOptions(sanitizer=sanitizer))
+            output_dir = generator.generate_doc(collection_file, env_file, os.path.join(self.temp_dir, sanitizer))
+            with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+                pages.append(f.read())
+        return pages
+
+    def test_generate_doc(self):
+        pages = self.generate_pages(os.path.join(EXAMPLE_DIR, 'postman_environment.json'))
+        self.assertEqual(pages[0], pages[1])
+
+    def test_incremental(self):
+        # the fragments rendered with another sanitizer are not reused
+        collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        output_dir = os.path.join(self.temp_dir, 'out')
+        for sanitizer, reused in [(SANITIZE_ESCAPE, 0), (SANITIZE_ESCAPE, 3), (SANITIZE_BLEACH, 0)]:
+            generator = DocumentGenerator(GeneratorOptions(incremental=True, sanitizer=sanitizer))
+            generator.generate_doc(collection_file, None, output_dir)
+            self.assertEqual(reused, generator.manifest.reused)
+
+
+if __name__ == '__main__':
+    unittest.main()
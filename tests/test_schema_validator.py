@@ -0,0 +1,51 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from fastjsonschema import JsonSchemaException
+
+from constants import VALIDATE_SKIP
+from document_generator import DocumentGenerator
+from schema_validator import get_validator, schema_path, schema_hash, cached_module_path
+
+
+class SchemaValidatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.schema_filename = os.path.join(self.temp_dir, 'schema.json')
+        with open(self.schema_filename, 'w', encoding='utf-8') as f:
+            json.dump({'type': 'object', 'required': ['info']}, f)
+
+        self.invalid_collection = os.path.join(self.temp_dir, 'invalid.json')
+        with open(self.invalid_collection, 'w', encoding='utf-8') as f:
+            json.dump({'item': []}, f)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_validator_is_compiled_once(self):
+        self.assertIs(get_validator(), get_validator())
+        self.assertIs(get_validator(schema_path()), get_validator())
+
+    def test_persisted_validator(self):
+        with open(self.schema_filename, 'rb') as f:
+            module_filename = cached_module_path(self.schema_filename, schema_hash(f.read()))
+
+        validate = get_validator(self.schema_filename, persist=True)
+
+        self.assertTrue(os.path.exists(module_filename))
+        validate({'info': {}})
+        self.assertRaises(JsonSchemaException, validate, {})
+
+    def test_validate_collection_full(self):
+        self.assertRaises(JsonSchemaException, DocumentGenerator.validate_collection, self.invalid_collection)
+
+    def test_validate_collection_skip(self):
+        json_collection = DocumentGenerator.validate_collection(self.invalid_collection, VALIDATE_SKIP)
+        self.assertEqual({'item': []}, json_collection)
+
+    def test_validate_collection_unknown_mode(self):
+        self.assertRaises(ValueError, DocumentGenerator.validate_collection, self.invalid_collection, 'partial')
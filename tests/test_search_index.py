@@ -0,0 +1,118 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, SEARCH_INDEX_FILE_NAME, SEARCH_INDEX_CALLBACK, SEARCH_DOCS, SEARCH_TERMS, \
+    COMPRESSION_GZIP
+from document_generator import DocumentGenerator
+from models import APIModel, GeneratorOptions
+from search_index import SearchIndex
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def read_index(output_dir) -> dict:
+        with open(os.path.join(output_dir, SEARCH_INDEX_FILE_NAME), 'r', encoding='utf-8') as f:
+            script = f.read()
+        prefix = SEARCH_INDEX_CALLBACK + '('
+        assert script.startswith(prefix) and script.endswith(');\n')
+        return json.loads(script[len(prefix):-3])
+
+    @staticmethod
+    def decode(gaps: list) -> list:
+        docs = []
+        for gap in gaps:
+            docs.append(gap + (docs[-1] if len(docs) > 0 else 0))
+        return docs
+
+    def generate(self, output_name, **options):
+        options.setdefault('search_index', True)
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, self.env_file,
+                                            os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return output_dir, f.read()
+
+    def test_tokens(self):
+        self.assertEqual({'get', 'host', 'users', 'user_id', 'détails'},
+                         SearchIndex.tokens(['GET', '{{HOST}}/users/:user_id', None, 'Détails, a b']))
+
+    def test_add(self):
+        index = SearchIndex()
+        for api_id in range(1, 4):
+            api = APIModel()
+            api.id = api_id
+            api.name = 'Orders API' if api_id != 2 else 'Customers'
+            index.add(api, {'name': api.name, 'request': {
+                'method': 'GET',
+                'url': {'raw': '{{HOST}}/orders', 'query': [{'key': 'page', 'value': '1'}]},
+                'description': {'content': '**Paged** results', 'type': 'text/markdown'},
+                'body': {'mode': 'urlencoded', 'urlencoded': [{'key': 'filter', 'value': 'x'}]}
+            }})
+
+        index_json = index.to_json()
+        self.assertEqual([[1, 'Orders API', 'GET'], [2, 'Customers', 'GET'], [3, 'Orders API', 'GET']],
+                         index_json[SEARCH_DOCS])
+        # the posting lists hold the gaps between the api numbers
+        self.assertEqual([0, 2], index_json[SEARCH_TERMS]['api'])
+        self.assertEqual([0, 1, 1], index_json[SEARCH_TERMS]['orders'])
+        for term in ['customers', 'page', 'filter', 'paged', 'results', 'host', 'get']:
+            self.assertIn(term, index_json[SEARCH_TERMS])
+
+    def test_generate_doc(self):
+        output_dir, html = self.generate('out')
+        self.assertIn('data-index-file="' + SEARCH_INDEX_FILE_NAME + '"', html)
+        index_json = self.read_index(output_dir)
+        self.assertEqual([[1, 'Sample Create API', 'POST'], [2, 'Sample Update API', 'PUT'],
+                          [3, 'Sample GET API', 'GET']], index_json[SEARCH_DOCS])
+        self.assertEqual([1], self.decode(index_json[SEARCH_TERMS]['update']))
+        self.assertEqual([0, 1, 2], self.decode(index_json[SEARCH_TERMS]['sample']))
+
+    def test_build_modes(self):
+        # the index does not depend on how the apis are built
+        output_dir, _ = self.generate('serial')
+        expected = self.read_index(output_dir)
+        for name, options in [('streaming', {'streaming': True}), ('parallel', {'jobs': 2}),
+                              ('incremental', {'incremental': True})]:
+            output_dir, _ = self.generate(name, **options)
+            self.assertEqual(expected, self.read_index(output_dir), name)
+            if name == 'incremental':
+                # a second run reusing every fragment
+                output_dir, _ = self.generate(name, **options)
+                self.assertEqual(expected, self.read_index(output_dir), name)
+
+    def test_disabled(self):
+        # the search is added with --search-index only
+        generator = DocumentGenerator(GeneratorOptions())
+        output_dir = generator.generate_doc(self.collection_file, self.env_file, os.path.join(self.temp_dir, 'out'))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            html = f.read()
+        self.assertNotIn('id="search"', html)
+        self.assertFalse(os.path.exists(os.path.join(output_dir, SEARCH_INDEX_FILE_NAME)))
+
+    def test_compressed(self):
+        # the index is only compressed with --precompress
+        output_dir, _ = self.generate('out')
+        self.assertFalse(os.path.exists(os.path.join(output_dir, SEARCH_INDEX_FILE_NAME + '.gz')))
+        output_dir, _ = self.generate('out', precompress=[COMPRESSION_GZIP])
+        with open(os.path.join(output_dir, SEARCH_INDEX_FILE_NAME), 'rb') as f, \
+                gzip.open(os.path.join(output_dir, SEARCH_INDEX_FILE_NAME + '.gz'), 'rb') as gz:
+            self.assertEqual(f.read(), gz.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import gzip
+import http.client
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+from constants import OUTPUT_FILE_NAME, BUILD_MANIFEST_FILE_NAME, IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+from server import DocumentServer, SourceWatcher, accepted_encodings, byte_range
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ServerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(self.temp_dir, 'collection.json')
+        shutil.copyfile(os.path.join(EXAMPLE_DIR, 'postman_collection.json'), self.collection_file)
+        self.output_dir = os.path.join(self.temp_dir, 'docs')
+        self.generator = DocumentGenerator(GeneratorOptions(publish=True, incremental=True, hashed_assets=True,
+                                                            precompress=['gzip']))
+        self.generator.generate_doc(self.collection_file, None, self.output_dir)
+        self.server = DocumentServer(self.output_dir, ('127.0.0.1', 0), log_requests=False)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.temp_dir)
+
+    def request(self, path, method='GET', **headers) -> tuple:
+        connection = http.client.HTTPConnection(*self.server.server_address[:2])
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+
+    def read(self, file_name=OUTPUT_FILE_NAME) -> bytes:
+        with open(os.path.join(self.output_dir, file_name), 'rb') as f:
+            return f.read()
+
+    def test_byte_range(self):
+        self.assertEqual((0, 9), byte_range('bytes=0-9', 100))
+        self.assertEqual((90, 99), byte_range('bytes=90-', 100))
+        self.assertEqual((95, 99), byte_range('bytes=-5', 100))
+        self.assertEqual((0, 99), byte_range('bytes=-500', 100))
+        self.assertEqual((10, 99), byte_range('bytes=10-500', 100))
+        self.assertIsNone(byte_range('bytes=0-1,5-6', 100))
+        self.assertIsNone(byte_range('items=0-1', 100))
+        for header in ['bytes=100-', 'bytes=-0', 'bytes=5-4']:
+            with self.assertRaises(ValueError):
+                byte_range(header, 100)
+
+    def test_accepted_encodings(self):
+        self.assertEqual({'gzip', 'deflate'}, accepted_encodings('gzip, deflate, br;q=0'))
+        self.assertEqual({'br'}, accepted_encodings('br;q=0.5'))
+        self.assertEqual(set(), accepted_encodings(None))
+
+    def test_etag(self):
+        response, body = self.request('/')
+        self.assertEqual(200, response.status)
+        self.assertEqual(self.read(), body)
+        self.assertEqual(REVALIDATE_CACHE_CONTROL, response.getheader('Cache-Control'))
+        etag = response.getheader('ETag')
+        self.assertTrue(etag.startswith('"'))
+
+        response, body = self.request('/index.html', **{'If-None-Match': etag})
+        self.assertEqual(304, response.status)
+        self.assertEqual(b'', body)
+        response, _ = self.request('/index.html', 'HEAD', **{'If-None-Match': '"other"'})
+        self.assertEqual(200, response.status)
+
+    def test_precompressed(self):
+        response, body = self.request('/', **{'Accept-Encoding': 'gzip, br;q=0'})
+        self.assertEqual('gzip', response.getheader('Content-Encoding'))
+        self.assertEqual('Accept-Encoding', response.getheader('Vary'))
+        self.assertEqual(self.read(), gzip.decompress(body))
+        _, identity = self.request('/')
+        self.assertNotEqual(self.request('/')[0].getheader('ETag'), response.getheader('ETag'))
+        self.assertEqual(self.read(), identity)
+
+    def test_stale_copies(self):
+        # a file replaced after its copies were written is sent as it is
+        tmp_file = os.path.join(self.output_dir, OUTPUT_FILE_NAME + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(b'<html>changed</html>')
+        os.replace(tmp_file, os.path.join(self.output_dir, OUTPUT_FILE_NAME))
+        response, body = self.request('/', **{'Accept-Encoding': 'gzip'})
+        self.assertIsNone(response.getheader('Content-Encoding'))
+        self.assertEqual(b'<html>changed</html>', body)
+
+        # a copy that is not in the record is not sent
+        self.generator.options.precompress = None
+        self.generator.generate_doc(self.collection_file, None, self.output_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, OUTPUT_FILE_NAME + '.gz')))
+        with open(os.path.join(self.output_dir, OUTPUT_FILE_NAME + '.gz'), 'wb') as f:
+            f.write(gzip.compress(b'stale'))
+        response, body = self.request('/', **{'Accept-Encoding': 'gzip'})
+        self.assertIsNone(response.getheader('Content-Encoding'))
+        self.assertIsNone(response.getheader('Vary'))
+        self.assertEqual(self.read(), body)
+
+    def test_range(self):
+        page = self.read()
+        response, body = self.request('/', Range='bytes=10-19', **{'Accept-Encoding': 'gzip'})
+        self.assertEqual(206, response.status)
+        self.assertIsNone(response.getheader('Content-Encoding'))
+        self.assertEqual('bytes 10-19/' + str(len(page)), response.getheader('Content-Range'))
+        self.assertEqual(page[10:20], body)
+
+        response, _ = self.request('/', Range='bytes=' + str(len(page)) + '-')
+        self.assertEqual(416, response.status)
+        # the range is not applied to another version of the file
+        response, body = self.request('/', Range='bytes=10-19', **{'If-Range': '"other"'})
+        self.assertEqual(200, response.status)
+        self.assertEqual(page, body)
+
+    def test_paths(self):
+        page = self.read().decode('utf-8')
+        css = re.search(r'href="(css/main\.[0-9a-f]+\.min\.css)"', page).group(1)
+        response, _ = self.request('/' + css)
+        self.assertEqual(200, response.status)
+        self.assertEqual(IMMUTABLE_CACHE_CONTROL, response.getheader('Cache-Control'))
+        self.assertEqual('text/css; charset=utf-8', response.getheader('Content-Type'))
+
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, BUILD_MANIFEST_FILE_NAME)))
+        for path in ['/' + BUILD_MANIFEST_FILE_NAME, '/missing.html', '/../collection.json', '/%2e%2e/collection.json']:
+            self.assertEqual(404, self.request(path)[0].status, path)
+
+        os.makedirs(os.path.join(self.temp_dir, 'root', 'docs'))
+        self.server.root = os.path.join(self.temp_dir, 'root')
+        shutil.copyfile(os.path.join(self.output_dir, OUTPUT_FILE_NAME),
+                        os.path.join(self.temp_dir, 'root', 'docs', OUTPUT_FILE_NAME))
+        response, _ = self.request('/docs')
+        self.assertEqual(301, response.status)
+        self.assertEqual('/docs/', response.getheader('Location'))
+        self.assertEqual(200, self.request('/docs/')[0].status)
+
+    def test_watcher(self):
+        watcher = SourceWatcher(self.generator, self.collection_file, None, self.output_dir)
+        self.assertFalse(watcher.check())
+
+        with open(self.collection_file, 'r', encoding='utf-8') as f:
+            collection = f.read()
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            f.write(collection.replace('Sample Create API', 'Renamed Create API'))
+        os.utime(self.collection_file, ns=(0, 0))
+        self.assertTrue(watcher.check())
+        self.assertIn(b'Renamed Create API', self.request('/')[1])
+        self.assertEqual(2, self.generator.manifest.reused)
+
+        # a collection saved halfway is not published
+        with open(self.collection_file, 'w', encoding='utf-8') as f:
+            f.write(collection[:100])
+        self.assertFalse(watcher.check())
+        self.assertIsNotNone(watcher.error)
+        self.assertIn(b'Renamed Create API', self.request('/')[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
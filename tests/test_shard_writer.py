@@ -0,0 +1,98 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, SHARDS_DIR, SHARD_ENDPOINT, SHARD_FOLDER, SHARD_SIZE
+from document_generator import DocumentGenerator
+from models import APIModel, GeneratorOptions
+from shard_writer import ShardWriter
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+
+
+class ShardWriterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+        self.env_file = os.path.join(EXAMPLE_DIR, 'postman_environment.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, self.env_file,
+                                            os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return output_dir, f.read()
+
+    @staticmethod
+    def read_shards(output_dir, html):
+        placeholders = re.findall(r'data-shard-file="([^"]+)" data-first-api="(\d+)"', html)
+        shards = []
+        for file_name, first_id in placeholders:
+            with open(os.path.join(output_dir, file_name), 'r', encoding='utf-8') as f:
+                shards.append((int(first_id), f.read()))
+        return shards
+
+    @staticmethod
+    def section_ids(html):
+        return [int(api_id) for api_id in re.findall(r'class="api-information" id="(\d+)"', html)]
+
+    def assert_complete(self, output_dir, html):
+        _, full_html = self.generate('full')
+        expected_ids = self.section_ids(full_html)
+
+        shards = self.read_shards(output_dir, html)
+        self.assertEqual([], self.section_ids(html))
+        self.assertEqual(len(shards), len(os.listdir(os.path.join(output_dir, SHARDS_DIR))))
+        shard_ids = []
+        for first_id, shard_html in shards:
+            ids = self.section_ids(shard_html)
+            self.assertEqual(first_id, ids[0])
+            shard_ids.extend(ids)
+        self.assertEqual(expected_ids, shard_ids)
+        return shards
+
+    def test_shard_per_endpoint(self):
+        output_dir, html = self.generate('out', shard_mode=SHARD_ENDPOINT)
+        shards = self.assert_complete(output_dir, html)
+        for _, shard_html in shards:
+            self.assertEqual(1, len(self.section_ids(shard_html)))
+
+    def test_shard_per_folder(self):
+        output_dir, html = self.generate('out', shard_mode=SHARD_FOLDER)
+        shards = self.assert_complete(output_dir, html)
+        _, endpoint_html = self.generate('endpoint', shard_mode=SHARD_ENDPOINT)
+        self.assertLess(len(shards), len(self.read_shards(os.path.join(self.temp_dir, 'endpoint'), endpoint_html)))
+
+    def test_shard_by_size(self):
+        output_dir, html = self.generate('out', shard_mode=SHARD_SIZE, shard_size=1)
+        shards = self.assert_complete(output_dir, html)
+        self.assertGreater(len(shards), 1)
+
+    def test_size_in_bytes(self):
+        # 400 characters, 800 bytes in utf-8: two of them do not fit in a shard of 1 KB
+        apis = []
+        for api_id in range(1, 4):
+            api = APIModel()
+            api.id = api_id
+            api.fragment = '\u00e9' * 400
+            apis.append(api)
+        shards = ShardWriter(self.temp_dir, None, SHARD_SIZE, 1).write(apis)
+        self.assertEqual(3, len(shards))
+        for file_name in os.listdir(os.path.join(self.temp_dir, SHARDS_DIR)):
+            self.assertLessEqual(os.path.getsize(os.path.join(self.temp_dir, SHARDS_DIR, file_name)), 1024)
+
+    def test_previous_shards_are_removed(self):
+        self.generate('out', shard_mode=SHARD_ENDPOINT)
+        output_dir, html = self.generate('out', shard_mode=SHARD_SIZE, shard_size=1024)
+        self.assertEqual(1, len(os.listdir(os.path.join(output_dir, SHARDS_DIR))))
+        self.assert_complete(output_dir, html)
+
+
+if __name__ == '__main__':
+    unittest.main()
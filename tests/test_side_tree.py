@@ -0,0 +1,63 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from constants import OUTPUT_FILE_NAME, SIDE_TREE_FILE_NAME, SIDE_TREE_CALLBACK, FOLDER_ICON
+from document_generator import DocumentGenerator
+from models import GeneratorOptions
+from side_tree import tree_json
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'example')
+INLINE_TREE = re.compile(SIDE_TREE_CALLBACK + r'\((.*)\);')
+
+
+class SideTreeTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection_file = os.path.join(EXAMPLE_DIR, 'postman_collection.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, output_name, **options):
+        generator = DocumentGenerator(GeneratorOptions(**options))
+        output_dir = generator.generate_doc(self.collection_file, None, os.path.join(self.temp_dir, output_name))
+        with open(os.path.join(output_dir, OUTPUT_FILE_NAME), 'r', encoding='utf-8') as f:
+            return output_dir, f.read()
+
+    def test_tree_json(self):
+        tree = [{'text': '</script><script>alert("x & y")</script>', 'href': '#1', 'method': 'GET'},
+                {'text': 'line\u2028separator', 'nodes': [], 'icon': FOLDER_ICON, 'selectable': False}]
+        text = tree_json(tree)
+        for unsafe in ['<', '>', '&', '\u2028']:
+            self.assertNotIn(unsafe, text)
+        self.assertEqual(tree, json.loads(text))
+
+    def test_inline_tree(self):
+        _, html = self.generate('inline')
+        tree = json.loads(INLINE_TREE.search(html).group(1))
+        self.assertEqual('Folder 1', tree[0]['text'])
+        self.assertEqual(False, tree[0]['selectable'])
+        self.assertEqual({'text': 'Sample Create API', 'href': '#1', 'method': 'POST'}, tree[0]['nodes'][0])
+        self.assertNotIn(SIDE_TREE_FILE_NAME, html)
+
+        # the folder names read after their items are in the tree
+        _, streamed_html = self.generate('streaming', streaming=True)
+        self.assertEqual(tree, json.loads(INLINE_TREE.search(streamed_html).group(1)))
+
+    def test_tree_file(self):
+        _, inline_html = self.generate('inline')
+        output_dir, html = self.generate('file', tree_file=True)
+        self.assertIsNone(INLINE_TREE.search(html))
+        self.assertIn('<script src="' + SIDE_TREE_FILE_NAME + '"></script>', html)
+        with open(os.path.join(output_dir, SIDE_TREE_FILE_NAME), 'r', encoding='utf-8') as f:
+            script = f.read()
+        self.assertEqual(INLINE_TREE.search(inline_html).group(0) + '\n', script)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'postman_doc_gen')
+
+# modules only needed to generate a document
+HEAVY_MODULES = ['document_generator', 'batch', 'precompressor', 'jinja2', 'bleach', 'markdown', 'pygments',
+                 'fastjsonschema', 'brotli', 'multiprocessing']
+
+
+class StartupTest(unittest.TestCase):
+
+    @staticmethod
+    def loaded_modules(*args) -> set:
+        """
+        Runs the command line in a new interpreter
+        :return: the names of the modules in sys.modules once it is done
+        """
+        code = 'import runpy, sys\n' \
+               'sys.argv = ["postman_doc_gen.py"] + sys.argv[1:]\n' \
+               'try:\n' \
+               '    runpy.run_path("postman_doc_gen.py", run_name="__main__")\n' \
+               'except SystemExit:\n' \
+               '    pass\n' \
+               'print("\\n".join(sorted(sys.modules)), file=sys.stderr)\n'
+        result = subprocess.run([sys.executable, '-c', code] + list(args), cwd=SOURCE_DIR, capture_output=True,
+                                text=True, check=True)
+        return set(result.stderr.split())
+
+    def test_version(self):
+        modules = self.loaded_modules('--version')
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+        # the models and constants are still needed to build the argument parser
+        self.assertIn('models', modules)
+
+    def test_help(self):
+        for args in [['--help'], ['batch', '--help'], ['serve', '--help']]:
+            modules = self.loaded_modules(*args)
+            for module in HEAVY_MODULES:
+                self.assertNotIn(module, modules, args)
+
+    def test_no_descriptions(self):
+        # a collection without descriptions does not load markdown, nor brotli without --precompress
+        code = 'import json, os, shutil, sys, tempfile\n' \
+               'from document_generator import DocumentGenerator\n' \
+               'from models import GeneratorOptions\n' \
+               'collection = {"info": {"name": "c", "schema": "s"}, "item": [{"name": "r", "request": ' \
+               '{"method": "GET", "url": {"raw": "http://host/path"}}}]}\n' \
+               'out = tempfile.mkdtemp()\n' \
+               'file_name = os.path.join(out, "c.json")\n' \
+               'json.dump(collection, open(file_name, "w"))\n' \
+               'DocumentGenerator(GeneratorOptions(validation_mode="skip")).generate_doc(file_name, None, out)\n' \
+               'shutil.rmtree(out)\n' \
+               'print("markdown" in sys.modules, "brotli" in sys.modules, "jinja2" in sys.modules)\n'
+        result = subprocess.run([sys.executable, '-c', code], cwd=SOURCE_DIR, capture_output=True, text=True,
+                                check=True)
+        self.assertEqual('False False True', result.stdout.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()